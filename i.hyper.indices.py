@@ -112,6 +112,32 @@ REFERENCES:   See individual index references in the source code.
 #% required: no
 #%end
 
+#%option
+#% key: engine
+#% type: string
+#% description: Engine used to calculate the indices
+#% options: mapcalc,numpy,cupy
+#% answer: mapcalc
+#% required: no
+#%end
+
+#%option
+#% key: precision
+#% type: string
+#% description: Floating-point precision of the numpy and cupy engine arithmetic
+#% options: fp32,fp16,bf16
+#% answer: fp32
+#% required: no
+#%end
+
+#%option
+#% key: n_jobs
+#% type: integer
+#% description: Number of threads of the numpy engine (0 for all CPUs)
+#% answer: 1
+#% required: no
+#%end
+
 #%flag
 #% key: l
 #% description: List available indices and themes
@@ -127,15 +153,170 @@ REFERENCES:   See individual index references in the source code.
 #% description: Normalize indices to 0-1 range where applicable
 #%end
 
+#%flag
+#% key: g
+#% description: Calculate on the GPU with CuPy (same as engine=cupy)
+#%end
+
 import sys
 import os
+import re
+import ast
 import ctypes
 import ctypes.util
 import atexit
+import bisect
+import string
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress
 import grass.script as gs
 from grass.exceptions import CalledModuleError
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import cupy
+    import cupyx
+except ImportError:
+    cupy = cupyx = None
+
+try:
+    import ml_dtypes
+except ImportError:
+    ml_dtypes = None
+
+# r.mapcalc float() cast, dropped when translating formulas to NumPy
+_MAPCALC_FLOAT_CAST = re.compile(r"\bfloat\(")
+
+# Formula shapes computed by a shared kernel instead of per-index code
+_KIND_PATTERNS = (
+    ('ndi', re.compile(r"(?:float)?\(\{(\w+)\} - \{(\w+)\}\) / \(\{\1\} \+ \{\2\}\)")),
+    ('ratio', re.compile(r"\(?\{(\w+)\} / \{(\w+)\}\)?")),
+)
+_SHARED_TEMPLATES = {
+    'ndi': "({A} - {B}) / ({A} + {B})",
+    'ratio': "{A} / {B}",
+}
+
+# Null value of CELL rasters as read by RasterRow
+_CELL_NULL = -2147483648
+
+# Numba fast-math flags: fastmath=True without nnan, ninf and reassoc,
+# which (reassoc with nsz) let LLVM fold e.g. x - x to 0 and lose the
+# null (NaN) pixels
+_NUMBA_FASTMATH = {'nsz', 'arcp', 'contract', 'afn'}
+
+# Smallest batch of indices compiled into one fused Numba kernel when
+# numexpr is not installed; fewer run as per-index kernels
+_FUSED_MIN_INDICES = 3
+
+# Working-set budget of one NumPy engine tile, sized for a shared L3 cache
+_TILE_CACHE_BYTES = 8 * 1024 * 1024
+
+# Working-set budget of one tile on the GPU (engine=cupy), large enough to
+# amortize the host/device transfers
+_TILE_GPU_BYTES = 256 * 1024 * 1024
+
+# Arithmetic operators of a translated expression (** before * and -)
+_PYTHON_OPERATOR = re.compile(r"\*\*|[-+*/]")
+
+
+def _formula_kind(formula_template):
+    """Return (kind, operands) of a formula template, see SpectralIndex."""
+    for kind, pattern in _KIND_PATTERNS:
+        match = pattern.fullmatch(formula_template)
+        if match:
+            return kind, match.groups()
+    return 'expr', None
+
+
+def _expand_powers(formula_template):
+    """
+    Rewrite small integer powers of a template as repeated products.
+
+    r.mapcalc evaluates x^2 through pow(); {X}^2 becomes
+    (float({X}) * {X}) and (...)^3 becomes (float(...) * (...) * (...)),
+    keeping any function name in front of the parenthesis with its operand.
+    The float() cast keeps integer bands from overflowing. Other exponents,
+    powers written with spaces around ^ and chained powers such as
+    {X}^2^3 (right-associative in r.mapcalc) are left as they are.
+    """
+    parts = formula_template.split("^")
+    expanded = parts[0]
+    for i, part in enumerate(parts[1:], 1):
+        exponent = part[:1]
+        if (exponent not in ("2", "3") or part[1:2].isalnum()
+                or part[1:2] == "." or (part == exponent and i < len(parts) - 1)):
+            expanded += "^" + part
+            continue
+        if expanded.endswith("}"):
+            start = expanded.rindex("{")
+        elif expanded.endswith(")"):
+            depth = 0
+            for start in range(len(expanded) - 1, -1, -1):
+                depth += {")": 1, "(": -1}.get(expanded[start], 0)
+                if depth == 0:
+                    break
+            while start and (expanded[start - 1].isalnum()
+                             or expanded[start - 1] == "_"):
+                start -= 1
+        else:
+            expanded += "^" + part
+            continue
+        operand = expanded[start:]
+        factors = [operand] * int(exponent)
+        factors[0] = f"float({operand})"
+        expanded = expanded[:start] + "(" + " * ".join(factors) + ")" + part[1:]
+    return expanded
+
+
+def _to_python(expression):
+    """Translate an r.mapcalc expression to Python syntax."""
+    return _MAPCALC_FLOAT_CAST.sub("(", expression).replace("^", "**")
+
+
+@lru_cache(maxsize=None)
+def _wavelength_order(wavelengths):
+    """Return (sorted wavelengths, wavelength -> first input position)."""
+    first = {}
+    for position, wl in enumerate(wavelengths):
+        first.setdefault(wl, position)
+    return tuple(sorted(first)), first
+
+
+@lru_cache(maxsize=None)
+def _find_closest_band(wavelengths, min_wl, max_wl):
+    """
+    Return the available wavelength closest to the centre of a range.
+
+    wavelengths is a tuple in input order: the nearest neighbour is found
+    by bisection in its sorted copy, and the hashable arguments let the
+    result be memoized across all indices that share a band requirement
+    (RED, NIR, ...). Of two wavelengths equally far from the centre, the
+    one listed first wins.
+    """
+    ordered, first = _wavelength_order(wavelengths)
+    center = (min_wl + max_wl) / 2
+    pos = bisect.bisect_left(ordered, center)
+    neighbours = ordered[max(pos - 1, 0):pos + 1]
+    return min(neighbours, key=lambda wl: (abs(wl - center), first[wl]))
+
 
 class SpectralIndex:
     """
@@ -144,25 +325,34 @@ class SpectralIndex:
     Attributes:
         name (str): Short name/acronym of the index
         description (str): Full descriptive name
-        formula (callable): Lambda function that generates r.mapcalc expression
+        formula_template (str): r.mapcalc expression with {BAND} placeholders
         bands_required (dict): Dictionary of required bands with wavelength ranges
         reference (str): Citation/reference for the index
         theme (str): Thematic category (vegetation, water, soil, etc.)
         normalize_range (tuple): Optional (min, max) values for normalization
+        kind (str): Formula shape: 'ndi' for (A - B) / (A + B), 'ratio' for
+            A / B, 'expr' for anything else
+        operands (tuple): (A, B) band names for 'ndi' and 'ratio', else None
+        template_parts (tuple): formula_template split into alternating
+            literal text and band names, starting with a literal
     
     Examples:
         >>> ndvi = SpectralIndex(
         ...     name='NDVI',
         ...     description='Normalized Difference Vegetation Index',
-        ...     formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']})",
+        ...     formula_template="({NIR} - {RED}) / ({NIR} + {RED})",
         ...     bands_required={'RED': (620, 690), 'NIR': (760, 900)},
         ...     reference='Rouse et al. 1974',
         ...     theme='vegetation',
         ...     normalize_range=(-1, 1)
         ... )
     """
+
+    __slots__ = ('name', 'description', 'formula_template', 'template_parts',
+                 'bands_required', 'reference', 'theme', 'normalize_range',
+                 'kind', 'operands')
     
-    def __init__(self, name, description, formula, bands_required, 
+    def __init__(self, name, description, formula_template, bands_required, 
                  reference="", theme="general", normalize_range=None):
         """
         Initialize a spectral index definition.
@@ -170,7 +360,9 @@ class SpectralIndex:
         Args:
             name: Index acronym/short name
             description: Full descriptive name
-            formula: Lambda function taking band mapping dict, returns r.mapcalc expression
+            formula_template: r.mapcalc expression with {BAND} placeholders for
+                each key of bands_required; ^2 and ^3 are expanded into
+                products
             bands_required: Dict of band_name: (min_wavelength, max_wavelength) tuples
             reference: Scientific reference/citation
             theme: Thematic category for organization
@@ -178,11 +370,138 @@ class SpectralIndex:
         """
         self.name = name
         self.description = description
-        self.formula = formula
+        if "^" in formula_template:
+            formula_template = _expand_powers(formula_template)
+        self.formula_template = formula_template
+        parts = []
+        for literal, field, _spec, _conversion in string.Formatter().parse(
+                formula_template):
+            parts.append(literal)
+            if field is not None:
+                parts.append(field)
+        self.template_parts = tuple(parts)
         self.bands_required = bands_required
         self.reference = reference
         self.theme = theme
         self.normalize_range = normalize_range
+        self.kind, self.operands = _formula_kind(formula_template)
+
+    def formula(self, band_map, normalize=False):
+        """
+        Render the r.mapcalc expression for a band mapping.
+
+        Args:
+            band_map: Dict of band_name: raster name, as returned by
+                HyperspectralIndices.get_band_mapping()
+            normalize: Scale the result from normalize_range to 0-1 in the
+                expression itself (no effect without a normalize_range)
+
+        Returns:
+            str: r.mapcalc expression for this index
+
+        Examples:
+            >>> ndvi.formula({'RED': 'band3', 'NIR': 'band4'})
+            '(band4 - band3) / (band4 + band3)'
+            >>> ndvi.formula({'RED': 'band3', 'NIR': 'band4'}, normalize=True)
+            '(((band4 - band3) / (band4 + band3)) - (-1)) / 2.0'
+        """
+        parts = list(self.template_parts)
+        parts[1::2] = [band_map[band] for band in parts[1::2]]
+        expression = "".join(parts)
+        if normalize and self.normalize_range:
+            min_val, max_val = self.normalize_range
+            expression = f"(({expression}) - ({min_val})) / {float(max_val - min_val)}"
+        return expression
+
+    def python_expression(self, band_map):
+        """
+        Render the formula as a Python expression for NumPy evaluation.
+
+        r.mapcalc syntax is translated where it differs from Python: the
+        float() cast is dropped (bands are loaded as floating point) and
+        ``^`` becomes ``**``. sqrt(), log() and abs() are left as calls for
+        the caller to bind to their NumPy equivalents.
+
+        Args:
+            band_map: Dict of band_name: identifier bound to a band array
+
+        Returns:
+            str: Python expression for this index
+
+        Examples:
+            >>> bi.python_expression({'RED': 'red', 'GREEN': 'green'})
+            'sqrt((((red) * red) + ((green) * green)) / 2)'
+        """
+        return _to_python(self.formula(band_map))
+
+    @property
+    def sensitive(self):
+        """
+        True if the formula needs at least float32 intermediates.
+
+        log() and sqrt() amplify the rounding error of half-precision
+        inputs, so such indices are never computed in float16 or bfloat16.
+        """
+        return 'log(' in self.formula_template or 'sqrt(' in self.formula_template
+
+
+@lru_cache(maxsize=None)
+def _python_kernel(formula_template):
+    """
+    Compile a formula template into a callable kernel(bands, out=None).
+
+    bands is a dict of band name -> array, all of one shape (e.g.
+    {'NIR': nir, 'RED': red}). The index is written into out, a
+    preallocated array of that shape that can be reused across indices,
+    or into a new array, and returned. With Numba the formula runs as one
+    fused parallel loop without temporaries (see _numba_kernel()) that
+    writes a contiguous float32 out in place and any other out through a
+    temporary; otherwise it is evaluated with NumPy.
+    """
+    if numba is not None:
+        def kernel(b, out=None):
+            dtype = np.result_type(*b.values())
+            dtype = 'float32' if dtype == np.float32 else 'float64'
+            names, jitted = _numba_kernel(formula_template, dtype)
+            if out is None:
+                out = np.empty(np.shape(b[names[0]]), dtype=np.float32)
+            target = out
+            if out.dtype != np.float32 or not out.flags.c_contiguous:
+                target = np.empty(out.shape, dtype=np.float32)
+            jitted(*[np.ascontiguousarray(b[name], dtype=dtype).reshape(-1)
+                     for name in names],
+                   target.reshape(-1))
+            if target is not out:
+                out[...] = target
+            return out
+        return kernel
+
+    bands = {field for _, field, _, _ in
+             string.Formatter().parse(formula_template) if field}
+    expression = _to_python(
+        formula_template.format_map({band: f"b[{band!r}]" for band in bands}))
+    evaluate = eval(f"lambda b: {expression}",
+                    {'sqrt': np.sqrt, 'log': np.log, 'abs': np.abs})
+
+    def kernel(b, out=None):
+        if out is None:
+            return evaluate(b)
+        out[...] = evaluate(b)
+        return out
+    return kernel
+
+
+class _KernelTable(dict):
+    """Index name -> NumPy callable, compiled on first access."""
+
+    def __init__(self, indices_db):
+        super().__init__()
+        self._indices_db = indices_db
+
+    def __missing__(self, index_name):
+        kernel = _python_kernel(self._indices_db[index_name].formula_template)
+        self[index_name] = kernel
+        return kernel
 
 
 class HyperspectralIndices:
@@ -195,6 +514,10 @@ class HyperspectralIndices:
     
     Attributes:
         indices_db (dict): Database of all available indices
+        kernels (dict): Index name -> callable kernel(bands, out=None)
+            computing the index from a dict of band name -> array, compiled
+            from the formula template on first access (with Numba when
+            installed)
     
     Themes:
         - vegetation: General vegetation indices (NDVI, EVI, SAVI, etc.)
@@ -211,12 +534,180 @@ class HyperspectralIndices:
         >>> indices = HyperspectralIndices()
         >>> themes = indices.get_themes()
         >>> veg_indices = indices.list_indices(theme='vegetation')
+        >>> ndvi = indices.kernels['NDVI']({'NIR': nir, 'RED': red})
     """
     
-    def __init__(self):
-        """Initialize the indices database."""
+    # Index names defined by each _init_<theme>() method, in loading order
+    _THEME_INDICES = {
+        'vegetation': (
+            'NDVI', 'EVI', 'SAVI', 'MSAVI', 'GNDVI', 'NDRE', 'CIrededge',
+            'MTCI', 'MCARI', 'REIP', 'ARVI', 'VARI', 'DVI', 'TVI', 'GRASSLAND',
+            'FOREST', 'CROP', 'WETLAND', 'SHRUBLAND', 'MANGROVE', 'TUNDRA',
+            'SAVANNA', 'ALPINE', 'DESERT_VEGETATION', 'RAINFOREST',
+            'CONIFEROUS', 'DECIDUOUS', 'C4_GRASS', 'C3_VEGETATION', 'WHEAT',
+            'CORN', 'SOYBEAN', 'RICE', 'COTTON_CROP', 'SUGARCANE', 'OAK',
+            'PINE', 'MAPLE', 'EUCALYPTUS', 'PALM', 'GRAPEVINE', 'CITRUS',
+            'OLIVE', 'COFFEE', 'COCOA', 'TEA', 'IRRIGATED_CROP',
+            'WATER_STRESSED_CROP', 'RAINFED_CROP', 'DROUGHT_STRESS',
+            'YIELD_PREDICTION', 'RAINFED_YIELD', 'DRYLAND_YIELD',
+            'PRECIPITATION_EFFECTIVENESS', 'CROP_WATER_STRESS',
+            'RAINFED_BIOMASS', 'CLIMATE_YIELD', 'RAINFED_PRODUCTIVITY',
+            'WATER_LIMITED_YIELD', 'DROUGHT_VULNERABILITY',
+            'RAINFED_PHENOLOGY',
+        ),
+        'pigments': (
+            'ARI1', 'ARI2', 'CRI550', 'CRI700', 'CARI', 'MCARIOSAVI',
+            'GITELSON', 'GITELSON2', 'MCARI1', 'MCARI2', 'RDVI', 'MARI',
+            'VREI1', 'VREI2', 'DD',
+        ),
+        'metabolism': (
+            'WI', 'NDWI1240', 'NDWI2130', 'LWCI', 'NDII', 'SRWI', 'DATT',
+            'CARTER1', 'CARTER2', 'GMI', 'NPQI', 'NPCI', 'RGRI',
+        ),
+        'biochemical': (
+            'CAI', 'NDLI', 'PRI', 'SIPI', 'PSRI',
+        ),
+        'water': (
+            'NDWI', 'MNDWI', 'NDMI', 'ALGAE_BLOOM', 'CYANOBACTERIA',
+            'CHLOROPHYLL_A', 'EUTROPHICATION', 'TURBIDITY', 'SEDIMENTATION',
+            'SUSPENDED_SOLIDS', 'RIVER_BANK', 'SEASHORE', 'SHALLOW_WATER',
+            'CORAL_REEF', 'SEAGRASS', 'MANGROVE_WATER', 'WATER_CLARITY',
+            'COLORED_DISSOLVED_ORGANIC', 'FLOATING_VEGETATION',
+            'IRRIGATION_CANAL', 'PIVOT_IRRIGATION', 'DRIP_IRRIGATION',
+            'FLOOD_IRRIGATION', 'IRRIGATION_POND', 'SPRINKLER_SYSTEM',
+            'IRRIGATION_INFRASTRUCTURE', 'WELL_IRRIGATION',
+            'RIVER_LIFT_IRRIGATION', 'IRRIGATION_TIMING',
+            'IRRIGATION_EFFICIENCY',
+        ),
+        'soil': (
+            'BI', 'CI', 'RI', 'IRON_OXIDE', 'SOIL_MOISTURE', 'ORGANIC_SOIL',
+            'SALINITY', 'CRUST', 'CLAY_SWELL', 'MOISTURE_CONTENT',
+            'BEARING_CAPACITY', 'PLASTICITY_INDEX', 'SHEAR_STRENGTH',
+            'SMECTITE_RATIO', 'SOIL_MOISTURE_DEFICIT',
+        ),
+        'urban': (
+            'NDBI', 'UI', 'PHOTOVOLTAIC', 'SOLAR_FARM', 'EMERGENCY_TENT',
+            'REFUGEE_CAMP', 'TEMPORARY_SHELTER', 'DISASTER_RELIEF',
+            'MEDICAL_TENT', 'CONSTRUCTION_SITE', 'TEMPORARY_ROAD',
+            'WIND_TURBINE', 'COMMUNICATION_TOWER', 'PORTABLE_GENERATOR',
+            'WATER_TANK', 'FOOD_DISTRIBUTION',
+        ),
+        'stress': (
+            'MSI', 'NDNI', 'TCARI',
+        ),
+        'materials': (
+            'HI', 'THI', 'OHI', 'TPI', 'COAL', 'PLASTIC', 'PDI', 'FPI',
+            'RSWIR', 'NDPI', 'MPDI', 'FERRIC', 'FERROUS', 'LATERITE', 'GOSSAN',
+            'SINDEX', 'PAINT', 'ASPHALT', 'CONCRETE', 'CLAY', 'CARBONATE',
+            'SULFIDE', 'QUARTZ', 'MICA', 'GYPSUM', 'VEHICLE_PAINT',
+            'MILITARY_CAMOUFLAGE', 'MARINE_PAINT', 'INDUSTRIAL_COATING',
+            'ROAD_PAINT', 'BUILDING_PAINT', 'REFLECTIVE_PAINT',
+            'ANTI_FOULING_PAINT', 'THERMAL_PAINT', 'FLUORESCENT_PAINT',
+            'METALLIC_PAINT', 'AEROSOL_PAINT', 'WATERPROOF_PAINT',
+            'CORROSION_PROTECTIVE_PAINT',
+        ),
+        'atmospheric': (
+            'AEROSOL_OPTICAL', 'OZONE', 'WATER_VAPOR', 'NO2', 'SO2', 'CO',
+            'CH4', 'DUST', 'SMOKE', 'HAZE', 'VOLCANIC_ASH', 'AIR_QUALITY',
+            'INDUSTRIAL_PLUME',
+        ),
+        'textiles': (
+            'COTTON', 'POLYESTER', 'NYLON', 'ARAMID', 'LINEN', 'WOOL',
+            'POLYPROPYLENE', 'ACRYLIC', 'SPANDEX', 'MICROPLASTIC',
+            'TEXTILE_BLEND', 'NATURAL_VS_SYNTHETIC',
+        ),
+    }
+
+    def __init__(self, themes=None):
+        """
+        Initialize the indices database.
+
+        Args:
+            themes: Optional iterable of theme names to load; all themes
+                are loaded when None. More can be added with load_themes().
+        """
         self.indices_db = {}
-        self._initialize_indices()
+        self.kernels = _KernelTable(self.indices_db)
+        self._wl_source = self._wl_sorted = None
+        self._loaded_themes = set()
+        self._names = None
+        if themes is None:
+            self._initialize_indices()
+        else:
+            self.load_themes(themes)
+
+    @classmethod
+    def themes_for(cls, index_names):
+        """
+        Return the themes defining the given indices.
+
+        Returns None when a name is not found in any theme, meaning that
+        every theme has to be loaded to look it up.
+        """
+        themes = set()
+        for index_name in index_names:
+            for theme, names in cls._THEME_INDICES.items():
+                if index_name in names:
+                    themes.add(theme)
+                    break
+            else:
+                return None
+        return themes
+
+    def load_themes(self, themes):
+        """
+        Add the indices of the given themes to the database.
+
+        Each theme is built by its _init_<theme>() method at most once and
+        the column-wise views are rebuilt afterwards.
+
+        Args:
+            themes: Iterable of theme names (unknown names are ignored)
+        """
+        missing = [theme for theme in self._THEME_INDICES
+                   if theme in themes and theme not in self._loaded_themes]
+        for theme in missing:
+            getattr(self, '_init_' + theme)()
+            self._loaded_themes.add(theme)
+        if missing or self._names is None:
+            self._build_columns()
+    
+    def _build_columns(self):
+        """
+        Build column-wise views of the database for bulk queries.
+
+        Index names are kept sorted in one list, and the indices of each
+        theme are grouped by name order in _by_theme, so filtering by theme
+        is a single dictionary lookup.
+        """
+        self._names = sorted(self.indices_db)
+        self._by_theme = {}
+        for name in self._names:
+            index = self.indices_db[name]
+            self._by_theme.setdefault(index.theme, []).append(index)
+        self._theme_names = sorted(self._by_theme)
+
+        # Band requirements as a (n_indices, max_bands, 2) array of
+        # inclusive wavelength bounds, padded and masked per row
+        self._req_tags = [list(self.indices_db[name].bands_required)
+                          for name in self._names]
+        if np is None:
+            self._req_ranges = self._req_mask = None
+            return
+        max_bands = max((len(tags) for tags in self._req_tags), default=0)
+        self._req_ranges = np.zeros((len(self._names), max_bands, 2))
+        self._req_mask = np.zeros((len(self._names), max_bands), dtype=bool)
+        for row, name in enumerate(self._names):
+            required = self.indices_db[name].bands_required
+            for col, wavelength_range in enumerate(required.values()):
+                if isinstance(wavelength_range, tuple):
+                    bounds = wavelength_range
+                else:
+                    # Strict 50 nm tolerance, as in can_calculate_index()
+                    bounds = (np.nextafter(wavelength_range - 50, wavelength_range),
+                              np.nextafter(wavelength_range + 50, wavelength_range))
+                self._req_ranges[row, col] = bounds
+                self._req_mask[row, col] = True
     
     def _initialize_indices(self):
         """
@@ -224,7 +715,8 @@ class HyperspectralIndices:
         
         This method populates the indices database with all available spectral
         indices, organized by theme. Each index is defined with its formula,
-        required bands, and metadata.
+        required bands, and metadata. Each theme is defined by its own
+        _init_<theme>() method, see load_themes() to load only some of them.
         
         The database includes 86+ indices covering:
         - 15 vegetation indices
@@ -237,2076 +729,2077 @@ class HyperspectralIndices:
         - 4 stress indices
         - 24 material identification indices
         """
-        
-        # ====================================================================
+        self.load_themes(self._THEME_INDICES)
+
+    def _init_vegetation(self):
+        """Add the vegetation theme indices to the database."""
         # VEGETATION INDICES
         # General vegetation monitoring and biomass estimation
-        # ====================================================================
-        
         self.indices_db['NDVI'] = SpectralIndex(
             name='NDVI',
             description='Normalized Difference Vegetation Index',
-            formula=lambda b: f"float({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']})",
+            formula_template="float({NIR} - {RED}) / ({NIR} + {RED})",
             bands_required={'RED': (620, 690), 'NIR': (760, 900)},
             reference='Rouse et al. 1974',
             theme='vegetation',
             normalize_range=(-1, 1)
         )
-        
+
         self.indices_db['EVI'] = SpectralIndex(
             name='EVI',
             description='Enhanced Vegetation Index',
-            formula=lambda b: f"2.5 * ({b['NIR']} - {b['RED']}) / ({b['NIR']} + 6 * {b['RED']} - 7.5 * {b['BLUE']} + 1)",
+            formula_template="2.5 * ({NIR} - {RED}) / ({NIR} + 6 * {RED} - 7.5 * {BLUE} + 1)",
             bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900)},
             reference='Huete et al. 2002',
             theme='vegetation',
             normalize_range=(-1, 1)
         )
-        
+
         self.indices_db['SAVI'] = SpectralIndex(
             name='SAVI',
             description='Soil Adjusted Vegetation Index',
-            formula=lambda b: f"((1 + 0.5) * ({b['NIR']} - {b['RED']})) / ({b['NIR']} + {b['RED']} + 0.5)",
+            formula_template="((1 + 0.5) * ({NIR} - {RED})) / ({NIR} + {RED} + 0.5)",
             bands_required={'RED': (620, 690), 'NIR': (760, 900)},
             reference='Huete 1988',
             theme='vegetation',
             normalize_range=(-1, 1)
         )
-        
+
         self.indices_db['MSAVI'] = SpectralIndex(
             name='MSAVI',
             description='Modified Soil Adjusted Vegetation Index',
-            formula=lambda b: f"(2 * {b['NIR']} + 1 - sqrt((2 * {b['NIR']} + 1)^2 - 8 * ({b['NIR']} - {b['RED']}))) / 2",
+            formula_template="(2 * {NIR} + 1 - sqrt((2 * {NIR} + 1)^2 - 8 * ({NIR} - {RED}))) / 2",
             bands_required={'RED': (620, 690), 'NIR': (760, 900)},
             reference='Qi et al. 1994',
             theme='vegetation'
         )
-        
+
         self.indices_db['GNDVI'] = SpectralIndex(
             name='GNDVI',
             description='Green Normalized Difference Vegetation Index',
-            formula=lambda b: f"float({b['NIR']} - {b['GREEN']}) / ({b['NIR']} + {b['GREEN']})",
+            formula_template="float({NIR} - {GREEN}) / ({NIR} + {GREEN})",
             bands_required={'GREEN': (520, 600), 'NIR': (760, 900)},
             reference='Gitelson et al. 1996',
             theme='vegetation',
             normalize_range=(-1, 1)
         )
-        
+
         self.indices_db['NDRE'] = SpectralIndex(
             name='NDRE',
             description='Normalized Difference Red Edge',
-            formula=lambda b: f"float({b['NIR']} - {b['REDEDGE']}) / ({b['NIR']} + {b['REDEDGE']})",
+            formula_template="float({NIR} - {REDEDGE}) / ({NIR} + {REDEDGE})",
             bands_required={'REDEDGE': (690, 730), 'NIR': (760, 900)},
             reference='Gitelson and Merzlyak 1994',
             theme='vegetation',
             normalize_range=(-1, 1)
         )
-        
+
         self.indices_db['CIrededge'] = SpectralIndex(
             name='CIrededge',
             description='Chlorophyll Index Red Edge',
-            formula=lambda b: f"({b['NIR']} / {b['REDEDGE']}) - 1",
+            formula_template="({NIR} / {REDEDGE}) - 1",
             bands_required={'REDEDGE': (690, 730), 'NIR': (760, 900)},
             reference='Gitelson et al. 2003',
             theme='vegetation'
         )
-        
+
         self.indices_db['MTCI'] = SpectralIndex(
             name='MTCI',
             description='MERIS Terrestrial Chlorophyll Index',
-            formula=lambda b: f"({b['NIR']} - {b['REDEDGE']}) / ({b['REDEDGE']} - {b['RED']})",
+            formula_template="({NIR} - {REDEDGE}) / ({REDEDGE} - {RED})",
             bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
             reference='Dash and Curran 2004',
             theme='vegetation'
         )
-        
+
         self.indices_db['MCARI'] = SpectralIndex(
             name='MCARI',
             description='Modified Chlorophyll Absorption Ratio Index',
-            formula=lambda b: f"(({b['REDEDGE']} - {b['RED']}) - 0.2 * ({b['REDEDGE']} - {b['GREEN']})) * ({b['REDEDGE']} / {b['RED']})",
+            formula_template="(({REDEDGE} - {RED}) - 0.2 * ({REDEDGE} - {GREEN})) * ({REDEDGE} / {RED})",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
             reference='Daughtry et al. 2000',
             theme='vegetation'
         )
-        
+
         self.indices_db['REIP'] = SpectralIndex(
             name='REIP',
             description='Red Edge Inflection Point',
-            formula=lambda b: f"700 + 40 * ((({b['RED']} + {b['NIR']}) / 2) - {b['RE1']}) / ({b['RE2']} - {b['RE1']})",
+            formula_template="700 + 40 * ((({RED} + {NIR}) / 2) - {RE1}) / ({RE2} - {RE1})",
             bands_required={'RED': (620, 690), 'RE1': (697, 712), 'RE2': (732, 748), 'NIR': (760, 900)},
             reference='Guyot et al. 1988',
             theme='vegetation'
         )
-        
+
         self.indices_db['ARVI'] = SpectralIndex(
             name='ARVI',
             description='Atmospherically Resistant Vegetation Index',
-            formula=lambda b: f"({b['NIR']} - (2 * {b['RED']} - {b['BLUE']})) / ({b['NIR']} + (2 * {b['RED']} - {b['BLUE']}))",
+            formula_template="({NIR} - (2 * {RED} - {BLUE})) / ({NIR} + (2 * {RED} - {BLUE}))",
             bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900)},
             reference='Kaufman and Tanre 1992',
             theme='vegetation'
         )
-        
+
         self.indices_db['VARI'] = SpectralIndex(
             name='VARI',
             description='Visible Atmospherically Resistant Index',
-            formula=lambda b: f"({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']} - {b['BLUE']})",
+            formula_template="({GREEN} - {RED}) / ({GREEN} + {RED} - {BLUE})",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690)},
             reference='Gitelson et al. 2002',
             theme='vegetation'
         )
-        
+
         self.indices_db['DVI'] = SpectralIndex(
             name='DVI',
             description='Difference Vegetation Index',
-            formula=lambda b: f"{b['NIR']} - {b['RED']}",
+            formula_template="{NIR} - {RED}",
             bands_required={'RED': (620, 690), 'NIR': (760, 900)},
             reference='Tucker 1979',
             theme='vegetation'
         )
-        
+
         self.indices_db['TVI'] = SpectralIndex(
             name='TVI',
             description='Triangular Vegetation Index',
-            formula=lambda b: f"0.5 * (120 * ({b['NIR']} - {b['GREEN']}) - 200 * ({b['RED']} - {b['GREEN']}))",
+            formula_template="0.5 * (120 * ({NIR} - {GREEN}) - 200 * ({RED} - {GREEN}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
             reference='Broge and Leblanc 2001',
             theme='vegetation'
         )
-        
-        # ====================================================================
-        # VEGETATION PIGMENT INDICES
-        # Specific plant pigments: chlorophyll, anthocyanin, carotenoid
-        # ====================================================================
-        
-        self.indices_db['ARI1'] = SpectralIndex(
-            name='ARI1',
-            description='Anthocyanin Reflectance Index 1',
-            formula=lambda b: f"(1 / {b['GREEN']}) - (1 / {b['REDEDGE']})",
-            bands_required={'GREEN': (520, 600), 'REDEDGE': (690, 730)},
-            reference='Gitelson et al. 2001',
-            theme='pigments'
-        )
-        
-        self.indices_db['ARI2'] = SpectralIndex(
-            name='ARI2',
-            description='Anthocyanin Reflectance Index 2',
-            formula=lambda b: f"{b['NIR']} * ((1 / {b['GREEN']}) - (1 / {b['REDEDGE']}))",
-            bands_required={'GREEN': (520, 600), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Gitelson et al. 2001',
-            theme='pigments'
+
+        # Specialized Vegetation Type Indices
+        self.indices_db['GRASSLAND'] = SpectralIndex(
+            name='GRASSLAND',
+            description='Grassland Vegetation Index (grass-dominated ecosystems)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Grassland monitoring - Guerschman et al. 2009',
+            theme='vegetation'
         )
-        
-        self.indices_db['CRI550'] = SpectralIndex(
-            name='CRI550',
-            description='Carotenoid Reflectance Index 550',
-            formula=lambda b: f"(1 / {b['B510']}) - (1 / {b['B550']})",
-            bands_required={'B510': (505, 515), 'B550': (545, 555)},
-            reference='Gitelson et al. 2002',
-            theme='pigments'
+
+        self.indices_db['FOREST'] = SpectralIndex(
+            name='FOREST',
+            description='Forest Canopy Index (dense woody vegetation)',
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * ({NIR} / {RED})",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Forest canopy analysis - Hansen et al. 2002',
+            theme='vegetation'
         )
-        
-        self.indices_db['CRI700'] = SpectralIndex(
-            name='CRI700',
-            description='Carotenoid Reflectance Index 700',
-            formula=lambda b: f"(1 / {b['B510']}) - (1 / {b['B700']})",
-            bands_required={'B510': (505, 515), 'B700': (695, 705)},
-            reference='Gitelson et al. 2002',
-            theme='pigments'
+
+        self.indices_db['CROP'] = SpectralIndex(
+            name='CROP',
+            description='Agricultural Crop Index (cropland vegetation)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.5 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Crop monitoring - Gitelson et al. 2002',
+            theme='vegetation'
         )
-        
-        self.indices_db['CARI'] = SpectralIndex(
-            name='CARI',
-            description='Chlorophyll Absorption Ratio Index',
-            formula=lambda b: f"({b['RE700']} / {b['RED']}) * abs((({b['B550']} - {b['RED']}) / {b['RE700']}) + {b['RED']} - {b['B550']})",
-            bands_required={'B550': (545, 555), 'RED': (620, 690), 'RE700': (695, 705)},
-            reference='Kim et al. 1994',
-            theme='pigments'
+
+        self.indices_db['WETLAND'] = SpectralIndex(
+            name='WETLAND',
+            description='Wetland Vegetation Index (water-saturated vegetation)',
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * ({GREEN} / {RED})",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Wetland vegetation detection - Adam et al. 2010',
+            theme='vegetation'
         )
-        
-        self.indices_db['MCARIOSAVI'] = SpectralIndex(
-            name='MCARIOSAVI',
-            description='MCARI/OSAVI ratio - Chlorophyll content',
-            formula=lambda b: f"((({b['RE700']} - {b['RED']}) - 0.2 * ({b['RE700']} - {b['GREEN']})) * ({b['RE700']} / {b['RED']})) / ((1.16 * ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']} + 0.16)))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'RE700': (695, 705), 'NIR': (760, 900)},
-            reference='Daughtry et al. 2000',
-            theme='pigments'
+
+        self.indices_db['SHRUBLAND'] = SpectralIndex(
+            name='SHRUBLAND',
+            description='Shrubland Vegetation Index (medium-height woody vegetation)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - abs({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Shrubland mapping - Jansen et al. 2006',
+            theme='vegetation'
         )
-        
-        self.indices_db['GITELSON'] = SpectralIndex(
-            name='GITELSON',
-            description='Gitelson Chlorophyll Index',
-            formula=lambda b: f"({b['NIR']} / {b['GREEN']}) - 1",
-            bands_required={'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Gitelson et al. 2003',
-            theme='pigments'
+
+        self.indices_db['MANGROVE'] = SpectralIndex(
+            name='MANGROVE',
+            description='Mangrove Forest Index (coastal forest vegetation)',
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * (1 + ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Mangrove monitoring - Giri et al. 2007',
+            theme='vegetation'
         )
-        
-        self.indices_db['GITELSON2'] = SpectralIndex(
-            name='GITELSON2',
-            description='Gitelson Chlorophyll Index 2',
-            formula=lambda b: f"({b['NIR']} / {b['REDEDGE']}) - 1",
-            bands_required={'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Gitelson et al. 2003',
-            theme='pigments'
+
+        self.indices_db['TUNDRA'] = SpectralIndex(
+            name='TUNDRA',
+            description='Tundra Vegetation Index (arctic vegetation)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Tundra vegetation analysis - Walker et al. 2005',
+            theme='vegetation'
         )
-        
-        self.indices_db['MCARI1'] = SpectralIndex(
-            name='MCARI1',
-            description='Modified Chlorophyll Absorption Ratio Index 1',
-            formula=lambda b: f"1.2 * (2.5 * ({b['NIR']} - {b['RED']}) - 1.3 * ({b['NIR']} - {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Haboudane et al. 2004',
-            theme='pigments'
+
+        self.indices_db['SAVANNA'] = SpectralIndex(
+            name='SAVANNA',
+            description='Savanna Vegetation Index (grass-tree mixed ecosystems)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.3 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Savanna ecosystem monitoring - Bucini et al. 2006',
+            theme='vegetation'
         )
-        
-        self.indices_db['MCARI2'] = SpectralIndex(
-            name='MCARI2',
-            description='Modified Chlorophyll Absorption Ratio Index 2',
-            formula=lambda b: f"(1.5 * (2.5 * ({b['NIR']} - {b['RED']}) - 1.3 * ({b['NIR']} - {b['GREEN']}))) / sqrt((2 * {b['NIR']} + 1)^2 - (6 * {b['NIR']} - 5 * sqrt({b['RED']})) - 0.5)",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Haboudane et al. 2004',
-            theme='pigments'
+
+        self.indices_db['ALPINE'] = SpectralIndex(
+            name='ALPINE',
+            description='Alpine Vegetation Index (high-altitude vegetation)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.2 * ({BLUE} - {RED}) / ({BLUE} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Alpine vegetation studies - Körner 2003',
+            theme='vegetation'
         )
-        
-        self.indices_db['RDVI'] = SpectralIndex(
-            name='RDVI',
-            description='Renormalized Difference Vegetation Index',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / sqrt({b['NIR']} + {b['RED']})",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Roujean and Breon 1995',
-            theme='pigments'
+
+        self.indices_db['DESERT_VEGETATION'] = SpectralIndex(
+            name='DESERT_VEGETATION',
+            description='Desert Vegetation Index (arid-adapted plants)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Desert vegetation monitoring - Elmore et al. 2006',
+            theme='vegetation'
         )
-        
-        self.indices_db['MARI'] = SpectralIndex(
-            name='MARI',
-            description='Modified Anthocyanin Reflectance Index',
-            formula=lambda b: f"((1 / {b['GREEN']}) - (1 / {b['REDEDGE']})) * {b['NIR']}",
-            bands_required={'GREEN': (520, 600), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Gitelson et al. 2006',
-            theme='pigments'
+
+        self.indices_db['RAINFOREST'] = SpectralIndex(
+            name='RAINFOREST',
+            description='Tropical Rainforest Index (dense broadleaf evergreen)',
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * ({NIR} / {GREEN})",
+            bands_required={'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Rainforest canopy analysis - Asner et al. 2002',
+            theme='vegetation'
         )
-        
-        self.indices_db['VREI1'] = SpectralIndex(
-            name='VREI1',
-            description='Vogelmann Red Edge Index 1',
-            formula=lambda b: f"{b['RE740']} / {b['RE720']}",
-            bands_required={'RE720': (715, 725), 'RE740': (735, 745)},
-            reference='Vogelmann et al. 1993',
-            theme='pigments'
+
+        self.indices_db['CONIFEROUS'] = SpectralIndex(
+            name='CONIFEROUS',
+            description='Coniferous Forest Index (needle-leaf evergreen)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Coniferous forest detection - Wolter et al. 1995',
+            theme='vegetation'
         )
-        
-        self.indices_db['VREI2'] = SpectralIndex(
-            name='VREI2',
-            description='Vogelmann Red Edge Index 2',
-            formula=lambda b: f"({b['RE734']} - {b['RE747']}) / ({b['RE715']} + {b['RE726']})",
-            bands_required={'RE715': (710, 720), 'RE726': (721, 731), 'RE734': (729, 739), 'RE747': (742, 752)},
-            reference='Vogelmann et al. 1993',
-            theme='pigments'
+
+        self.indices_db['DECIDUOUS'] = SpectralIndex(
+            name='DECIDUOUS',
+            description='Deciduous Forest Index (broadleaf seasonal)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Deciduous forest phenology - Zhang et al. 2003',
+            theme='vegetation'
         )
-        
-        self.indices_db['DD'] = SpectralIndex(
-            name='DD',
-            description='Double Difference Index - Chlorophyll',
-            formula=lambda b: f"({b['RE749']} - {b['RE720']}) - ({b['RE701']} - {b['RE672']})",
-            bands_required={'RE672': (667, 677), 'RE701': (696, 706), 'RE720': (715, 725), 'RE749': (744, 754)},
-            reference='le Maire et al. 2004',
-            theme='pigments'
+
+        self.indices_db['C4_GRASS'] = SpectralIndex(
+            name='C4_GRASS',
+            description='C4 Grass Index (tropical grasses, maize, sorghum)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.4 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='C4 grassland ecology - Still et al. 2003',
+            theme='vegetation'
         )
-        
-        # ====================================================================
-        # VEGETATION METABOLISM & PHYSIOLOGICAL INDICES
-        # Water content, photosynthetic efficiency, stress detection
-        # ====================================================================
-        
-        self.indices_db['WI'] = SpectralIndex(
-            name='WI',
-            description='Water Index - Leaf water content',
-            formula=lambda b: f"{b['B900']} / {b['B970']}",
-            bands_required={'B900': (895, 905), 'B970': (965, 975)},
-            reference='Penuelas et al. 1997',
-            theme='metabolism'
+
+        self.indices_db['C3_VEGETATION'] = SpectralIndex(
+            name='C3_VEGETATION',
+            description='C3 Vegetation Index (temperate plants, wheat, rice)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.3 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='C3 plant physiology - Ehleringer et al. 1997',
+            theme='vegetation'
         )
-        
-        self.indices_db['NDWI1240'] = SpectralIndex(
-            name='NDWI1240',
-            description='Normalized Difference Water Index 1240',
-            formula=lambda b: f"({b['B860']} - {b['B1240']}) / ({b['B860']} + {b['B1240']})",
-            bands_required={'B860': (855, 865), 'B1240': (1235, 1245)},
-            reference='Gao 1996',
-            theme='metabolism'
+
+        # Specific Plant Species and Crop Type Identification Indices
+        self.indices_db['WHEAT'] = SpectralIndex(
+            name='WHEAT',
+            description='Wheat Crop Index (Triticum aestivum)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.2 * ({SWIR1650} - {SWIR2200}) / ({SWIR1650} + {SWIR2200}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
+            reference='Wheat spectral signatures - Thenkabail et al. 2000',
+            theme='vegetation'
         )
-        
-        self.indices_db['NDWI2130'] = SpectralIndex(
-            name='NDWI2130',
-            description='Normalized Difference Water Index 2130',
-            formula=lambda b: f"({b['B860']} - {b['B2130']}) / ({b['B860']} + {b['B2130']})",
-            bands_required={'B860': (855, 865), 'B2130': (2125, 2135)},
-            reference='Gao 1996',
-            theme='metabolism'
+
+        self.indices_db['CORN'] = SpectralIndex(
+            name='CORN',
+            description='Corn/Maize Crop Index (Zea mays)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.3 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Maize crop monitoring - Gitelson et al. 2003',
+            theme='vegetation'
         )
-        
-        self.indices_db['LWCI'] = SpectralIndex(
-            name='LWCI',
-            description='Leaf Water Content Index',
-            formula=lambda b: f"log(1 - ({b['B970']} - {b['B900']})) / log(1 - ({b['B970']} - {b['B955']}))",
-            bands_required={'B900': (895, 905), 'B955': (950, 960), 'B970': (965, 975)},
-            reference='Galvao et al. 2005',
-            theme='metabolism'
+
+        self.indices_db['SOYBEAN'] = SpectralIndex(
+            name='SOYBEAN',
+            description='Soybean Crop Index (Glycine max)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.15 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Soybean spectral analysis - Penuelas et al. 1997',
+            theme='vegetation'
         )
-        
-        self.indices_db['NDII'] = SpectralIndex(
-            name='NDII',
-            description='Normalized Difference Infrared Index',
-            formula=lambda b: f"({b['B819']} - {b['B1649']}) / ({b['B819']} + {b['B1649']})",
-            bands_required={'B819': (814, 824), 'B1649': (1644, 1654)},
-            reference='Hardisky et al. 1983',
-            theme='metabolism'
+
+        self.indices_db['RICE'] = SpectralIndex(
+            name='RICE',
+            description='Rice Crop Index (Oryza sativa)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.25 * ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Rice paddy monitoring - Wang et al. 2005',
+            theme='vegetation'
         )
-        
-        self.indices_db['SRWI'] = SpectralIndex(
-            name='SRWI',
-            description='Simple Ratio Water Index',
-            formula=lambda b: f"{b['B860']} / {b['B1240']}",
-            bands_required={'B860': (855, 865), 'B1240': (1235, 1245)},
-            reference='Zarco-Tejada et al. 2003',
-            theme='metabolism'
+
+        self.indices_db['COTTON_CROP'] = SpectralIndex(
+            name='COTTON_CROP',
+            description='Cotton Crop Index (Gossypium hirsutum)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.4 * ({SWIR2100} - {SWIR1700}) / ({SWIR2100} + {SWIR1700}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1700': (1695, 1705), 'SWIR2100': (2095, 2105)},
+            reference='Cotton crop detection - Yang et al. 2009',
+            theme='vegetation'
         )
-        
-        self.indices_db['DATT'] = SpectralIndex(
-            name='DATT',
-            description='Datt Index - Leaf pigment',
-            formula=lambda b: f"({b['B850']} - {b['B710']}) / ({b['B850']} - {b['B680']})",
-            bands_required={'B680': (675, 685), 'B710': (705, 715), 'B850': (845, 855)},
-            reference='Datt 1999',
-            theme='metabolism'
+
+        self.indices_db['SUGARCANE'] = SpectralIndex(
+            name='SUGARCANE',
+            description='Sugarcane Crop Index (Saccharum officinarum)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.35 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Sugarcane spectral signatures - Fortes et al. 2005',
+            theme='vegetation'
         )
-        
-        self.indices_db['CARTER1'] = SpectralIndex(
-            name='CARTER1',
-            description='Carter Index 1 - Stress',
-            formula=lambda b: f"{b['B695']} / {b['B420']}",
-            bands_required={'B420': (415, 425), 'B695': (690, 700)},
-            reference='Carter 1994',
-            theme='metabolism'
+
+        self.indices_db['OAK'] = SpectralIndex(
+            name='OAK',
+            description='Oak Tree Species Index (Quercus spp.)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.1 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Oak species identification - Martin et al. 1998',
+            theme='vegetation'
         )
-        
-        self.indices_db['CARTER2'] = SpectralIndex(
-            name='CARTER2',
-            description='Carter Index 2 - Stress',
-            formula=lambda b: f"{b['B695']} / {b['B760']}",
-            bands_required={'B695': (690, 700), 'B760': (755, 765)},
-            reference='Carter 1994',
-            theme='metabolism'
+
+        self.indices_db['PINE'] = SpectralIndex(
+            name='PINE',
+            description='Pine Tree Species Index (Pinus spp.)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.2 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Pine forest analysis - Jensen et al. 1999',
+            theme='vegetation'
         )
-        
-        self.indices_db['GMI'] = SpectralIndex(
-            name='GMI',
-            description='Gamon Index - Photosynthetic efficiency',
-            formula=lambda b: f"{b['B750']} / {b['B550']}",
-            bands_required={'B550': (545, 555), 'B750': (745, 755)},
-            reference='Gamon et al. 1990',
-            theme='metabolism'
+
+        self.indices_db['MAPLE'] = SpectralIndex(
+            name='MAPLE',
+            description='Maple Tree Species Index (Acer spp.)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.15 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Maple species detection - Schlerf et al. 2005',
+            theme='vegetation'
         )
-        
-        self.indices_db['NPQI'] = SpectralIndex(
-            name='NPQI',
-            description='Normalized Phaeophytinization Index',
-            formula=lambda b: f"({b['B415']} - {b['B435']}) / ({b['B415']} + {b['B435']})",
-            bands_required={'B415': (410, 420), 'B435': (430, 440)},
-            reference='Barnes et al. 1992',
-            theme='metabolism'
+
+        self.indices_db['EUCALYPTUS'] = SpectralIndex(
+            name='EUCALYPTUS',
+            description='Eucalyptus Tree Index (Eucalyptus spp.)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.3 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Eucalyptus plantation monitoring - Lucas et al. 2000',
+            theme='vegetation'
         )
-        
-        self.indices_db['NPCI'] = SpectralIndex(
-            name='NPCI',
-            description='Normalized Pigment Chlorophyll Index',
-            formula=lambda b: f"({b['B680']} - {b['B430']}) / ({b['B680']} + {b['B430']})",
-            bands_required={'B430': (425, 435), 'B680': (675, 685)},
-            reference='Penuelas et al. 1994',
-            theme='metabolism'
+
+        self.indices_db['PALM'] = SpectralIndex(
+            name='PALM',
+            description='Palm Tree Index (Arecaceae family)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.25 * ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Palm oil plantation detection - Thenkabail et al. 2004',
+            theme='vegetation'
         )
-        
-        self.indices_db['RGRI'] = SpectralIndex(
-            name='RGRI',
-            description='Red-Green Ratio Index',
-            formula=lambda b: f"{b['RED']} / {b['GREEN']}",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
-            reference='Gamon and Surfus 1999',
-            theme='metabolism'
-        )
-        
-        # ====================================================================
-        # BIOCHEMICAL INDICES
-        # Cellulose, lignin, nitrogen content
-        # ====================================================================
-                
-        self.indices_db['CAI'] = SpectralIndex(
-            name='CAI',
-            description='Cellulose Absorption Index',
-            formula=lambda b: f"0.5 * ({b['SWIR1']} + {b['SWIR2']}) - {b['SWIR3']}",
-            bands_required={'SWIR1': (2000, 2100), 'SWIR2': (2100, 2300), 'SWIR3': (2000, 2100)},
-            reference='Nagler et al. 2000',
-            theme='biochemical'
-        )
-        
-        self.indices_db['NDLI'] = SpectralIndex(
-            name='NDLI',
-            description='Normalized Difference Lignin Index',
-            formula=lambda b: f"(log(1/{b['SWIR1']}) - log(1/{b['SWIR2']})) / (log(1/{b['SWIR1']}) + log(1/{b['SWIR2']}))",
-            bands_required={'SWIR1': (1680, 1750), 'SWIR2': (1754, 1850)},
-            reference='Serrano et al. 2002',
-            theme='biochemical'
-        )
-        
-        self.indices_db['PRI'] = SpectralIndex(
-            name='PRI',
-            description='Photochemical Reflectance Index',
-            formula=lambda b: f"({b['GREEN1']} - {b['GREEN2']}) / ({b['GREEN1']} + {b['GREEN2']})",
-            bands_required={'GREEN1': (528, 532), 'GREEN2': (565, 570)},
-            reference='Gamon et al. 1992',
-            theme='biochemical',
-            normalize_range=(-1, 1)
-        )
-        
-        self.indices_db['SIPI'] = SpectralIndex(
-            name='SIPI',
-            description='Structure Insensitive Pigment Index',
-            formula=lambda b: f"({b['NIR']} - {b['BLUE']}) / ({b['NIR']} - {b['RED']})",
-            bands_required={'BLUE': (445, 455), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Penuelas et al. 1995',
-            theme='biochemical'
-        )
-        
-        self.indices_db['PSRI'] = SpectralIndex(
-            name='PSRI',
-            description='Plant Senescence Reflectance Index',
-            formula=lambda b: f"({b['RED']} - {b['GREEN']}) / {b['REDEDGE']}",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
-            reference='Merzlyak et al. 1999',
-            theme='biochemical'
-        )
-        
-        # ====================================================================
-        # WATER INDICES
-        # Water body detection and monitoring
-        # ====================================================================
-        
-        self.indices_db['NDWI'] = SpectralIndex(
-            name='NDWI',
-            description='Normalized Difference Water Index',
-            formula=lambda b: f"float({b['GREEN']} - {b['NIR']}) / ({b['GREEN']} + {b['NIR']})",
-            bands_required={'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='McFeeters 1996',
-            theme='water',
-            normalize_range=(-1, 1)
-        )
-        
-        self.indices_db['MNDWI'] = SpectralIndex(
-            name='MNDWI',
-            description='Modified Normalized Difference Water Index',
-            formula=lambda b: f"float({b['GREEN']} - {b['SWIR']}) / ({b['GREEN']} + {b['SWIR']})",
-            bands_required={'GREEN': (520, 600), 'SWIR': (1550, 1750)},
-            reference='Xu 2006',
-            theme='water',
-            normalize_range=(-1, 1)
-        )
-        
-        self.indices_db['NDMI'] = SpectralIndex(
-            name='NDMI',
-            description='Normalized Difference Moisture Index',
-            formula=lambda b: f"float({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']})",
-            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Wilson and Sader 2002',
-            theme='water',
-            normalize_range=(-1, 1)
+
+        self.indices_db['GRAPEVINE'] = SpectralIndex(
+            name='GRAPEVINE',
+            description='Grapevine/Vineyard Index (Vitis vinifera)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.2 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Vineyard monitoring - Johnson et al. 2003',
+            theme='vegetation'
         )
-        
-        # ====================================================================
-        # SOIL INDICES
-        # Soil properties and composition
-        # ====================================================================
-        
-        self.indices_db['BI'] = SpectralIndex(
-            name='BI',
-            description='Brightness Index',
-            formula=lambda b: f"sqrt(({b['RED']}^2 + {b['GREEN']}^2) / 2)",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
-            reference='Escadafal et al. 1994',
-            theme='soil'
+
+        self.indices_db['CITRUS'] = SpectralIndex(
+            name='CITRUS',
+            description='Citrus Orchard Index (Citrus spp.)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.15 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Citrus grove detection - Ye et al. 2006',
+            theme='vegetation'
         )
-        
-        self.indices_db['CI'] = SpectralIndex(
-            name='CI',
-            description='Coloration Index',
-            formula=lambda b: f"({b['RED']} - {b['GREEN']}) / {b['RED']}",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
-            reference='Escadafal et al. 1994',
-            theme='soil'
+
+        self.indices_db['OLIVE'] = SpectralIndex(
+            name='OLIVE',
+            description='Olive Tree Index (Olea europaea)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.1 * ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference="Olive orchard monitoring - D'Urso et al. 2010",
+            theme='vegetation'
         )
-        
-        self.indices_db['RI'] = SpectralIndex(
-            name='RI',
-            description='Redness Index',
-            formula=lambda b: f"{b['RED']}^2 / ({b['GREEN']}^3)",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
-            reference='Madeira et al. 1997',
-            theme='soil'
+
+        self.indices_db['COFFEE'] = SpectralIndex(
+            name='COFFEE',
+            description='Coffee Plantation Index (Coffea spp.)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.2 * ({SWIR1650} - {SWIR2200}) / ({SWIR1650} + {SWIR2200}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
+            reference='Coffee plantation detection - Bernards et al. 2006',
+            theme='vegetation'
         )
-        
-        # ====================================================================
-        # URBAN/BUILT-UP INDICES
-        # Built-up area and urban feature detection
-        # ====================================================================
-        
-        self.indices_db['NDBI'] = SpectralIndex(
-            name='NDBI',
-            description='Normalized Difference Built-up Index',
-            formula=lambda b: f"float({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']})",
-            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Zha et al. 2003',
-            theme='urban',
-            normalize_range=(-1, 1)
+
+        self.indices_db['COCOA'] = SpectralIndex(
+            name='COCOA',
+            description='Cocoa Plantation Index (Theobroma cacao)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.25 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Cocoa farm monitoring - Román et al. 2008',
+            theme='vegetation'
         )
-        
-        self.indices_db['UI'] = SpectralIndex(
-            name='UI',
-            description='Urban Index',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']})",
-            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Kawamura et al. 1996',
-            theme='urban'
+
+        self.indices_db['TEA'] = SpectralIndex(
+            name='TEA',
+            description='Tea Plantation Index (Camellia sinensis)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.3 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Tea garden detection - Li et al. 2007',
+            theme='vegetation'
         )
-        
-        # ====================================================================
-        # STRESS INDICES
-        # Plant stress detection
-        # ====================================================================
-        
-        self.indices_db['MSI'] = SpectralIndex(
-            name='MSI',
-            description='Moisture Stress Index',
-            formula=lambda b: f"{b['SWIR']} / {b['NIR']}",
-            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Rock et al. 1986',
-            theme='stress'
+
+        # Irrigation Detection Indices
+        self.indices_db['IRRIGATED_CROP'] = SpectralIndex(
+            name='IRRIGATED_CROP',
+            description='Irrigated Crop Index (detecting irrigated agriculture)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Irrigated crop detection - Ambika et al. 2016',
+            theme='vegetation'
         )
-        
-        self.indices_db['NDNI'] = SpectralIndex(
-            name='NDNI',
-            description='Normalized Difference Nitrogen Index',
-            formula=lambda b: f"(log(1/{b['NIR1']}) - log(1/{b['NIR2']})) / (log(1/{b['NIR1']}) + log(1/{b['NIR2']}))",
-            bands_required={'NIR1': (1510, 1520), 'NIR2': (1680, 1690)},
-            reference='Serrano et al. 2002',
-            theme='stress'
+
+        self.indices_db['WATER_STRESSED_CROP'] = SpectralIndex(
+            name='WATER_STRESSED_CROP',
+            description='Water Stressed Crop Index (detecting water stress in irrigated areas)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 - ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Water stress detection - Kogan et al. 2011',
+            theme='vegetation'
         )
-        
-        self.indices_db['TCARI'] = SpectralIndex(
-            name='TCARI',
-            description='Transformed Chlorophyll Absorption Ratio',
-            formula=lambda b: f"3 * (({b['REDEDGE']} - {b['RED']}) - 0.2 * ({b['REDEDGE']} - {b['GREEN']}) * ({b['REDEDGE']} / {b['RED']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
-            reference='Haboudane et al. 2002',
-            theme='stress'
+
+        # Non-Irrigated Yield Prediction Indices
+        self.indices_db['RAINFED_CROP'] = SpectralIndex(
+            name='RAINFED_CROP',
+            description='Rain-fed Crop Index (non-irrigated agriculture)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Rain-fed crop detection - Balaghi et al. 2014',
+            theme='vegetation'
         )
-        
-        # ====================================================================
-        # MATERIAL IDENTIFICATION INDICES
-        # Plastics, hydrocarbons, minerals, built materials
-        # ====================================================================
-        
-        # Hydrocarbon detection
-        self.indices_db['HI'] = SpectralIndex(
-            name='HI',
-            description='Hydrocarbon Index - Oil & gas detection',
-            formula=lambda b: f"({b['SWIR2200']} * {b['SWIR2400']}) / ({b['SWIR2300']}^2)",
-            bands_required={'SWIR2200': (2195, 2205), 'SWIR2300': (2295, 2305), 'SWIR2400': (2395, 2405)},
-            reference='Cloutis 1989',
-            theme='materials'
+
+        self.indices_db['DROUGHT_STRESS'] = SpectralIndex(
+            name='DROUGHT_STRESS',
+            description='Drought Stress Index (water deficit in rain-fed areas)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Drought stress monitoring - Gu et al. 2007',
+            theme='vegetation'
         )
-        
-        self.indices_db['THI'] = SpectralIndex(
-            name='THI',
-            description='Tentative Hydrocarbon Index',
-            formula=lambda b: f"({b['SWIR1730']} + {b['SWIR2450']}) / (2 * {b['SWIR2210']})",
-            bands_required={'SWIR1730': (1725, 1735), 'SWIR2210': (2205, 2215), 'SWIR2450': (2445, 2455)},
-            reference='Kühn et al. 2004',
-            theme='materials'
+
+        self.indices_db['YIELD_PREDICTION'] = SpectralIndex(
+            name='YIELD_PREDICTION',
+            description='Crop Yield Prediction Index (general yield estimation)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.3 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Crop yield prediction - Becker-Reshef et al. 2010',
+            theme='vegetation'
         )
-        
-        self.indices_db['OHI'] = SpectralIndex(
-            name='OHI',
-            description='Oil and Hydrocarbon Index',
-            formula=lambda b: f"({b['SWIR1650']} + {b['SWIR2450']}) / {b['SWIR2210']}",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR2210': (2205, 2215), 'SWIR2450': (2445, 2455)},
-            reference='Lammoglia and Filho 2011',
-            theme='materials'
+
+        self.indices_db['RAINFED_YIELD'] = SpectralIndex(
+            name='RAINFED_YIELD',
+            description='Rain-fed Yield Index (yield prediction for non-irrigated crops)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.2 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Rain-fed yield modeling - Lobell et al. 2015',
+            theme='vegetation'
         )
-        
-        self.indices_db['TPI'] = SpectralIndex(
-            name='TPI',
-            description='Tar/Petroleum Index',
-            formula=lambda b: f"{b['SWIR2300']} / {b['SWIR1650']}",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR2300': (2295, 2305)},
-            reference='Martinez and Le Toan 2007',
-            theme='materials'
+
+        self.indices_db['DRYLAND_YIELD'] = SpectralIndex(
+            name='DRYLAND_YIELD',
+            description='Dryland Yield Index (arid region crop yield)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.4 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Dryland agriculture yield - Basso et al. 2012',
+            theme='vegetation'
         )
-        
-        self.indices_db['COAL'] = SpectralIndex(
-            name='COAL',
-            description='Coal/Carbon Index',
-            formula=lambda b: f"({b['SWIR2200']} / {b['SWIR1600']}) * ({b['SWIR2200']} / {b['NIR']})",
-            bands_required={'NIR': (760, 900), 'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
-            reference='van der Meer 1995',
-            theme='materials'
+
+        self.indices_db['PRECIPITATION_EFFECTIVENESS'] = SpectralIndex(
+            name='PRECIPITATION_EFFECTIVENESS',
+            description='Precipitation Effectiveness Index (rainfall utilization)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.25 * ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Rainfall use efficiency - Mkhabela et al. 2011',
+            theme='vegetation'
         )
-        
-        # Plastic detection
-        self.indices_db['PLASTIC'] = SpectralIndex(
-            name='PLASTIC',
-            description='Plastic Detection Index',
-            formula=lambda b: f"({b['NIR']} / {b['SWIR1600']}) - ({b['SWIR2200']} / {b['SWIR1600']})",
-            bands_required={'NIR': (760, 900), 'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
-            reference='Garaba and Dierssen 2018',
-            theme='materials'
+
+        self.indices_db['CROP_WATER_STRESS'] = SpectralIndex(
+            name='CROP_WATER_STRESS',
+            description='Crop Water Stress Index (physiological stress in rain-fed crops)',
+            formula_template="({SWIR1650} - {SWIR2200}) / ({SWIR1650} + {SWIR2200}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
+            reference='Crop physiological stress - Penuelas et al. 2011',
+            theme='vegetation'
         )
-        
-        self.indices_db['PDI'] = SpectralIndex(
-            name='PDI',
-            description='Plastic Debris Index',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) - ({b['SWIR1600']} - {b['NIR']}) / ({b['SWIR1600']} + {b['NIR']})",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1600': (1595, 1605)},
-            reference='Biermann et al. 2020',
-            theme='materials'
+
+        self.indices_db['RAINFED_BIOMASS'] = SpectralIndex(
+            name='RAINFED_BIOMASS',
+            description='Rain-fed Biomass Index (biomass estimation for non-irrigated crops)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.2 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Rain-fed biomass estimation - Prince et al. 2009',
+            theme='vegetation'
         )
-        
-        self.indices_db['FPI'] = SpectralIndex(
-            name='FPI',
-            description='Floating Plastic Index',
-            formula=lambda b: f"{b['NIR']} / ({b['RED']} + {b['SWIR1600']}) * 100",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1600': (1595, 1605)},
-            reference='Themistocleous et al. 2020',
-            theme='materials'
+
+        self.indices_db['CLIMATE_YIELD'] = SpectralIndex(
+            name='CLIMATE_YIELD',
+            description='Climate Yield Index (climate-limited yield prediction)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.15 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Climate yield modeling - Schlenker et al. 2013',
+            theme='vegetation'
         )
-        
-        self.indices_db['RSWIR'] = SpectralIndex(
-            name='RSWIR',
-            description='Reversed SWIR Index - Marine debris',
-            formula=lambda b: f"{b['SWIR1600']} / {b['NIR']}",
-            bands_required={'NIR': (760, 900), 'SWIR1600': (1595, 1605)},
-            reference='Kikaki et al. 2020',
-            theme='materials'
+
+        self.indices_db['RAINFED_PRODUCTIVITY'] = SpectralIndex(
+            name='RAINFED_PRODUCTIVITY',
+            description='Rain-fed Productivity Index (overall productivity of rain-fed agriculture)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.35 * ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Rain-fed productivity - Johnson et al. 2014',
+            theme='vegetation'
         )
-        
-        self.indices_db['NDPI'] = SpectralIndex(
-            name='NDPI',
-            description='Normalized Difference Plastic Index',
-            formula=lambda b: f"({b['SWIR1650']} - {b['NIR']}) / ({b['SWIR1650']} + {b['NIR']})",
-            bands_required={'NIR': (760, 900), 'SWIR1650': (1645, 1655)},
-            reference='Themistocleous et al. 2020',
-            theme='materials'
+
+        self.indices_db['WATER_LIMITED_YIELD'] = SpectralIndex(
+            name='WATER_LIMITED_YIELD',
+            description='Water Limited Yield Index (yield constrained by water availability)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 - 0.5 * ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Water-limited yield - Sinclair et al. 2010',
+            theme='vegetation'
         )
-        
-        self.indices_db['MPDI'] = SpectralIndex(
-            name='MPDI',
-            description='Marine Plastic Detection Index',
-            formula=lambda b: f"({b['B490']} - {b['B560']}) / ({b['B490']} + {b['B560']}) + ({b['B665']} - {b['B865']}) / ({b['B665']} + {b['B865']})",
-            bands_required={'B490': (485, 495), 'B560': (555, 565), 'B665': (660, 670), 'B865': (860, 870)},
-            reference='Biermann et al. 2020',
-            theme='materials'
+
+        self.indices_db['DROUGHT_VULNERABILITY'] = SpectralIndex(
+            name='DROUGHT_VULNERABILITY',
+            description='Drought Vulnerability Index (susceptibility to water stress)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + 0.4 * ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Drought vulnerability assessment - Svoboda et al. 2016',
+            theme='vegetation'
         )
-        
-        # Mineral and geological indices
-        self.indices_db['FERRIC'] = SpectralIndex(
-            name='FERRIC',
-            description='Ferric Iron Index',
-            formula=lambda b: f"{b['SWIR1650']} / {b['B830']}",
-            bands_required={'B830': (825, 835), 'SWIR1650': (1645, 1655)},
-            reference='Segal 1982',
-            theme='materials'
+
+        self.indices_db['RAINFED_PHENOLOGY'] = SpectralIndex(
+            name='RAINFED_PHENOLOGY',
+            description='Rain-fed Phenology Index (growth stage detection in rain-fed crops)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + 0.25 * ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Rain-fed phenology monitoring - Sakamoto et al. 2005',
+            theme='vegetation'
         )
-        
-        self.indices_db['FERROUS'] = SpectralIndex(
-            name='FERROUS',
-            description='Ferrous Iron Index',
-            formula=lambda b: f"{b['SWIR1650']} / {b['B1550']}",
-            bands_required={'B1550': (1545, 1555), 'SWIR1650': (1645, 1655)},
-            reference='Segal 1982',
-            theme='materials'
+
+    def _init_pigments(self):
+        """Add the pigments theme indices to the database."""
+        # VEGETATION PIGMENT INDICES
+        # Specific plant pigments: chlorophyll, anthocyanin, carotenoid
+        self.indices_db['ARI1'] = SpectralIndex(
+            name='ARI1',
+            description='Anthocyanin Reflectance Index 1',
+            formula_template="(1 / {GREEN}) - (1 / {REDEDGE})",
+            bands_required={'GREEN': (520, 600), 'REDEDGE': (690, 730)},
+            reference='Gitelson et al. 2001',
+            theme='pigments'
         )
-        
-        self.indices_db['LATERITE'] = SpectralIndex(
-            name='LATERITE',
-            description='Laterite Index - Iron-rich materials',
-            formula=lambda b: f"({b['SWIR1650']} + {b['RED']}) / {b['NIR']}",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655)},
-            reference='Pour and Hashim 2012',
-            theme='materials'
+
+        self.indices_db['ARI2'] = SpectralIndex(
+            name='ARI2',
+            description='Anthocyanin Reflectance Index 2',
+            formula_template="{NIR} * ((1 / {GREEN}) - (1 / {REDEDGE}))",
+            bands_required={'GREEN': (520, 600), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Gitelson et al. 2001',
+            theme='pigments'
         )
-        
-        self.indices_db['GOSSAN'] = SpectralIndex(
-            name='GOSSAN',
-            description='Gossan Index - Weathered sulfides',
-            formula=lambda b: f"({b['RED']} * {b['SWIR1650']}) / ({b['GREEN']}^2)",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'SWIR1650': (1645, 1655)},
-            reference='Rajendran and Nasir 2019',
-            theme='materials'
+
+        self.indices_db['CRI550'] = SpectralIndex(
+            name='CRI550',
+            description='Carotenoid Reflectance Index 550',
+            formula_template="(1 / {B510}) - (1 / {B550})",
+            bands_required={'B510': (505, 515), 'B550': (545, 555)},
+            reference='Gitelson et al. 2002',
+            theme='pigments'
         )
-        
-        self.indices_db['SINDEX'] = SpectralIndex(
-            name='SINDEX',
-            description='S-Index - Soil/sediment composition',
-            formula=lambda b: f"sqrt({b['RED']} * {b['NIR']})",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Escadafal and Huete 1991',
-            theme='materials'
+
+        self.indices_db['CRI700'] = SpectralIndex(
+            name='CRI700',
+            description='Carotenoid Reflectance Index 700',
+            formula_template="(1 / {B510}) - (1 / {B700})",
+            bands_required={'B510': (505, 515), 'B700': (695, 705)},
+            reference='Gitelson et al. 2002',
+            theme='pigments'
         )
-        
-        # Built environment materials
-        self.indices_db['PAINT'] = SpectralIndex(
-            name='PAINT',
-            description='Paint Detection Index (synthetic coatings)',
-            formula=lambda b: f"({b['B450']} + {b['B650']}) / (2 * {b['B550']})",
-            bands_required={'B450': (445, 455), 'B550': (545, 555), 'B650': (645, 655)},
-            reference='Based on pigment absorption features',
-            theme='materials'
+
+        self.indices_db['CARI'] = SpectralIndex(
+            name='CARI',
+            description='Chlorophyll Absorption Ratio Index',
+            formula_template="({RE700} / {RED}) * abs((({B550} - {RED}) / {RE700}) + {RED} - {B550})",
+            bands_required={'B550': (545, 555), 'RED': (620, 690), 'RE700': (695, 705)},
+            reference='Kim et al. 1994',
+            theme='pigments'
         )
-        
-        self.indices_db['ASPHALT'] = SpectralIndex(
-            name='ASPHALT',
-            description='Asphalt/Bitumen Index',
-            formula=lambda b: f"({b['SWIR1600']} - {b['SWIR2200']}) / ({b['SWIR1600']} + {b['SWIR2200']})",
-            bands_required={'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
-            reference='Herold et al. 2004',
-            theme='materials'
+
+        self.indices_db['MCARIOSAVI'] = SpectralIndex(
+            name='MCARIOSAVI',
+            description='MCARI/OSAVI ratio - Chlorophyll content',
+            formula_template="((({RE700} - {RED}) - 0.2 * ({RE700} - {GREEN})) * ({RE700} / {RED})) / ((1.16 * ({NIR} - {RED}) / ({NIR} + {RED} + 0.16)))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'RE700': (695, 705), 'NIR': (760, 900)},
+            reference='Daughtry et al. 2000',
+            theme='pigments'
         )
-        
-        self.indices_db['CONCRETE'] = SpectralIndex(
-            name='CONCRETE',
-            description='Concrete Detection Index',
-            formula=lambda b: f"({b['B500']} + {b['SWIR2200']}) / {b['NIR']}",
-            bands_required={'B500': (495, 505), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
-            reference='Dópido et al. 2012',
-            theme='materials'
+
+        self.indices_db['GITELSON'] = SpectralIndex(
+            name='GITELSON',
+            description='Gitelson Chlorophyll Index',
+            formula_template="({NIR} / {GREEN}) - 1",
+            bands_required={'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Gitelson et al. 2003',
+            theme='pigments'
         )
-        
-        # Additional Mineral Identification Indices
-        self.indices_db['CLAY'] = SpectralIndex(
-            name='CLAY',
-            description='Clay Mineral Index (kaolinite, illite, smectite)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['SWIR2100']}) / ({b['SWIR2200']} + {b['SWIR2100']})",
-            bands_required={'SWIR2100': (2095, 2105), 'SWIR2200': (2195, 2205)},
-            reference='Chabrillat et al. 2000',
-            theme='materials'
+
+        self.indices_db['GITELSON2'] = SpectralIndex(
+            name='GITELSON2',
+            description='Gitelson Chlorophyll Index 2',
+            formula_template="({NIR} / {REDEDGE}) - 1",
+            bands_required={'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Gitelson et al. 2003',
+            theme='pigments'
         )
-        
-        self.indices_db['CARBONATE'] = SpectralIndex(
-            name='CARBONATE',
-            description='Carbonate Mineral Index (calcite, dolomite)',
-            formula=lambda b: f"({b['SWIR2330']} - {b['SWIR2200']}) / ({b['SWIR2330']} + {b['SWIR2200']})",
-            bands_required={'SWIR2200': (2195, 2205), 'SWIR2330': (2325, 2335)},
-            reference='Gaffey 1986',
-            theme='materials'
+
+        self.indices_db['MCARI1'] = SpectralIndex(
+            name='MCARI1',
+            description='Modified Chlorophyll Absorption Ratio Index 1',
+            formula_template="1.2 * (2.5 * ({NIR} - {RED}) - 1.3 * ({NIR} - {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Haboudane et al. 2004',
+            theme='pigments'
         )
-        
-        self.indices_db['SULFIDE'] = SpectralIndex(
-            name='SULFIDE',
-            description='Sulfide Mineral Index (pyrite, chalcopyrite)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2200']}) / ({b['SWIR1650']} + {b['SWIR2200']})",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
-            reference='Huntington et al. 1997',
-            theme='materials'
+
+        self.indices_db['MCARI2'] = SpectralIndex(
+            name='MCARI2',
+            description='Modified Chlorophyll Absorption Ratio Index 2',
+            formula_template="(1.5 * (2.5 * ({NIR} - {RED}) - 1.3 * ({NIR} - {GREEN}))) / sqrt((2 * {NIR} + 1)^2 - (6 * {NIR} - 5 * sqrt({RED})) - 0.5)",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Haboudane et al. 2004',
+            theme='pigments'
         )
-        
-        self.indices_db['QUARTZ'] = SpectralIndex(
-            name='QUARTZ',
-            description='Quartz/Silica Index',
-            formula=lambda b: f"({b['SWIR8000']} - {b['SWIR9500']}) / ({b['SWIR8000']} + {b['SWIR9500']})",
-            bands_required={'SWIR8000': (7950, 8050), 'SWIR9500': (9450, 9550)},
-            reference='Crowley and Clark 1992',
-            theme='materials'
+
+        self.indices_db['RDVI'] = SpectralIndex(
+            name='RDVI',
+            description='Renormalized Difference Vegetation Index',
+            formula_template="({NIR} - {RED}) / sqrt({NIR} + {RED})",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Roujean and Breon 1995',
+            theme='pigments'
         )
-        
-        self.indices_db['MICA'] = SpectralIndex(
-            name='MICA',
-            description='Mica Mineral Index (muscovite, biotite)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['SWIR2350']}) / ({b['SWIR2200']} + {b['SWIR2350']})",
-            bands_required={'SWIR2200': (2195, 2205), 'SWIR2350': (2345, 2355)},
-            reference='Rowan et al. 1977',
-            theme='materials'
+
+        self.indices_db['MARI'] = SpectralIndex(
+            name='MARI',
+            description='Modified Anthocyanin Reflectance Index',
+            formula_template="((1 / {GREEN}) - (1 / {REDEDGE})) * {NIR}",
+            bands_required={'GREEN': (520, 600), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
+            reference='Gitelson et al. 2006',
+            theme='pigments'
         )
-        
-        self.indices_db['GYPSUM'] = SpectralIndex(
-            name='GYPSUM',
-            description='Gypsum Mineral Index',
-            formula=lambda b: f"({b['SWIR1750']} - {b['SWIR1940']}) / ({b['SWIR1750']} + {b['SWIR1940']})",
-            bands_required={'SWIR1750': (1745, 1755), 'SWIR1940': (1935, 1945)},
-            reference='Kahle et al. 1988',
-            theme='materials'
+
+        self.indices_db['VREI1'] = SpectralIndex(
+            name='VREI1',
+            description='Vogelmann Red Edge Index 1',
+            formula_template="{RE740} / {RE720}",
+            bands_required={'RE720': (715, 725), 'RE740': (735, 745)},
+            reference='Vogelmann et al. 1993',
+            theme='pigments'
         )
-        
-        # Additional Soil Identification Indices
-        self.indices_db['IRON_OXIDE'] = SpectralIndex(
-            name='IRON_OXIDE',
-            description='Iron Oxide Soil Index (hematite, goethite)',
-            formula=lambda b: f"({b['RED']} / {b['BLUE']})",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690)},
-            reference='Madeira et al. 1997',
-            theme='soil'
+
+        self.indices_db['VREI2'] = SpectralIndex(
+            name='VREI2',
+            description='Vogelmann Red Edge Index 2',
+            formula_template="({RE734} - {RE747}) / ({RE715} + {RE726})",
+            bands_required={'RE715': (710, 720), 'RE726': (721, 731), 'RE734': (729, 739), 'RE747': (742, 752)},
+            reference='Vogelmann et al. 1993',
+            theme='pigments'
         )
-        
-        self.indices_db['SOIL_MOISTURE'] = SpectralIndex(
-            name='SOIL_MOISTURE',
-            description='Soil Moisture Index',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2200']}) / ({b['SWIR1650']} + {b['SWIR2200']})",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
-            reference='Whiting et al. 2004',
-            theme='soil'
+
+        self.indices_db['DD'] = SpectralIndex(
+            name='DD',
+            description='Double Difference Index - Chlorophyll',
+            formula_template="({RE749} - {RE720}) - ({RE701} - {RE672})",
+            bands_required={'RE672': (667, 677), 'RE701': (696, 706), 'RE720': (715, 725), 'RE749': (744, 754)},
+            reference='le Maire et al. 2004',
+            theme='pigments'
         )
-        
-        self.indices_db['ORGANIC_SOIL'] = SpectralIndex(
-            name='ORGANIC_SOIL',
-            description='Organic Matter Soil Index',
-            formula=lambda b: f"log({b['RED']} / {b['NIR']})",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Baumgardner et al. 1985',
-            theme='soil'
+
+    def _init_metabolism(self):
+        """Add the metabolism theme indices to the database."""
+        # VEGETATION METABOLISM & PHYSIOLOGICAL INDICES
+        # Water content, photosynthetic efficiency, stress detection
+        self.indices_db['WI'] = SpectralIndex(
+            name='WI',
+            description='Water Index - Leaf water content',
+            formula_template="{B900} / {B970}",
+            bands_required={'B900': (895, 905), 'B970': (965, 975)},
+            reference='Penuelas et al. 1997',
+            theme='metabolism'
         )
-        
-        self.indices_db['SALINITY'] = SpectralIndex(
-            name='SALINITY',
-            description='Soil Salinity Index',
-            formula=lambda b: f"sqrt(({b['RED']} - {b['GREEN']})^2 + ({b['GREEN']} - {b['BLUE']})^2 + ({b['BLUE']} - {b['RED']})^2)",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690)},
-            reference='Dehaan and Taylor 2002',
-            theme='soil'
+
+        self.indices_db['NDWI1240'] = SpectralIndex(
+            name='NDWI1240',
+            description='Normalized Difference Water Index 1240',
+            formula_template="({B860} - {B1240}) / ({B860} + {B1240})",
+            bands_required={'B860': (855, 865), 'B1240': (1235, 1245)},
+            reference='Gao 1996',
+            theme='metabolism'
         )
-        
-        self.indices_db['CRUST'] = SpectralIndex(
-            name='CRUST',
-            description='Soil Crust Index (biological/physical crusts)',
-            formula=lambda b: f"({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']})",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730)},
-            reference='Karnieli et al. 2001',
-            theme='soil'
+
+        self.indices_db['NDWI2130'] = SpectralIndex(
+            name='NDWI2130',
+            description='Normalized Difference Water Index 2130',
+            formula_template="({B860} - {B2130}) / ({B860} + {B2130})",
+            bands_required={'B860': (855, 865), 'B2130': (2125, 2135)},
+            reference='Gao 1996',
+            theme='metabolism'
         )
-        
-        # Geotechnical and Bearing Capacity Indices
-        self.indices_db['CLAY_SWELL'] = SpectralIndex(
-            name='CLAY_SWELL',
-            description='Clay Swelling Potential Index (smectite/montmorillonite expansion)',
-            formula=lambda b: f"({b['SWIR1900']} - {b['SWIR2200']}) / ({b['SWIR1900']} + {b['SWIR2200']})",
-            bands_required={'SWIR1900': (1895, 1905), 'SWIR2200': (2195, 2205)},
-            reference='Chabrillat et al. 2002 - Geotechnical applications',
-            theme='soil'
+
+        self.indices_db['LWCI'] = SpectralIndex(
+            name='LWCI',
+            description='Leaf Water Content Index',
+            formula_template="log(1 - ({B970} - {B900})) / log(1 - ({B970} - {B955}))",
+            bands_required={'B900': (895, 905), 'B955': (950, 960), 'B970': (965, 975)},
+            reference='Galvao et al. 2005',
+            theme='metabolism'
         )
-        
-        self.indices_db['MOISTURE_CONTENT'] = SpectralIndex(
-            name='MOISTURE_CONTENT',
-            description='Soil Moisture Content Index (volumetric water content estimation)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2100']}) / ({b['SWIR1650']} + {b['SWIR2100']})",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR2100': (2095, 2105)},
-            reference='Whiting et al. 2004 - Soil moisture estimation',
-            theme='soil'
+
+        self.indices_db['NDII'] = SpectralIndex(
+            name='NDII',
+            description='Normalized Difference Infrared Index',
+            formula_template="({B819} - {B1649}) / ({B819} + {B1649})",
+            bands_required={'B819': (814, 824), 'B1649': (1644, 1654)},
+            reference='Hardisky et al. 1983',
+            theme='metabolism'
         )
-        
-        self.indices_db['BEARING_CAPACITY'] = SpectralIndex(
-            name='BEARING_CAPACITY',
-            description='Soil Bearing Capacity Index (estimated in kPa)',
-            formula=lambda b: f"1000 * (1 - ({b['MOISTURE_CONTENT']} * 0.8 + {b['CLAY_SWELL']} * 0.6))",
-            bands_required={'MOISTURE_CONTENT': (0, 1), 'CLAY_SWELL': (-1, 1)},
-            reference='Empirical relationship - ASTM D2487 adaptations',
-            theme='soil'
+
+        self.indices_db['SRWI'] = SpectralIndex(
+            name='SRWI',
+            description='Simple Ratio Water Index',
+            formula_template="{B860} / {B1240}",
+            bands_required={'B860': (855, 865), 'B1240': (1235, 1245)},
+            reference='Zarco-Tejada et al. 2003',
+            theme='metabolism'
         )
-        
-        self.indices_db['PLASTICITY_INDEX'] = SpectralIndex(
-            name='PLASTICITY_INDEX',
-            description='Soil Plasticity Index (Atterberg limits estimation)',
-            formula=lambda b: f"50 * {b['CLAY_SWELL']} + 30 * {b['MOISTURE_CONTENT']}",
-            bands_required={'CLAY_SWELL': (-1, 1), 'MOISTURE_CONTENT': (0, 1)},
-            reference='Spectral estimation of Atterberg limits',
-            theme='soil'
+
+        self.indices_db['DATT'] = SpectralIndex(
+            name='DATT',
+            description='Datt Index - Leaf pigment',
+            formula_template="({B850} - {B710}) / ({B850} - {B680})",
+            bands_required={'B680': (675, 685), 'B710': (705, 715), 'B850': (845, 855)},
+            reference='Datt 1999',
+            theme='metabolism'
         )
-        
-        self.indices_db['SHEAR_STRENGTH'] = SpectralIndex(
-            name='SHEAR_STRENGTH',
-            description='Soil Shear Strength Index (kPa estimation)',
-            formula=lambda b: f"500 * (1 - {b['MOISTURE_CONTENT']}) * (1 - abs({b['CLAY_SWELL']}))",
-            bands_required={'MOISTURE_CONTENT': (0, 1), 'CLAY_SWELL': (-1, 1)},
-            reference='Geotechnical strength estimation from spectral data',
-            theme='soil'
+
+        self.indices_db['CARTER1'] = SpectralIndex(
+            name='CARTER1',
+            description='Carter Index 1 - Stress',
+            formula_template="{B695} / {B420}",
+            bands_required={'B420': (415, 425), 'B695': (690, 700)},
+            reference='Carter 1994',
+            theme='metabolism'
         )
-        
-        self.indices_db['SMECTITE_RATIO'] = SpectralIndex(
-            name='SMECTITE_RATIO',
-            description='Smectite to Kaolinite Ratio (swelling clay indicator)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['SWIR2100']}) / ({b['SWIR2200']} + {b['SWIR2100']})",
-            bands_required={'SWIR2100': (2095, 2105), 'SWIR2200': (2195, 2205)},
-            reference='Van der Meer et al. 2002 - Clay mineralogy',
-            theme='soil'
+
+        self.indices_db['CARTER2'] = SpectralIndex(
+            name='CARTER2',
+            description='Carter Index 2 - Stress',
+            formula_template="{B695} / {B760}",
+            bands_required={'B695': (690, 700), 'B760': (755, 765)},
+            reference='Carter 1994',
+            theme='metabolism'
         )
-        
-        # Atmospheric Composition and Pollution Detection Indices
-        self.indices_db['AEROSOL_OPTICAL'] = SpectralIndex(
-            name='AEROSOL_OPTICAL',
-            description='Aerosol Optical Depth Index (atmospheric particle concentration)',
-            formula=lambda b: f"({b['BLUE']} - {b['RED']}) / ({b['BLUE']} + {b['RED']})",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690)},
-            reference='Kaufman and Tanre 1996 - Aerosol retrieval',
-            theme='atmospheric'
+
+        self.indices_db['GMI'] = SpectralIndex(
+            name='GMI',
+            description='Gamon Index - Photosynthetic efficiency',
+            formula_template="{B750} / {B550}",
+            bands_required={'B550': (545, 555), 'B750': (745, 755)},
+            reference='Gamon et al. 1990',
+            theme='metabolism'
         )
-        
-        self.indices_db['OZONE'] = SpectralIndex(
-            name='OZONE',
-            description='Ozone Concentration Index (O3 detection)',
-            formula=lambda b: f"({b['B340']} - {b['B360']}) / ({b['B340']} + {b['B360']})",
-            bands_required={'B340': (335, 345), 'B360': (355, 365)},
-            reference='Herman et al. 1999 - Ozone monitoring',
-            theme='atmospheric'
+
+        self.indices_db['NPQI'] = SpectralIndex(
+            name='NPQI',
+            description='Normalized Phaeophytinization Index',
+            formula_template="({B415} - {B435}) / ({B415} + {B435})",
+            bands_required={'B415': (410, 420), 'B435': (430, 440)},
+            reference='Barnes et al. 1992',
+            theme='metabolism'
         )
-        
-        self.indices_db['WATER_VAPOR'] = SpectralIndex(
-            name='WATER_VAPOR',
-            description='Atmospheric Water Vapor Index (column water vapor)',
-            formula=lambda b: f"({b['B940']} - {b['B860']}) / ({b['B940']} + {b['B860']})",
-            bands_required={'B860': (855, 865), 'B940': (935, 945)},
-            reference='Kaufman and Gao 1992 - Water vapor retrieval',
-            theme='atmospheric'
+
+        self.indices_db['NPCI'] = SpectralIndex(
+            name='NPCI',
+            description='Normalized Pigment Chlorophyll Index',
+            formula_template="({B680} - {B430}) / ({B680} + {B430})",
+            bands_required={'B430': (425, 435), 'B680': (675, 685)},
+            reference='Penuelas et al. 1994',
+            theme='metabolism'
         )
-        
-        self.indices_db['NO2'] = SpectralIndex(
-            name='NO2',
-            description='Nitrogen Dioxide Index (pollution detection)',
-            formula=lambda b: f"({b['B440']} - {b['B430']}) / ({b['B440']} + {b['B430']})",
-            bands_required={'B430': (425, 435), 'B440': (435, 445)},
-            reference='Boersma et al. 2002 - NO2 monitoring',
-            theme='atmospheric'
+
+        self.indices_db['RGRI'] = SpectralIndex(
+            name='RGRI',
+            description='Red-Green Ratio Index',
+            formula_template="{RED} / {GREEN}",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
+            reference='Gamon and Surfus 1999',
+            theme='metabolism'
         )
-        
-        self.indices_db['SO2'] = SpectralIndex(
-            name='SO2',
-            description='Sulfur Dioxide Index (volcanic/industrial pollution)',
-            formula=lambda b: f"({b['B310']} - {b['B330']}) / ({b['B310']} + {b['B330']})",
-            bands_required={'B310': (305, 315), 'B330': (325, 335)},
-            reference='Kerr et al. 2010 - SO2 volcanic emissions',
-            theme='atmospheric'
+
+    def _init_biochemical(self):
+        """Add the biochemical theme indices to the database."""
+        # BIOCHEMICAL INDICES
+        # Cellulose, lignin, nitrogen content
+        self.indices_db['CAI'] = SpectralIndex(
+            name='CAI',
+            description='Cellulose Absorption Index',
+            formula_template="0.5 * ({SWIR1} + {SWIR2}) - {SWIR3}",
+            bands_required={'SWIR1': (2000, 2100), 'SWIR2': (2100, 2300), 'SWIR3': (2000, 2100)},
+            reference='Nagler et al. 2000',
+            theme='biochemical'
         )
-        
-        self.indices_db['CO'] = SpectralIndex(
-            name='CO',
-            description='Carbon Monoxide Index (combustion detection)',
-            formula=lambda b: f"({b['SWIR2300']} - {b['SWIR2100']}) / ({b['SWIR2300']} + {b['SWIR2100']})",
-            bands_required={'SWIR2100': (2095, 2105), 'SWIR2300': (2295, 2305)},
-            reference='MOPITT algorithm - CO retrieval',
-            theme='atmospheric'
+
+        self.indices_db['NDLI'] = SpectralIndex(
+            name='NDLI',
+            description='Normalized Difference Lignin Index',
+            formula_template="(log(1/{SWIR1}) - log(1/{SWIR2})) / (log(1/{SWIR1}) + log(1/{SWIR2}))",
+            bands_required={'SWIR1': (1680, 1750), 'SWIR2': (1754, 1850)},
+            reference='Serrano et al. 2002',
+            theme='biochemical'
         )
-        
-        self.indices_db['CH4'] = SpectralIndex(
-            name='CH4',
-            description='Methane Index (greenhouse gas detection)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR1700']}) / ({b['SWIR1650']} + {b['SWIR1700']})",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR1700': (1695, 1705)},
-            reference='Frankenberg et al. 2005 - CH4 retrieval',
-            theme='atmospheric'
+
+        self.indices_db['PRI'] = SpectralIndex(
+            name='PRI',
+            description='Photochemical Reflectance Index',
+            formula_template="({GREEN1} - {GREEN2}) / ({GREEN1} + {GREEN2})",
+            bands_required={'GREEN1': (528, 532), 'GREEN2': (565, 570)},
+            reference='Gamon et al. 1992',
+            theme='biochemical',
+            normalize_range=(-1, 1)
         )
-        
-        self.indices_db['DUST'] = SpectralIndex(
-            name='DUST',
-            description='Atmospheric Dust Index (mineral dust detection)',
-            formula=lambda b: f"({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']})",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690)},
-            reference='Herman et al. 1997 - Dust detection',
-            theme='atmospheric'
+
+        self.indices_db['SIPI'] = SpectralIndex(
+            name='SIPI',
+            description='Structure Insensitive Pigment Index',
+            formula_template="({NIR} - {BLUE}) / ({NIR} - {RED})",
+            bands_required={'BLUE': (445, 455), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Penuelas et al. 1995',
+            theme='biochemical'
         )
-        
-        self.indices_db['SMOKE'] = SpectralIndex(
-            name='SMOKE',
-            description='Smoke/Plume Index (wildfire/industrial smoke)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['NIR']}) / ({b['SWIR2100']} + {b['NIR']})",
-            bands_required={'NIR': (760, 900), 'SWIR2100': (2095, 2105)},
-            reference='Kaufman et al. 1998 - Smoke detection',
-            theme='atmospheric'
+
+        self.indices_db['PSRI'] = SpectralIndex(
+            name='PSRI',
+            description='Plant Senescence Reflectance Index',
+            formula_template="({RED} - {GREEN}) / {REDEDGE}",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
+            reference='Merzlyak et al. 1999',
+            theme='biochemical'
         )
-        
-        self.indices_db['HAZE'] = SpectralIndex(
-            name='HAZE',
-            description='Haze/Fog Index (visibility reduction)',
-            formula=lambda b: f"({b['GREEN']} - {b['NIR']}) / ({b['GREEN']} + {b['NIR']})",
+
+    def _init_water(self):
+        """Add the water theme indices to the database."""
+        # WATER INDICES
+        # Water body detection and monitoring
+        self.indices_db['NDWI'] = SpectralIndex(
+            name='NDWI',
+            description='Normalized Difference Water Index',
+            formula_template="float({GREEN} - {NIR}) / ({GREEN} + {NIR})",
             bands_required={'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Lee et al. 2006 - Haze detection',
-            theme='atmospheric'
-        )
-        
-        self.indices_db['VOLCANIC_ASH'] = SpectralIndex(
-            name='VOLCANIC_ASH',
-            description='Volcanic Ash Index (ash cloud detection)',
-            formula=lambda b: f"({b['B1100']} - {b['B1200']}) / ({b['B1100']} + {b['B1200']})",
-            bands_required={'B1100': (1095, 1105), 'B1200': (1195, 1205)},
-            reference='Prata and Grant 2001 - Volcanic ash',
-            theme='atmospheric'
+            reference='McFeeters 1996',
+            theme='water',
+            normalize_range=(-1, 1)
         )
-        
-        self.indices_db['AIR_QUALITY'] = SpectralIndex(
-            name='AIR_QUALITY',
-            description='Air Quality Index (overall pollution assessment)',
-            formula=lambda b: f"({b['NO2']} * 0.3 + {b['SO2']} * 0.3 + {b['AEROSOL_OPTICAL']} * 0.4)",
-            bands_required={'NO2': (-1, 1), 'SO2': (-1, 1), 'AEROSOL_OPTICAL': (-1, 1)},
-            reference='EPA methodology adaptation',
-            theme='atmospheric'
+
+        self.indices_db['MNDWI'] = SpectralIndex(
+            name='MNDWI',
+            description='Modified Normalized Difference Water Index',
+            formula_template="float({GREEN} - {SWIR}) / ({GREEN} + {SWIR})",
+            bands_required={'GREEN': (520, 600), 'SWIR': (1550, 1750)},
+            reference='Xu 2006',
+            theme='water',
+            normalize_range=(-1, 1)
         )
-        
-        self.indices_db['INDUSTRIAL_PLUME'] = SpectralIndex(
-            name='INDUSTRIAL_PLUME',
-            description='Industrial Plume Detection Index',
-            formula=lambda b: f"({b['SWIR2200']} - {b['SWIR1600']}) / ({b['SWIR2200']} + {b['SWIR1600']})",
-            bands_required={'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
-            reference='Industrial emission monitoring',
-            theme='atmospheric'
+
+        self.indices_db['NDMI'] = SpectralIndex(
+            name='NDMI',
+            description='Normalized Difference Moisture Index',
+            formula_template="float({NIR} - {SWIR}) / ({NIR} + {SWIR})",
+            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Wilson and Sader 2002',
+            theme='water',
+            normalize_range=(-1, 1)
         )
-        
-        # Textile and Polymer Detection Indices
-        self.indices_db['COTTON'] = SpectralIndex(
-            name='COTTON',
-            description='Cotton Fiber Index (natural cellulose fibers)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['SWIR1700']}) / ({b['SWIR2100']} + {b['SWIR1700']})",
-            bands_required={'SWIR1700': (1695, 1705), 'SWIR2100': (2095, 2105)},
-            reference='Cellulose fiber spectroscopy - Dyer et al. 2010',
-            theme='textiles'
+
+        # Aquatic and Coastal Environment Indices
+        self.indices_db['ALGAE_BLOOM'] = SpectralIndex(
+            name='ALGAE_BLOOM',
+            description='Algae Bloom Index (phytoplankton detection)',
+            formula_template="({GREEN} - {RED}) / ({GREEN} + {RED}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Algal bloom detection - Matthews et al. 2012',
+            theme='water'
         )
-        
-        self.indices_db['POLYESTER'] = SpectralIndex(
-            name='POLYESTER',
-            description='Polyester Fiber Index (PET polymer detection)',
-            formula=lambda b: f"({b['SWIR1720']} - {b['SWIR2300']}) / ({b['SWIR1720']} + {b['SWIR2300']})",
-            bands_required={'SWIR1720': (1715, 1725), 'SWIR2300': (2295, 2305)},
-            reference='Polyester spectral signatures - Zhang et al. 2015',
-            theme='textiles'
+
+        self.indices_db['CYANOBACTERIA'] = SpectralIndex(
+            name='CYANOBACTERIA',
+            description='Cyanobacteria Index (harmful algal blooms)',
+            formula_template="({B550} - {B620}) / ({B550} + {B620}) * (1 + ({B680} - {B550}) / ({B680} + {B550}))",
+            bands_required={'B550': (545, 555), 'B620': (615, 625), 'B680': (675, 685)},
+            reference='Cyanobacteria monitoring - Wynne et al. 2008',
+            theme='water'
         )
-        
-        self.indices_db['NYLON'] = SpectralIndex(
-            name='NYLON',
-            description='Nylon/Polyamide Fiber Index (synthetic polymer detection)',
-            formula=lambda b: f"({b['SWIR1530']} - {b['SWIR2180']}) / ({b['SWIR1530']} + {b['SWIR2180']})",
-            bands_required={'SWIR1530': (1525, 1535), 'SWIR2180': (2175, 2185)},
-            reference='Polyamide fiber analysis - Sasic et al. 2012',
-            theme='textiles'
+
+        self.indices_db['CHLOROPHYLL_A'] = SpectralIndex(
+            name='CHLOROPHYLL_A',
+            description='Chlorophyll-a Concentration Index (water quality)',
+            formula_template="({B670} - {B680}) / ({B670} + {B680}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'B670': (665, 675), 'B680': (675, 685), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference="Chlorophyll-a retrieval - O'Reilly et al. 2000",
+            theme='water'
         )
-        
-        self.indices_db['ARAMID'] = SpectralIndex(
-            name='ARAMID',
-            description='Aramid Fiber Index (Kevlar, Nomex detection)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2270']}) / ({b['SWIR1650']} + {b['SWIR2270']})",
-            bands_required={'SWIR1650': (1645, 1655), 'SWIR2270': (2265, 2275)},
-            reference='Aramid polymer spectroscopy - Bourban et al. 2014',
-            theme='textiles'
+
+        self.indices_db['EUTROPHICATION'] = SpectralIndex(
+            name='EUTROPHICATION',
+            description='Eutrophication Index (nutrient pollution indicator)',
+            formula_template="({GREEN} - {BLUE}) / ({GREEN} + {BLUE}) * (1 + ({RED} - {NIR}) / ({RED} + {NIR}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Eutrophication monitoring - Palmer et al. 2015',
+            theme='water'
         )
-        
-        self.indices_db['LINEN'] = SpectralIndex(
-            name='LINEN',
-            description='Linen Fiber Index (flax natural fibers)',
-            formula=lambda b: f"({b['SWIR2130']} - {b['SWIR1780']}) / ({b['SWIR2130']} + {b['SWIR1780']})",
-            bands_required={'SWIR1780': (1775, 1785), 'SWIR2130': (2125, 2135)},
-            reference='Flax fiber spectral analysis - Hsieh et al. 2011',
-            theme='textiles'
+
+        self.indices_db['TURBIDITY'] = SpectralIndex(
+            name='TURBIDITY',
+            description='Water Turbidity Index (suspended sediments)',
+            formula_template="({RED} - {GREEN}) / ({RED} + {GREEN}) * (1 + ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Turbidity measurement - Dogliotti et al. 2015',
+            theme='water'
         )
-        
-        self.indices_db['WOOL'] = SpectralIndex(
-            name='WOOL',
-            description='Wool Fiber Index (protein-based natural fibers)',
-            formula=lambda b: f"({b['SWIR2170']} - {b['SWIR1690']}) / ({b['SWIR2170']} + {b['SWIR1690']})",
-            bands_required={'SWIR1690': (1685, 1695), 'SWIR2170': (2165, 2175)},
-            reference='Protein fiber spectroscopy - Carr et al. 2008',
-            theme='textiles'
+
+        self.indices_db['SEDIMENTATION'] = SpectralIndex(
+            name='SEDIMENTATION',
+            description='Sedimentation Index (high sediment load in water)',
+            formula_template="({SWIR} - {RED}) / ({SWIR} + {RED}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
+            reference='Sediment load monitoring - Wang et al. 2016',
+            theme='water'
         )
-        
-        self.indices_db['POLYPROPYLENE'] = SpectralIndex(
-            name='POLYPROPYLENE',
-            description='Polypropylene Fiber Index (PP polymer detection)',
-            formula=lambda b: f"({b['SWIR1725']} - {b['SWIR2315']}) / ({b['SWIR1725']} + {b['SWIR2315']})",
-            bands_required={'SWIR1725': (1720, 1730), 'SWIR2315': (2310, 2320)},
-            reference='PP fiber spectral signatures - Liu et al. 2016',
-            theme='textiles'
+
+        self.indices_db['SUSPENDED_SOLIDS'] = SpectralIndex(
+            name='SUSPENDED_SOLIDS',
+            description='Suspended Solids Index (TSS concentration)',
+            formula_template="({RED} - {BLUE}) / ({RED} + {BLUE}) * (1 + ({SWIR} - {NIR}) / ({SWIR} + {NIR}))",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Total suspended solids - Doxaran et al. 2002',
+            theme='water'
         )
-        
-        self.indices_db['ACRYLIC'] = SpectralIndex(
-            name='ACRYLIC',
-            description='Acrylic Fiber Index (synthetic polymer detection)',
-            formula=lambda b: f"({b['SWIR1760']} - {b['SWIR2240']}) / ({b['SWIR1760']} + {b['SWIR2240']})",
-            bands_required={'SWIR1760': (1755, 1765), 'SWIR2240': (2235, 2245)},
-            reference='Acrylic polymer analysis - Wang et al. 2013',
-            theme='textiles'
+
+        self.indices_db['RIVER_BANK'] = SpectralIndex(
+            name='RIVER_BANK',
+            description='River Bank Index (shoreline and riparian zones)',
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='River bank delineation - Frohn et al. 2005',
+            theme='water'
         )
-        
-        self.indices_db['SPANDEX'] = SpectralIndex(
-            name='SPANDEX',
-            description='Spandex/Elastane Fiber Index (polyurethane-based fibers)',
-            formula=lambda b: f"({b['SWIR1705']} - {b['SWIR2330']}) / ({b['SWIR1705']} + {b['SWIR2330']})",
-            bands_required={'SWIR1705': (1700, 1710), 'SWIR2330': (2325, 2335)},
-            reference='Polyurethane fiber spectroscopy - Kim et al. 2017',
-            theme='textiles'
+
+        self.indices_db['SEASHORE'] = SpectralIndex(
+            name='SEASHORE',
+            description='Seashore Index (coastal interface zone)',
+            formula_template="({SWIR} - {BLUE}) / ({SWIR} + {BLUE}) * (1 + ({GREEN} - {NIR}) / ({GREEN} + {NIR}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Coastal zone mapping - Matarrese et al. 2018',
+            theme='water'
         )
-        
-        self.indices_db['MICROPLASTIC'] = SpectralIndex(
-            name='MICROPLASTIC',
-            description='Microplastic Detection Index (general polymer pollution)',
-            formula=lambda b: f"({b['SWIR1730']} - {b['SWIR2200']}) / ({b['SWIR1730']} + {b['SWIR2200']})",
-            bands_required={'SWIR1730': (1725, 1735), 'SWIR2200': (2195, 2205)},
-            reference='Microplastic remote sensing - Zhu et al. 2019',
-            theme='textiles'
+
+        self.indices_db['SHALLOW_WATER'] = SpectralIndex(
+            name='SHALLOW_WATER',
+            description='Shallow Water Index (bathymetry estimation)',
+            formula_template="({BLUE} - {GREEN}) / ({BLUE} + {GREEN}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690)},
+            reference='Shallow water bathymetry - Stumpf et al. 2003',
+            theme='water'
         )
-        
-        self.indices_db['TEXTILE_BLEND'] = SpectralIndex(
-            name='TEXTILE_BLEND',
-            description='Textile Blend Index (mixed fiber detection)',
-            formula=lambda b: f"({b['COTTON']} * 0.4 + {b['POLYESTER']} * 0.3 + {b['NYLON']} * 0.3)",
-            bands_required={'COTTON': (-1, 1), 'POLYESTER': (-1, 1), 'NYLON': (-1, 1)},
-            reference='Textile blend analysis - Martinez et al. 2020',
-            theme='textiles'
+
+        self.indices_db['CORAL_REEF'] = SpectralIndex(
+            name='CORAL_REEF',
+            description='Coral Reef Index (coral health monitoring)',
+            formula_template="({BLUE} - {GREEN}) / ({BLUE} + {GREEN}) * (1 + ({REDEDGE} - {RED}) / ({REDEDGE} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
+            reference='Coral reef monitoring - Mumby et al. 2004',
+            theme='water'
         )
-        
-        self.indices_db['NATURAL_VS_SYNTHETIC'] = SpectralIndex(
-            name='NATURAL_VS_SYNTHETIC',
-            description='Natural vs Synthetic Fiber Index',
-            formula=lambda b: f"({b['COTTON']} + {b['WOOL']} + {b['LINEN']}) - ({b['POLYESTER']} + {b['NYLON']} + {b['POLYPROPYLENE']})",
-            bands_required={'COTTON': (-1, 1), 'WOOL': (-1, 1), 'LINEN': (-1, 1), 'POLYESTER': (-1, 1), 'NYLON': (-1, 1), 'POLYPROPYLENE': (-1, 1)},
-            reference='Fiber classification methodology - Thompson et al. 2018',
-            theme='textiles'
+
+        self.indices_db['SEAGRASS'] = SpectralIndex(
+            name='SEAGRASS',
+            description='Seagrass Index (submerged vegetation)',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) * (1 + ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Seagrass mapping - Phinn et al. 2008',
+            theme='water'
         )
-        
-        # Specialized Vegetation Type Indices
-        self.indices_db['GRASSLAND'] = SpectralIndex(
-            name='GRASSLAND',
-            description='Grassland Vegetation Index (grass-dominated ecosystems)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Grassland monitoring - Guerschman et al. 2009',
-            theme='vegetation'
+
+        self.indices_db['MANGROVE_WATER'] = SpectralIndex(
+            name='MANGROVE_WATER',
+            description='Mangrove Water Interface Index (coastal wetlands)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Mangrove water interface - Giri et al. 2007',
+            theme='water'
         )
-        
-        self.indices_db['FOREST'] = SpectralIndex(
-            name='FOREST',
-            description='Forest Canopy Index (dense woody vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * ({b['NIR']} / {b['RED']})",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Forest canopy analysis - Hansen et al. 2002',
-            theme='vegetation'
+
+        self.indices_db['WATER_CLARITY'] = SpectralIndex(
+            name='WATER_CLARITY',
+            description='Water Clarity Index (transparency measurement)',
+            formula_template="({BLUE} - {SWIR}) / ({BLUE} + {SWIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
+            reference='Water clarity assessment - Olmanson et al. 2008',
+            theme='water'
         )
-        
-        self.indices_db['CROP'] = SpectralIndex(
-            name='CROP',
-            description='Agricultural Crop Index (cropland vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.5 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Crop monitoring - Gitelson et al. 2002',
-            theme='vegetation'
+
+        self.indices_db['COLORED_DISSOLVED_ORGANIC'] = SpectralIndex(
+            name='COLORED_DISSOLVED_ORGANIC',
+            description='Colored Dissolved Organic Matter Index (CDOM)',
+            formula_template="({B440} - {B490}) / ({B440} + {B490}) * (1 + ({B550} - {B670}) / ({B550} + {B670}))",
+            bands_required={'B440': (435, 445), 'B490': (485, 495), 'B550': (545, 555), 'B670': (665, 675)},
+            reference='CDOM detection - Brezonik et al. 2015',
+            theme='water'
         )
-        
-        self.indices_db['WETLAND'] = SpectralIndex(
-            name='WETLAND',
-            description='Wetland Vegetation Index (water-saturated vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * ({b['GREEN']} / {b['RED']})",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Wetland vegetation detection - Adam et al. 2010',
-            theme='vegetation'
+
+        self.indices_db['FLOATING_VEGETATION'] = SpectralIndex(
+            name='FLOATING_VEGETATION',
+            description='Floating Vegetation Index (water hyacinth, duckweed)',
+            formula_template="({NIR} - {GREEN}) / ({NIR} + {GREEN}) * (1 + ({RED} - {BLUE}) / ({RED} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Floating aquatic vegetation - Dierssen et al. 2013',
+            theme='water'
         )
-        
-        self.indices_db['SHRUBLAND'] = SpectralIndex(
-            name='SHRUBLAND',
-            description='Shrubland Vegetation Index (medium-height woody vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - abs({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Shrubland mapping - Jansen et al. 2006',
-            theme='vegetation'
+
+        # Irrigation Detection Indices
+        self.indices_db['IRRIGATION_CANAL'] = SpectralIndex(
+            name='IRRIGATION_CANAL',
+            description='Irrigation Canal Index (water distribution channels)',
+            formula_template="({GREEN} - {NIR}) / ({GREEN} + {NIR}) * (1 + ({BLUE} - {RED}) / ({BLUE} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Irrigation canal mapping - Thenkabail et al. 2009',
+            theme='water'
         )
-        
-        self.indices_db['MANGROVE'] = SpectralIndex(
-            name='MANGROVE',
-            description='Mangrove Forest Index (coastal forest vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * (1 + ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Mangrove monitoring - Giri et al. 2007',
-            theme='vegetation'
+
+        self.indices_db['PIVOT_IRRIGATION'] = SpectralIndex(
+            name='PIVOT_IRRIGATION',
+            description='Pivot Irrigation Index (center-pivot sprinkler systems)',
+            formula_template="({SWIR} - {GREEN}) / ({SWIR} + {GREEN}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Center-pivot irrigation detection - Ozdogan et al. 2010',
+            theme='water'
         )
-        
-        self.indices_db['TUNDRA'] = SpectralIndex(
-            name='TUNDRA',
-            description='Tundra Vegetation Index (arctic vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Tundra vegetation analysis - Walker et al. 2005',
-            theme='vegetation'
+
+        self.indices_db['DRIP_IRRIGATION'] = SpectralIndex(
+            name='DRIP_IRRIGATION',
+            description='Drip Irrigation Index (micro-irrigation systems)',
+            formula_template="({SWIR2200} - {RED}) / ({SWIR2200} + {RED}) * (1 + ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2200': (2195, 2205)},
+            reference='Drip irrigation detection - Daccache et al. 2014',
+            theme='water'
         )
-        
-        self.indices_db['SAVANNA'] = SpectralIndex(
-            name='SAVANNA',
-            description='Savanna Vegetation Index (grass-tree mixed ecosystems)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.3 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Savanna ecosystem monitoring - Bucini et al. 2006',
-            theme='vegetation'
+
+        self.indices_db['FLOOD_IRRIGATION'] = SpectralIndex(
+            name='FLOOD_IRRIGATION',
+            description='Flood Irrigation Index (flooded field systems)',
+            formula_template="({GREEN} - {SWIR}) / ({GREEN} + {SWIR}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Flood irrigation mapping - Bousbih et al. 2018',
+            theme='water'
         )
-        
-        self.indices_db['ALPINE'] = SpectralIndex(
-            name='ALPINE',
-            description='Alpine Vegetation Index (high-altitude vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.2 * ({b['BLUE']} - {b['RED']}) / ({b['BLUE']} + {b['RED']}))",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Alpine vegetation studies - Körner 2003',
-            theme='vegetation'
+
+        self.indices_db['IRRIGATION_POND'] = SpectralIndex(
+            name='IRRIGATION_POND',
+            description='Irrigation Pond Index (water storage for agriculture)',
+            formula_template="({BLUE} - {SWIR}) / ({BLUE} + {SWIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
+            reference='Irrigation pond detection - Velpuri et al. 2017',
+            theme='water'
         )
-        
-        self.indices_db['DESERT_VEGETATION'] = SpectralIndex(
-            name='DESERT_VEGETATION',
-            description='Desert Vegetation Index (arid-adapted plants)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Desert vegetation monitoring - Elmore et al. 2006',
-            theme='vegetation'
+
+        self.indices_db['SPRINKLER_SYSTEM'] = SpectralIndex(
+            name='SPRINKLER_SYSTEM',
+            description='Sprinkler System Index (sprinkler irrigation infrastructure)',
+            formula_template="({SWIR2100} - {GREEN}) / ({SWIR2100} + {GREEN}) * (1 + ({RED} - {BLUE}) / ({RED} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2100': (2095, 2105)},
+            reference='Sprinkler system detection - Kuenzer et al. 2012',
+            theme='water'
         )
-        
-        self.indices_db['RAINFOREST'] = SpectralIndex(
-            name='RAINFOREST',
-            description='Tropical Rainforest Index (dense broadleaf evergreen)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * ({b['NIR']} / {b['GREEN']})",
-            bands_required={'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Rainforest canopy analysis - Asner et al. 2002',
-            theme='vegetation'
+
+        self.indices_db['IRRIGATION_INFRASTRUCTURE'] = SpectralIndex(
+            name='IRRIGATION_INFRASTRUCTURE',
+            description='Irrigation Infrastructure Index (general irrigation facilities)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Irrigation infrastructure mapping - Dwarakish et al. 2015',
+            theme='water'
         )
-        
-        self.indices_db['CONIFEROUS'] = SpectralIndex(
-            name='CONIFEROUS',
-            description='Coniferous Forest Index (needle-leaf evergreen)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Coniferous forest detection - Wolter et al. 1995',
-            theme='vegetation'
+
+        self.indices_db['WELL_IRRIGATION'] = SpectralIndex(
+            name='WELL_IRRIGATION',
+            description='Well Irrigation Index (groundwater extraction points)',
+            formula_template="({SWIR2200} - {BLUE}) / ({SWIR2200} + {BLUE}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2200': (2195, 2205)},
+            reference='Well irrigation detection - Shah et al. 2013',
+            theme='water'
         )
-        
-        self.indices_db['DECIDUOUS'] = SpectralIndex(
-            name='DECIDUOUS',
-            description='Deciduous Forest Index (broadleaf seasonal)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Deciduous forest phenology - Zhang et al. 2003',
-            theme='vegetation'
+
+        self.indices_db['RIVER_LIFT_IRRIGATION'] = SpectralIndex(
+            name='RIVER_LIFT_IRRIGATION',
+            description='River Lift Irrigation Index (river water pumping systems)',
+            formula_template="({SWIR} - {GREEN}) / ({SWIR} + {GREEN}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='River lift irrigation mapping - Bhanja et al. 2019',
+            theme='water'
         )
-        
-        self.indices_db['C4_GRASS'] = SpectralIndex(
-            name='C4_GRASS',
-            description='C4 Grass Index (tropical grasses, maize, sorghum)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.4 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='C4 grassland ecology - Still et al. 2003',
-            theme='vegetation'
+
+        self.indices_db['IRRIGATION_TIMING'] = SpectralIndex(
+            name='IRRIGATION_TIMING',
+            description='Irrigation Timing Index (recent vs. old irrigation)',
+            formula_template="({SWIR1650} - {SWIR2100}) / ({SWIR1650} + {SWIR2100}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2100': (2095, 2105)},
+            reference='Irrigation timing detection - Biggs et al. 2016',
+            theme='water'
         )
-        
-        self.indices_db['C3_VEGETATION'] = SpectralIndex(
-            name='C3_VEGETATION',
-            description='C3 Vegetation Index (temperate plants, wheat, rice)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.3 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='C3 plant physiology - Ehleringer et al. 1997',
-            theme='vegetation'
+
+        self.indices_db['IRRIGATION_EFFICIENCY'] = SpectralIndex(
+            name='IRRIGATION_EFFICIENCY',
+            description='Irrigation Efficiency Index (water use efficiency)',
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Irrigation efficiency assessment - Perry et al. 2017',
+            theme='water'
         )
-        
-        # Specific Plant Species and Crop Type Identification Indices
-        self.indices_db['WHEAT'] = SpectralIndex(
-            name='WHEAT',
-            description='Wheat Crop Index (Triticum aestivum)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.2 * ({b['SWIR1650']} - {b['SWIR2200']}) / ({b['SWIR1650']} + {b['SWIR2200']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
-            reference='Wheat spectral signatures - Thenkabail et al. 2000',
-            theme='vegetation'
+
+    def _init_soil(self):
+        """Add the soil theme indices to the database."""
+        # SOIL INDICES
+        # Soil properties and composition
+        self.indices_db['BI'] = SpectralIndex(
+            name='BI',
+            description='Brightness Index',
+            formula_template="sqrt(({RED}^2 + {GREEN}^2) / 2)",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
+            reference='Escadafal et al. 1994',
+            theme='soil'
         )
-        
-        self.indices_db['CORN'] = SpectralIndex(
-            name='CORN',
-            description='Corn/Maize Crop Index (Zea mays)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.3 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Maize crop monitoring - Gitelson et al. 2003',
-            theme='vegetation'
+
+        self.indices_db['CI'] = SpectralIndex(
+            name='CI',
+            description='Coloration Index',
+            formula_template="({RED} - {GREEN}) / {RED}",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
+            reference='Escadafal et al. 1994',
+            theme='soil'
         )
-        
-        self.indices_db['SOYBEAN'] = SpectralIndex(
-            name='SOYBEAN',
-            description='Soybean Crop Index (Glycine max)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.15 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Soybean spectral analysis - Penuelas et al. 1997',
-            theme='vegetation'
+
+        self.indices_db['RI'] = SpectralIndex(
+            name='RI',
+            description='Redness Index',
+            formula_template="{RED}^2 / ({GREEN}^3)",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690)},
+            reference='Madeira et al. 1997',
+            theme='soil'
         )
-        
-        self.indices_db['RICE'] = SpectralIndex(
-            name='RICE',
-            description='Rice Crop Index (Oryza sativa)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.25 * ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Rice paddy monitoring - Wang et al. 2005',
-            theme='vegetation'
+
+        # Additional Soil Identification Indices
+        self.indices_db['IRON_OXIDE'] = SpectralIndex(
+            name='IRON_OXIDE',
+            description='Iron Oxide Soil Index (hematite, goethite)',
+            formula_template="({RED} / {BLUE})",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690)},
+            reference='Madeira et al. 1997',
+            theme='soil'
         )
-        
-        self.indices_db['COTTON_CROP'] = SpectralIndex(
-            name='COTTON_CROP',
-            description='Cotton Crop Index (Gossypium hirsutum)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.4 * ({b['SWIR2100']} - {b['SWIR1700']}) / ({b['SWIR2100']} + {b['SWIR1700']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1700': (1695, 1705), 'SWIR2100': (2095, 2105)},
-            reference='Cotton crop detection - Yang et al. 2009',
-            theme='vegetation'
+
+        self.indices_db['SOIL_MOISTURE'] = SpectralIndex(
+            name='SOIL_MOISTURE',
+            description='Soil Moisture Index',
+            formula_template="({SWIR1650} - {SWIR2200}) / ({SWIR1650} + {SWIR2200})",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
+            reference='Whiting et al. 2004',
+            theme='soil'
         )
-        
-        self.indices_db['SUGARCANE'] = SpectralIndex(
-            name='SUGARCANE',
-            description='Sugarcane Crop Index (Saccharum officinarum)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.35 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Sugarcane spectral signatures - Fortes et al. 2005',
-            theme='vegetation'
+
+        self.indices_db['ORGANIC_SOIL'] = SpectralIndex(
+            name='ORGANIC_SOIL',
+            description='Organic Matter Soil Index',
+            formula_template="log({RED} / {NIR})",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Baumgardner et al. 1985',
+            theme='soil'
         )
-        
-        self.indices_db['OAK'] = SpectralIndex(
-            name='OAK',
-            description='Oak Tree Species Index (Quercus spp.)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.1 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Oak species identification - Martin et al. 1998',
-            theme='vegetation'
+
+        self.indices_db['SALINITY'] = SpectralIndex(
+            name='SALINITY',
+            description='Soil Salinity Index',
+            formula_template="sqrt(({RED} - {GREEN})^2 + ({GREEN} - {BLUE})^2 + ({BLUE} - {RED})^2)",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690)},
+            reference='Dehaan and Taylor 2002',
+            theme='soil'
         )
-        
-        self.indices_db['PINE'] = SpectralIndex(
-            name='PINE',
-            description='Pine Tree Species Index (Pinus spp.)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.2 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Pine forest analysis - Jensen et al. 1999',
-            theme='vegetation'
+
+        self.indices_db['CRUST'] = SpectralIndex(
+            name='CRUST',
+            description='Soil Crust Index (biological/physical crusts)',
+            formula_template="({REDEDGE} - {RED}) / ({REDEDGE} + {RED})",
+            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730)},
+            reference='Karnieli et al. 2001',
+            theme='soil'
         )
-        
-        self.indices_db['MAPLE'] = SpectralIndex(
-            name='MAPLE',
-            description='Maple Tree Species Index (Acer spp.)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.15 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Maple species detection - Schlerf et al. 2005',
-            theme='vegetation'
+
+        # Geotechnical and Bearing Capacity Indices
+        self.indices_db['CLAY_SWELL'] = SpectralIndex(
+            name='CLAY_SWELL',
+            description='Clay Swelling Potential Index (smectite/montmorillonite expansion)',
+            formula_template="({SWIR1900} - {SWIR2200}) / ({SWIR1900} + {SWIR2200})",
+            bands_required={'SWIR1900': (1895, 1905), 'SWIR2200': (2195, 2205)},
+            reference='Chabrillat et al. 2002 - Geotechnical applications',
+            theme='soil'
         )
-        
-        self.indices_db['EUCALYPTUS'] = SpectralIndex(
-            name='EUCALYPTUS',
-            description='Eucalyptus Tree Index (Eucalyptus spp.)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.3 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Eucalyptus plantation monitoring - Lucas et al. 2000',
-            theme='vegetation'
+
+        self.indices_db['MOISTURE_CONTENT'] = SpectralIndex(
+            name='MOISTURE_CONTENT',
+            description='Soil Moisture Content Index (volumetric water content estimation)',
+            formula_template="({SWIR1650} - {SWIR2100}) / ({SWIR1650} + {SWIR2100})",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR2100': (2095, 2105)},
+            reference='Whiting et al. 2004 - Soil moisture estimation',
+            theme='soil'
         )
-        
-        self.indices_db['PALM'] = SpectralIndex(
-            name='PALM',
-            description='Palm Tree Index (Arecaceae family)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.25 * ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Palm oil plantation detection - Thenkabail et al. 2004',
-            theme='vegetation'
+
+        self.indices_db['BEARING_CAPACITY'] = SpectralIndex(
+            name='BEARING_CAPACITY',
+            description='Soil Bearing Capacity Index (estimated in kPa)',
+            formula_template="1000 * (1 - ({MOISTURE_CONTENT} * 0.8 + {CLAY_SWELL} * 0.6))",
+            bands_required={'MOISTURE_CONTENT': (0, 1), 'CLAY_SWELL': (-1, 1)},
+            reference='Empirical relationship - ASTM D2487 adaptations',
+            theme='soil'
         )
-        
-        self.indices_db['GRAPEVINE'] = SpectralIndex(
-            name='GRAPEVINE',
-            description='Grapevine/Vineyard Index (Vitis vinifera)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.2 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Vineyard monitoring - Johnson et al. 2003',
-            theme='vegetation'
+
+        self.indices_db['PLASTICITY_INDEX'] = SpectralIndex(
+            name='PLASTICITY_INDEX',
+            description='Soil Plasticity Index (Atterberg limits estimation)',
+            formula_template="50 * {CLAY_SWELL} + 30 * {MOISTURE_CONTENT}",
+            bands_required={'CLAY_SWELL': (-1, 1), 'MOISTURE_CONTENT': (0, 1)},
+            reference='Spectral estimation of Atterberg limits',
+            theme='soil'
         )
-        
-        self.indices_db['CITRUS'] = SpectralIndex(
-            name='CITRUS',
-            description='Citrus Orchard Index (Citrus spp.)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.15 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Citrus grove detection - Ye et al. 2006',
-            theme='vegetation'
+
+        self.indices_db['SHEAR_STRENGTH'] = SpectralIndex(
+            name='SHEAR_STRENGTH',
+            description='Soil Shear Strength Index (kPa estimation)',
+            formula_template="500 * (1 - {MOISTURE_CONTENT}) * (1 - abs({CLAY_SWELL}))",
+            bands_required={'MOISTURE_CONTENT': (0, 1), 'CLAY_SWELL': (-1, 1)},
+            reference='Geotechnical strength estimation from spectral data',
+            theme='soil'
         )
-        
-        self.indices_db['OLIVE'] = SpectralIndex(
-            name='OLIVE',
-            description='Olive Tree Index (Olea europaea)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.1 * ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference="Olive orchard monitoring - D'Urso et al. 2010",
-            theme='vegetation'
+
+        self.indices_db['SMECTITE_RATIO'] = SpectralIndex(
+            name='SMECTITE_RATIO',
+            description='Smectite to Kaolinite Ratio (swelling clay indicator)',
+            formula_template="({SWIR2200} - {SWIR2100}) / ({SWIR2200} + {SWIR2100})",
+            bands_required={'SWIR2100': (2095, 2105), 'SWIR2200': (2195, 2205)},
+            reference='Van der Meer et al. 2002 - Clay mineralogy',
+            theme='soil'
         )
-        
-        self.indices_db['COFFEE'] = SpectralIndex(
-            name='COFFEE',
-            description='Coffee Plantation Index (Coffea spp.)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.2 * ({b['SWIR1650']} - {b['SWIR2200']}) / ({b['SWIR1650']} + {b['SWIR2200']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
-            reference='Coffee plantation detection - Bernards et al. 2006',
-            theme='vegetation'
+
+        # Non-Irrigated Yield Prediction Indices
+        self.indices_db['SOIL_MOISTURE_DEFICIT'] = SpectralIndex(
+            name='SOIL_MOISTURE_DEFICIT',
+            description='Soil Moisture Deficit Index (water stress in rain-fed areas)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + 0.3 * ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Soil moisture deficit - Wang et al. 2009',
+            theme='soil'
         )
-        
-        self.indices_db['COCOA'] = SpectralIndex(
-            name='COCOA',
-            description='Cocoa Plantation Index (Theobroma cacao)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.25 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Cocoa farm monitoring - Román et al. 2008',
-            theme='vegetation'
+
+    def _init_urban(self):
+        """Add the urban theme indices to the database."""
+        # URBAN/BUILT-UP INDICES
+        # Built-up area and urban feature detection
+        self.indices_db['NDBI'] = SpectralIndex(
+            name='NDBI',
+            description='Normalized Difference Built-up Index',
+            formula_template="float({SWIR} - {NIR}) / ({SWIR} + {NIR})",
+            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Zha et al. 2003',
+            theme='urban',
+            normalize_range=(-1, 1)
         )
-        
-        self.indices_db['TEA'] = SpectralIndex(
-            name='TEA',
-            description='Tea Plantation Index (Camellia sinensis)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.3 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Tea garden detection - Li et al. 2007',
-            theme='vegetation'
+
+        self.indices_db['UI'] = SpectralIndex(
+            name='UI',
+            description='Urban Index',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR})",
+            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Kawamura et al. 1996',
+            theme='urban'
         )
-        
+
         # Infrastructure and Emergency Detection Indices
         self.indices_db['PHOTOVOLTAIC'] = SpectralIndex(
             name='PHOTOVOLTAIC',
             description='Photovoltaic Panel Index (solar panel detection)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['BLUE']}) / ({b['SWIR2200']} + {b['BLUE']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
+            formula_template="({SWIR2200} - {BLUE}) / ({SWIR2200} + {BLUE}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
             bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
             reference='Solar panel detection - Kwan et al. 2019',
             theme='urban'
         )
-        
+
         self.indices_db['SOLAR_FARM'] = SpectralIndex(
             name='SOLAR_FARM',
             description='Solar Farm Index (large-scale photovoltaic installations)',
-            formula=lambda b: f"({b['SWIR2300']} - {b['GREEN']}) / ({b['SWIR2300']} + {b['GREEN']}) * (1 + abs({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}))",
+            formula_template="({SWIR2300} - {GREEN}) / ({SWIR2300} + {GREEN}) * (1 + abs({NIR} - {SWIR}) / ({NIR} + {SWIR}))",
             bands_required={'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750), 'SWIR2300': (2295, 2305)},
             reference='Solar farm mapping - Zhang et al. 2020',
             theme='urban'
         )
-        
+
         self.indices_db['EMERGENCY_TENT'] = SpectralIndex(
             name='EMERGENCY_TENT',
             description='Emergency Tent Index (humanitarian relief shelters)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['RED']}) / ({b['SWIR2100']} + {b['RED']}) * (1 + ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
+            formula_template="({SWIR2100} - {RED}) / ({SWIR2100} + {RED}) * (1 + ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2100': (2095, 2105)},
             reference='Emergency shelter detection - Giordan et al. 2018',
             theme='urban'
         )
-        
+
         self.indices_db['REFUGEE_CAMP'] = SpectralIndex(
             name='REFUGEE_CAMP',
             description='Refugee Camp Index (temporary settlement detection)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
             reference='Refugee camp monitoring - Kienberger et al. 2017',
             theme='urban'
         )
-        
+
         self.indices_db['TEMPORARY_SHELTER'] = SpectralIndex(
             name='TEMPORARY_SHELTER',
-            description='Temporary Shelter Index (temporary housing structures)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['BLUE']}) / ({b['SWIR1650']} + {b['BLUE']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR1650': (1645, 1655)},
-            reference='Temporary housing detection - Tenerelli et al. 2020',
-            theme='urban'
-        )
-        
-        self.indices_db['DISASTER_RELIEF'] = SpectralIndex(
-            name='DISASTER_RELIEF',
-            description='Disaster Relief Infrastructure Index (emergency facilities)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['GREEN']}) / ({b['SWIR2200']} + {b['GREEN']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
-            reference='Disaster response infrastructure - Voigt et al. 2016',
-            theme='urban'
-        )
-        
-        self.indices_db['MEDICAL_TENT'] = SpectralIndex(
-            name='MEDICAL_TENT',
-            description='Medical Tent Index (field hospitals and clinics)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['WHITE']}) / ({b['SWIR2100']} + {b['WHITE']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'WHITE': (650, 680), 'SWIR2100': (2095, 2105)},
-            reference='Field hospital detection - Kuffer et al. 2018',
-            theme='urban'
-        )
-        
-        self.indices_db['CONSTRUCTION_SITE'] = SpectralIndex(
-            name='CONSTRUCTION_SITE',
-            description='Construction Site Index (temporary construction infrastructure)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Construction site monitoring - Weng et al. 2019',
-            theme='urban'
-        )
-        
-        self.indices_db['TEMPORARY_ROAD'] = SpectralIndex(
-            name='TEMPORARY_ROAD',
-            description='Temporary Road Index (access roads and temporary infrastructure)',
-            formula=lambda b: f"({b['SWIR']} - {b['RED']}) / ({b['SWIR']} + {b['RED']}) * (1 - ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
-            reference='Temporary infrastructure mapping - Vatsavai et al. 2017',
-            theme='urban'
-        )
-        
-        self.indices_db['WIND_TURBINE'] = SpectralIndex(
-            name='WIND_TURBINE',
-            description='Wind Turbine Index (wind energy infrastructure)',
-            formula=lambda b: f"({b['SWIR2300']} - {b['NIR']}) / ({b['SWIR2300']} + {b['NIR']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2300': (2295, 2305)},
-            reference='Wind turbine detection - Manfreda et al. 2011',
-            theme='urban'
-        )
-        
-        self.indices_db['COMMUNICATION_TOWER'] = SpectralIndex(
-            name='COMMUNICATION_TOWER',
-            description='Communication Tower Index (telecom infrastructure)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['RED']}) / ({b['SWIR2200']} + {b['RED']}) * (1 + ({b['NIR']} - {b['GREEN']}) / ({b['NIR']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
-            reference='Telecom tower detection - Jensen et al. 2015',
-            theme='urban'
-        )
-        
-        self.indices_db['PORTABLE_GENERATOR'] = SpectralIndex(
-            name='PORTABLE_GENERATOR',
-            description='Portable Generator Index (temporary power infrastructure)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['METALLIC']}) / ({b['SWIR2100']} + {b['METALLIC']}) * (1 + ({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'METALLIC': (550, 650), 'SWIR2100': (2095, 2105)},
-            reference='Power infrastructure detection - Kemper et al. 2014',
-            theme='urban'
-        )
-        
-        self.indices_db['WATER_TANK'] = SpectralIndex(
-            name='WATER_TANK',
-            description='Water Tank Index (temporary water storage)',
-            formula=lambda b: f"({b['SWIR']} - {b['GREEN']}) / ({b['SWIR']} + {b['GREEN']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Water storage facility detection - Sliuzas et al. 2019',
-            theme='urban'
-        )
-        
-        self.indices_db['FOOD_DISTRIBUTION'] = SpectralIndex(
-            name='FOOD_DISTRIBUTION',
-            description='Food Distribution Center Index (emergency food facilities)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['WHITE']}) / ({b['SWIR2200']} + {b['WHITE']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'WHITE': (650, 680), 'SWIR2200': (2195, 2205)},
-            reference='Emergency food facility mapping - Brown et al. 2018',
-            theme='urban'
-        )
-        
-        # Aquatic and Coastal Environment Indices
-        self.indices_db['ALGAE_BLOOM'] = SpectralIndex(
-            name='ALGAE_BLOOM',
-            description='Algae Bloom Index (phytoplankton detection)',
-            formula=lambda b: f"({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Algal bloom detection - Matthews et al. 2012',
-            theme='water'
-        )
-        
-        self.indices_db['CYANOBACTERIA'] = SpectralIndex(
-            name='CYANOBACTERIA',
-            description='Cyanobacteria Index (harmful algal blooms)',
-            formula=lambda b: f"({b['B550']} - {b['B620']}) / ({b['B550']} + {b['B620']}) * (1 + ({b['B680']} - {b['B550']}) / ({b['B680']} + {b['B550']}))",
-            bands_required={'B550': (545, 555), 'B620': (615, 625), 'B680': (675, 685)},
-            reference='Cyanobacteria monitoring - Wynne et al. 2008',
-            theme='water'
-        )
-        
-        self.indices_db['CHLOROPHYLL_A'] = SpectralIndex(
-            name='CHLOROPHYLL_A',
-            description='Chlorophyll-a Concentration Index (water quality)',
-            formula=lambda b: f"({b['B670']} - {b['B680']}) / ({b['B670']} + {b['B680']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'B670': (665, 675), 'B680': (675, 685), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference="Chlorophyll-a retrieval - O'Reilly et al. 2000",
-            theme='water'
-        )
-        
-        self.indices_db['EUTROPHICATION'] = SpectralIndex(
-            name='EUTROPHICATION',
-            description='Eutrophication Index (nutrient pollution indicator)',
-            formula=lambda b: f"({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}) * (1 + ({b['RED']} - {b['NIR']}) / ({b['RED']} + {b['NIR']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Eutrophication monitoring - Palmer et al. 2015',
-            theme='water'
-        )
-        
-        self.indices_db['TURBIDITY'] = SpectralIndex(
-            name='TURBIDITY',
-            description='Water Turbidity Index (suspended sediments)',
-            formula=lambda b: f"({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}) * (1 + ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Turbidity measurement - Dogliotti et al. 2015',
-            theme='water'
-        )
-        
-        self.indices_db['SEDIMENTATION'] = SpectralIndex(
-            name='SEDIMENTATION',
-            description='Sedimentation Index (high sediment load in water)',
-            formula=lambda b: f"({b['SWIR']} - {b['RED']}) / ({b['SWIR']} + {b['RED']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
-            reference='Sediment load monitoring - Wang et al. 2016',
-            theme='water'
-        )
-        
-        self.indices_db['SUSPENDED_SOLIDS'] = SpectralIndex(
-            name='SUSPENDED_SOLIDS',
-            description='Suspended Solids Index (TSS concentration)',
-            formula=lambda b: f"({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']}) * (1 + ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Total suspended solids - Doxaran et al. 2002',
-            theme='water'
-        )
-        
-        self.indices_db['RIVER_BANK'] = SpectralIndex(
-            name='RIVER_BANK',
-            description='River Bank Index (shoreline and riparian zones)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='River bank delineation - Frohn et al. 2005',
-            theme='water'
-        )
-        
-        self.indices_db['SEASHORE'] = SpectralIndex(
-            name='SEASHORE',
-            description='Seashore Index (coastal interface zone)',
-            formula=lambda b: f"({b['SWIR']} - {b['BLUE']}) / ({b['SWIR']} + {b['BLUE']}) * (1 + ({b['GREEN']} - {b['NIR']}) / ({b['GREEN']} + {b['NIR']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Coastal zone mapping - Matarrese et al. 2018',
-            theme='water'
-        )
-        
-        self.indices_db['SHALLOW_WATER'] = SpectralIndex(
-            name='SHALLOW_WATER',
-            description='Shallow Water Index (bathymetry estimation)',
-            formula=lambda b: f"({b['BLUE']} - {b['GREEN']}) / ({b['BLUE']} + {b['GREEN']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690)},
-            reference='Shallow water bathymetry - Stumpf et al. 2003',
-            theme='water'
+            description='Temporary Shelter Index (temporary housing structures)',
+            formula_template="({SWIR1650} - {BLUE}) / ({SWIR1650} + {BLUE}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
+            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR1650': (1645, 1655)},
+            reference='Temporary housing detection - Tenerelli et al. 2020',
+            theme='urban'
         )
-        
-        self.indices_db['CORAL_REEF'] = SpectralIndex(
-            name='CORAL_REEF',
-            description='Coral Reef Index (coral health monitoring)',
-            formula=lambda b: f"({b['BLUE']} - {b['GREEN']}) / ({b['BLUE']} + {b['GREEN']}) * (1 + ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
-            reference='Coral reef monitoring - Mumby et al. 2004',
-            theme='water'
+
+        self.indices_db['DISASTER_RELIEF'] = SpectralIndex(
+            name='DISASTER_RELIEF',
+            description='Disaster Relief Infrastructure Index (emergency facilities)',
+            formula_template="({SWIR2200} - {GREEN}) / ({SWIR2200} + {GREEN}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
+            reference='Disaster response infrastructure - Voigt et al. 2016',
+            theme='urban'
         )
-        
-        self.indices_db['SEAGRASS'] = SpectralIndex(
-            name='SEAGRASS',
-            description='Seagrass Index (submerged vegetation)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Seagrass mapping - Phinn et al. 2008',
-            theme='water'
+
+        self.indices_db['MEDICAL_TENT'] = SpectralIndex(
+            name='MEDICAL_TENT',
+            description='Medical Tent Index (field hospitals and clinics)',
+            formula_template="({SWIR2100} - {WHITE}) / ({SWIR2100} + {WHITE}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'WHITE': (650, 680), 'SWIR2100': (2095, 2105)},
+            reference='Field hospital detection - Kuffer et al. 2018',
+            theme='urban'
         )
-        
-        self.indices_db['MANGROVE_WATER'] = SpectralIndex(
-            name='MANGROVE_WATER',
-            description='Mangrove Water Interface Index (coastal wetlands)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Mangrove water interface - Giri et al. 2007',
-            theme='water'
+
+        self.indices_db['CONSTRUCTION_SITE'] = SpectralIndex(
+            name='CONSTRUCTION_SITE',
+            description='Construction Site Index (temporary construction infrastructure)',
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({RED} - {BLUE}) / ({RED} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Construction site monitoring - Weng et al. 2019',
+            theme='urban'
         )
-        
-        self.indices_db['WATER_CLARITY'] = SpectralIndex(
-            name='WATER_CLARITY',
-            description='Water Clarity Index (transparency measurement)',
-            formula=lambda b: f"({b['BLUE']} - {b['SWIR']}) / ({b['BLUE']} + {b['SWIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
+
+        self.indices_db['TEMPORARY_ROAD'] = SpectralIndex(
+            name='TEMPORARY_ROAD',
+            description='Temporary Road Index (access roads and temporary infrastructure)',
+            formula_template="({SWIR} - {RED}) / ({SWIR} + {RED}) * (1 - ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
-            reference='Water clarity assessment - Olmanson et al. 2008',
-            theme='water'
-        )
-        
-        self.indices_db['COLORED_DISSOLVED_ORGANIC'] = SpectralIndex(
-            name='COLORED_DISSOLVED_ORGANIC',
-            description='Colored Dissolved Organic Matter Index (CDOM)',
-            formula=lambda b: f"({b['B440']} - {b['B490']}) / ({b['B440']} + {b['B490']}) * (1 + ({b['B550']} - {b['B670']}) / ({b['B550']} + {b['B670']}))",
-            bands_required={'B440': (435, 445), 'B490': (485, 495), 'B550': (545, 555), 'B670': (665, 675)},
-            reference='CDOM detection - Brezonik et al. 2015',
-            theme='water'
+            reference='Temporary infrastructure mapping - Vatsavai et al. 2017',
+            theme='urban'
         )
-        
-        self.indices_db['FLOATING_VEGETATION'] = SpectralIndex(
-            name='FLOATING_VEGETATION',
-            description='Floating Vegetation Index (water hyacinth, duckweed)',
-            formula=lambda b: f"({b['NIR']} - {b['GREEN']}) / ({b['NIR']} + {b['GREEN']}) * (1 + ({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Floating aquatic vegetation - Dierssen et al. 2013',
-            theme='water'
+
+        self.indices_db['WIND_TURBINE'] = SpectralIndex(
+            name='WIND_TURBINE',
+            description='Wind Turbine Index (wind energy infrastructure)',
+            formula_template="({SWIR2300} - {NIR}) / ({SWIR2300} + {NIR}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2300': (2295, 2305)},
+            reference='Wind turbine detection - Manfreda et al. 2011',
+            theme='urban'
         )
-        
-        # Irrigation Detection Indices
-        self.indices_db['IRRIGATED_CROP'] = SpectralIndex(
-            name='IRRIGATED_CROP',
-            description='Irrigated Crop Index (detecting irrigated agriculture)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Irrigated crop detection - Ambika et al. 2016',
-            theme='vegetation'
+
+        self.indices_db['COMMUNICATION_TOWER'] = SpectralIndex(
+            name='COMMUNICATION_TOWER',
+            description='Communication Tower Index (telecom infrastructure)',
+            formula_template="({SWIR2200} - {RED}) / ({SWIR2200} + {RED}) * (1 + ({NIR} - {GREEN}) / ({NIR} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
+            reference='Telecom tower detection - Jensen et al. 2015',
+            theme='urban'
         )
-        
-        self.indices_db['IRRIGATION_CANAL'] = SpectralIndex(
-            name='IRRIGATION_CANAL',
-            description='Irrigation Canal Index (water distribution channels)',
-            formula=lambda b: f"({b['GREEN']} - {b['NIR']}) / ({b['GREEN']} + {b['NIR']}) * (1 + ({b['BLUE']} - {b['RED']}) / ({b['BLUE']} + {b['RED']}))",
-            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Irrigation canal mapping - Thenkabail et al. 2009',
-            theme='water'
+
+        self.indices_db['PORTABLE_GENERATOR'] = SpectralIndex(
+            name='PORTABLE_GENERATOR',
+            description='Portable Generator Index (temporary power infrastructure)',
+            formula_template="({SWIR2100} - {METALLIC}) / ({SWIR2100} + {METALLIC}) * (1 + ({RED} - {BLUE}) / ({RED} + {BLUE}))",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690), 'METALLIC': (550, 650), 'SWIR2100': (2095, 2105)},
+            reference='Power infrastructure detection - Kemper et al. 2014',
+            theme='urban'
         )
-        
-        self.indices_db['PIVOT_IRRIGATION'] = SpectralIndex(
-            name='PIVOT_IRRIGATION',
-            description='Pivot Irrigation Index (center-pivot sprinkler systems)',
-            formula=lambda b: f"({b['SWIR']} - {b['GREEN']}) / ({b['SWIR']} + {b['GREEN']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
+
+        self.indices_db['WATER_TANK'] = SpectralIndex(
+            name='WATER_TANK',
+            description='Water Tank Index (temporary water storage)',
+            formula_template="({SWIR} - {GREEN}) / ({SWIR} + {GREEN}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Center-pivot irrigation detection - Ozdogan et al. 2010',
-            theme='water'
+            reference='Water storage facility detection - Sliuzas et al. 2019',
+            theme='urban'
         )
-        
-        self.indices_db['DRIP_IRRIGATION'] = SpectralIndex(
-            name='DRIP_IRRIGATION',
-            description='Drip Irrigation Index (micro-irrigation systems)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['RED']}) / ({b['SWIR2200']} + {b['RED']}) * (1 + ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2200': (2195, 2205)},
-            reference='Drip irrigation detection - Daccache et al. 2014',
-            theme='water'
+
+        self.indices_db['FOOD_DISTRIBUTION'] = SpectralIndex(
+            name='FOOD_DISTRIBUTION',
+            description='Food Distribution Center Index (emergency food facilities)',
+            formula_template="({SWIR2200} - {WHITE}) / ({SWIR2200} + {WHITE}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'WHITE': (650, 680), 'SWIR2200': (2195, 2205)},
+            reference='Emergency food facility mapping - Brown et al. 2018',
+            theme='urban'
         )
-        
-        self.indices_db['FLOOD_IRRIGATION'] = SpectralIndex(
-            name='FLOOD_IRRIGATION',
-            description='Flood Irrigation Index (flooded field systems)',
-            formula=lambda b: f"({b['GREEN']} - {b['SWIR']}) / ({b['GREEN']} + {b['SWIR']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Flood irrigation mapping - Bousbih et al. 2018',
-            theme='water'
+
+    def _init_stress(self):
+        """Add the stress theme indices to the database."""
+        # STRESS INDICES
+        # Plant stress detection
+        self.indices_db['MSI'] = SpectralIndex(
+            name='MSI',
+            description='Moisture Stress Index',
+            formula_template="{SWIR} / {NIR}",
+            bands_required={'NIR': (760, 900), 'SWIR': (1550, 1750)},
+            reference='Rock et al. 1986',
+            theme='stress'
         )
-        
-        self.indices_db['IRRIGATION_POND'] = SpectralIndex(
-            name='IRRIGATION_POND',
-            description='Irrigation Pond Index (water storage for agriculture)',
-            formula=lambda b: f"({b['BLUE']} - {b['SWIR']}) / ({b['BLUE']} + {b['SWIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
-            reference='Irrigation pond detection - Velpuri et al. 2017',
-            theme='water'
+
+        self.indices_db['NDNI'] = SpectralIndex(
+            name='NDNI',
+            description='Normalized Difference Nitrogen Index',
+            # (log(1/a) - log(1/b)) / (log(1/a) + log(1/b))
+            #   = (log(b) - log(a)) / -(log(a) + log(b))
+            #   = log(a/b) / log(a*b), two logs instead of four
+            formula_template="log(float({NIR1}) / {NIR2}) / log(float({NIR1}) * {NIR2})",
+            bands_required={'NIR1': (1510, 1520), 'NIR2': (1680, 1690)},
+            reference='Serrano et al. 2002',
+            theme='stress'
         )
-        
-        self.indices_db['SPRINKLER_SYSTEM'] = SpectralIndex(
-            name='SPRINKLER_SYSTEM',
-            description='Sprinkler System Index (sprinkler irrigation infrastructure)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['GREEN']}) / ({b['SWIR2100']} + {b['GREEN']}) * (1 + ({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2100': (2095, 2105)},
-            reference='Sprinkler system detection - Kuenzer et al. 2012',
-            theme='water'
+
+        self.indices_db['TCARI'] = SpectralIndex(
+            name='TCARI',
+            description='Transformed Chlorophyll Absorption Ratio',
+            formula_template="3 * (({REDEDGE} - {RED}) - 0.2 * ({REDEDGE} - {GREEN}) * ({REDEDGE} / {RED}))",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'REDEDGE': (690, 730)},
+            reference='Haboudane et al. 2002',
+            theme='stress'
         )
-        
-        self.indices_db['IRRIGATION_INFRASTRUCTURE'] = SpectralIndex(
-            name='IRRIGATION_INFRASTRUCTURE',
-            description='Irrigation Infrastructure Index (general irrigation facilities)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Irrigation infrastructure mapping - Dwarakish et al. 2015',
-            theme='water'
+
+    def _init_materials(self):
+        """Add the materials theme indices to the database."""
+        # MATERIAL IDENTIFICATION INDICES
+        # Plastics, hydrocarbons, minerals, built materials
+        # Hydrocarbon detection
+        self.indices_db['HI'] = SpectralIndex(
+            name='HI',
+            description='Hydrocarbon Index - Oil & gas detection',
+            formula_template="({SWIR2200} * {SWIR2400}) / ({SWIR2300}^2)",
+            bands_required={'SWIR2200': (2195, 2205), 'SWIR2300': (2295, 2305), 'SWIR2400': (2395, 2405)},
+            reference='Cloutis 1989',
+            theme='materials'
         )
-        
-        self.indices_db['WATER_STRESSED_CROP'] = SpectralIndex(
-            name='WATER_STRESSED_CROP',
-            description='Water Stressed Crop Index (detecting water stress in irrigated areas)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 - ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Water stress detection - Kogan et al. 2011',
-            theme='vegetation'
+
+        self.indices_db['THI'] = SpectralIndex(
+            name='THI',
+            description='Tentative Hydrocarbon Index',
+            formula_template="({SWIR1730} + {SWIR2450}) / (2 * {SWIR2210})",
+            bands_required={'SWIR1730': (1725, 1735), 'SWIR2210': (2205, 2215), 'SWIR2450': (2445, 2455)},
+            reference='Kühn et al. 2004',
+            theme='materials'
         )
-        
-        self.indices_db['WELL_IRRIGATION'] = SpectralIndex(
-            name='WELL_IRRIGATION',
-            description='Well Irrigation Index (groundwater extraction points)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['BLUE']}) / ({b['SWIR2200']} + {b['BLUE']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2200': (2195, 2205)},
-            reference='Well irrigation detection - Shah et al. 2013',
-            theme='water'
+
+        self.indices_db['OHI'] = SpectralIndex(
+            name='OHI',
+            description='Oil and Hydrocarbon Index',
+            formula_template="({SWIR1650} + {SWIR2450}) / {SWIR2210}",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR2210': (2205, 2215), 'SWIR2450': (2445, 2455)},
+            reference='Lammoglia and Filho 2011',
+            theme='materials'
+        )
+
+        self.indices_db['TPI'] = SpectralIndex(
+            name='TPI',
+            description='Tar/Petroleum Index',
+            formula_template="{SWIR2300} / {SWIR1650}",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR2300': (2295, 2305)},
+            reference='Martinez and Le Toan 2007',
+            theme='materials'
+        )
+
+        self.indices_db['COAL'] = SpectralIndex(
+            name='COAL',
+            description='Coal/Carbon Index',
+            formula_template="({SWIR2200} / {SWIR1600}) * ({SWIR2200} / {NIR})",
+            bands_required={'NIR': (760, 900), 'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
+            reference='van der Meer 1995',
+            theme='materials'
+        )
+
+        # Plastic detection
+        self.indices_db['PLASTIC'] = SpectralIndex(
+            name='PLASTIC',
+            description='Plastic Detection Index',
+            formula_template="({NIR} / {SWIR1600}) - ({SWIR2200} / {SWIR1600})",
+            bands_required={'NIR': (760, 900), 'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
+            reference='Garaba and Dierssen 2018',
+            theme='materials'
+        )
+
+        self.indices_db['PDI'] = SpectralIndex(
+            name='PDI',
+            description='Plastic Debris Index',
+            formula_template="({NIR} - {RED}) / ({NIR} + {RED}) - ({SWIR1600} - {NIR}) / ({SWIR1600} + {NIR})",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1600': (1595, 1605)},
+            reference='Biermann et al. 2020',
+            theme='materials'
         )
-        
-        self.indices_db['RIVER_LIFT_IRRIGATION'] = SpectralIndex(
-            name='RIVER_LIFT_IRRIGATION',
-            description='River Lift Irrigation Index (river water pumping systems)',
-            formula=lambda b: f"({b['SWIR']} - {b['GREEN']}) / ({b['SWIR']} + {b['GREEN']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='River lift irrigation mapping - Bhanja et al. 2019',
-            theme='water'
+
+        self.indices_db['FPI'] = SpectralIndex(
+            name='FPI',
+            description='Floating Plastic Index',
+            formula_template="{NIR} / ({RED} + {SWIR1600}) * 100",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1600': (1595, 1605)},
+            reference='Themistocleous et al. 2020',
+            theme='materials'
         )
-        
-        self.indices_db['IRRIGATION_TIMING'] = SpectralIndex(
-            name='IRRIGATION_TIMING',
-            description='Irrigation Timing Index (recent vs. old irrigation)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2100']}) / ({b['SWIR1650']} + {b['SWIR2100']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2100': (2095, 2105)},
-            reference='Irrigation timing detection - Biggs et al. 2016',
-            theme='water'
+
+        self.indices_db['RSWIR'] = SpectralIndex(
+            name='RSWIR',
+            description='Reversed SWIR Index - Marine debris',
+            formula_template="{SWIR1600} / {NIR}",
+            bands_required={'NIR': (760, 900), 'SWIR1600': (1595, 1605)},
+            reference='Kikaki et al. 2020',
+            theme='materials'
         )
-        
-        self.indices_db['IRRIGATION_EFFICIENCY'] = SpectralIndex(
-            name='IRRIGATION_EFFICIENCY',
-            description='Irrigation Efficiency Index (water use efficiency)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Irrigation efficiency assessment - Perry et al. 2017',
-            theme='water'
+
+        self.indices_db['NDPI'] = SpectralIndex(
+            name='NDPI',
+            description='Normalized Difference Plastic Index',
+            formula_template="({SWIR1650} - {NIR}) / ({SWIR1650} + {NIR})",
+            bands_required={'NIR': (760, 900), 'SWIR1650': (1645, 1655)},
+            reference='Themistocleous et al. 2020',
+            theme='materials'
         )
-        
-        # Non-Irrigated Yield Prediction Indices
-        self.indices_db['RAINFED_CROP'] = SpectralIndex(
-            name='RAINFED_CROP',
-            description='Rain-fed Crop Index (non-irrigated agriculture)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Rain-fed crop detection - Balaghi et al. 2014',
-            theme='vegetation'
+
+        self.indices_db['MPDI'] = SpectralIndex(
+            name='MPDI',
+            description='Marine Plastic Detection Index',
+            formula_template="({B490} - {B560}) / ({B490} + {B560}) + ({B665} - {B865}) / ({B665} + {B865})",
+            bands_required={'B490': (485, 495), 'B560': (555, 565), 'B665': (660, 670), 'B865': (860, 870)},
+            reference='Biermann et al. 2020',
+            theme='materials'
         )
-        
-        self.indices_db['DROUGHT_STRESS'] = SpectralIndex(
-            name='DROUGHT_STRESS',
-            description='Drought Stress Index (water deficit in rain-fed areas)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Drought stress monitoring - Gu et al. 2007',
-            theme='vegetation'
+
+        # Mineral and geological indices
+        self.indices_db['FERRIC'] = SpectralIndex(
+            name='FERRIC',
+            description='Ferric Iron Index',
+            formula_template="{SWIR1650} / {B830}",
+            bands_required={'B830': (825, 835), 'SWIR1650': (1645, 1655)},
+            reference='Segal 1982',
+            theme='materials'
         )
-        
-        self.indices_db['YIELD_PREDICTION'] = SpectralIndex(
-            name='YIELD_PREDICTION',
-            description='Crop Yield Prediction Index (general yield estimation)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.3 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Crop yield prediction - Becker-Reshef et al. 2010',
-            theme='vegetation'
+
+        self.indices_db['FERROUS'] = SpectralIndex(
+            name='FERROUS',
+            description='Ferrous Iron Index',
+            formula_template="{SWIR1650} / {B1550}",
+            bands_required={'B1550': (1545, 1555), 'SWIR1650': (1645, 1655)},
+            reference='Segal 1982',
+            theme='materials'
         )
-        
-        self.indices_db['RAINFED_YIELD'] = SpectralIndex(
-            name='RAINFED_YIELD',
-            description='Rain-fed Yield Index (yield prediction for non-irrigated crops)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.2 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Rain-fed yield modeling - Lobell et al. 2015',
-            theme='vegetation'
+
+        self.indices_db['LATERITE'] = SpectralIndex(
+            name='LATERITE',
+            description='Laterite Index - Iron-rich materials',
+            formula_template="({SWIR1650} + {RED}) / {NIR}",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655)},
+            reference='Pour and Hashim 2012',
+            theme='materials'
         )
-        
-        self.indices_db['DRYLAND_YIELD'] = SpectralIndex(
-            name='DRYLAND_YIELD',
-            description='Dryland Yield Index (arid region crop yield)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.4 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Dryland agriculture yield - Basso et al. 2012',
-            theme='vegetation'
+
+        self.indices_db['GOSSAN'] = SpectralIndex(
+            name='GOSSAN',
+            description='Gossan Index - Weathered sulfides',
+            formula_template="({RED} * {SWIR1650}) / ({GREEN}^2)",
+            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'SWIR1650': (1645, 1655)},
+            reference='Rajendran and Nasir 2019',
+            theme='materials'
         )
-        
-        self.indices_db['PRECIPITATION_EFFECTIVENESS'] = SpectralIndex(
-            name='PRECIPITATION_EFFECTIVENESS',
-            description='Precipitation Effectiveness Index (rainfall utilization)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.25 * ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
-            bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
-            reference='Rainfall use efficiency - Mkhabela et al. 2011',
-            theme='vegetation'
+
+        self.indices_db['SINDEX'] = SpectralIndex(
+            name='SINDEX',
+            description='S-Index - Soil/sediment composition',
+            formula_template="sqrt({RED} * {NIR})",
+            bands_required={'RED': (620, 690), 'NIR': (760, 900)},
+            reference='Escadafal and Huete 1991',
+            theme='materials'
         )
-        
-        self.indices_db['SOIL_MOISTURE_DEFICIT'] = SpectralIndex(
-            name='SOIL_MOISTURE_DEFICIT',
-            description='Soil Moisture Deficit Index (water stress in rain-fed areas)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + 0.3 * ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Soil moisture deficit - Wang et al. 2009',
-            theme='soil'
+
+        # Built environment materials
+        self.indices_db['PAINT'] = SpectralIndex(
+            name='PAINT',
+            description='Paint Detection Index (synthetic coatings)',
+            formula_template="({B450} + {B650}) / (2 * {B550})",
+            bands_required={'B450': (445, 455), 'B550': (545, 555), 'B650': (645, 655)},
+            reference='Based on pigment absorption features',
+            theme='materials'
         )
-        
-        self.indices_db['CROP_WATER_STRESS'] = SpectralIndex(
-            name='CROP_WATER_STRESS',
-            description='Crop Water Stress Index (physiological stress in rain-fed crops)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2200']}) / ({b['SWIR1650']} + {b['SWIR2200']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
-            reference='Crop physiological stress - Penuelas et al. 2011',
-            theme='vegetation'
+
+        self.indices_db['ASPHALT'] = SpectralIndex(
+            name='ASPHALT',
+            description='Asphalt/Bitumen Index',
+            formula_template="({SWIR1600} - {SWIR2200}) / ({SWIR1600} + {SWIR2200})",
+            bands_required={'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
+            reference='Herold et al. 2004',
+            theme='materials'
         )
-        
-        self.indices_db['RAINFED_BIOMASS'] = SpectralIndex(
-            name='RAINFED_BIOMASS',
-            description='Rain-fed Biomass Index (biomass estimation for non-irrigated crops)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.2 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Rain-fed biomass estimation - Prince et al. 2009',
-            theme='vegetation'
+
+        self.indices_db['CONCRETE'] = SpectralIndex(
+            name='CONCRETE',
+            description='Concrete Detection Index',
+            formula_template="({B500} + {SWIR2200}) / {NIR}",
+            bands_required={'B500': (495, 505), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
+            reference='Dópido et al. 2012',
+            theme='materials'
         )
-        
-        self.indices_db['CLIMATE_YIELD'] = SpectralIndex(
-            name='CLIMATE_YIELD',
-            description='Climate Yield Index (climate-limited yield prediction)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.15 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Climate yield modeling - Schlenker et al. 2013',
-            theme='vegetation'
+
+        # Additional Mineral Identification Indices
+        self.indices_db['CLAY'] = SpectralIndex(
+            name='CLAY',
+            description='Clay Mineral Index (kaolinite, illite, smectite)',
+            formula_template="({SWIR2200} - {SWIR2100}) / ({SWIR2200} + {SWIR2100})",
+            bands_required={'SWIR2100': (2095, 2105), 'SWIR2200': (2195, 2205)},
+            reference='Chabrillat et al. 2000',
+            theme='materials'
         )
-        
-        self.indices_db['RAINFED_PRODUCTIVITY'] = SpectralIndex(
-            name='RAINFED_PRODUCTIVITY',
-            description='Rain-fed Productivity Index (overall productivity of rain-fed agriculture)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.35 * ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'GREEN': (520, 600), 'NIR': (760, 900)},
-            reference='Rain-fed productivity - Johnson et al. 2014',
-            theme='vegetation'
+
+        self.indices_db['CARBONATE'] = SpectralIndex(
+            name='CARBONATE',
+            description='Carbonate Mineral Index (calcite, dolomite)',
+            formula_template="({SWIR2330} - {SWIR2200}) / ({SWIR2330} + {SWIR2200})",
+            bands_required={'SWIR2200': (2195, 2205), 'SWIR2330': (2325, 2335)},
+            reference='Gaffey 1986',
+            theme='materials'
         )
-        
-        self.indices_db['WATER_LIMITED_YIELD'] = SpectralIndex(
-            name='WATER_LIMITED_YIELD',
-            description='Water Limited Yield Index (yield constrained by water availability)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 - 0.5 * ({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}))",
-            bands_required={'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Water-limited yield - Sinclair et al. 2010',
-            theme='vegetation'
+
+        self.indices_db['SULFIDE'] = SpectralIndex(
+            name='SULFIDE',
+            description='Sulfide Mineral Index (pyrite, chalcopyrite)',
+            formula_template="({SWIR1650} - {SWIR2200}) / ({SWIR1650} + {SWIR2200})",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
+            reference='Huntington et al. 1997',
+            theme='materials'
         )
-        
-        self.indices_db['DROUGHT_VULNERABILITY'] = SpectralIndex(
-            name='DROUGHT_VULNERABILITY',
-            description='Drought Vulnerability Index (susceptibility to water stress)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + 0.4 * ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
-            bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
-            reference='Drought vulnerability assessment - Svoboda et al. 2016',
-            theme='vegetation'
+
+        self.indices_db['QUARTZ'] = SpectralIndex(
+            name='QUARTZ',
+            description='Quartz/Silica Index',
+            formula_template="({SWIR8000} - {SWIR9500}) / ({SWIR8000} + {SWIR9500})",
+            bands_required={'SWIR8000': (7950, 8050), 'SWIR9500': (9450, 9550)},
+            reference='Crowley and Clark 1992',
+            theme='materials'
         )
-        
-        self.indices_db['RAINFED_PHENOLOGY'] = SpectralIndex(
-            name='RAINFED_PHENOLOGY',
-            description='Rain-fed Phenology Index (growth stage detection in rain-fed crops)',
-            formula=lambda b: f"({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}) * (1 + 0.25 * ({b['REDEDGE']} - {b['RED']}) / ({b['REDEDGE']} + {b['RED']}))",
-            bands_required={'RED': (620, 690), 'REDEDGE': (690, 730), 'NIR': (760, 900)},
-            reference='Rain-fed phenology monitoring - Sakamoto et al. 2005',
-            theme='vegetation'
+
+        self.indices_db['MICA'] = SpectralIndex(
+            name='MICA',
+            description='Mica Mineral Index (muscovite, biotite)',
+            formula_template="({SWIR2200} - {SWIR2350}) / ({SWIR2200} + {SWIR2350})",
+            bands_required={'SWIR2200': (2195, 2205), 'SWIR2350': (2345, 2355)},
+            reference='Rowan et al. 1977',
+            theme='materials'
         )
-        
+
+        self.indices_db['GYPSUM'] = SpectralIndex(
+            name='GYPSUM',
+            description='Gypsum Mineral Index',
+            formula_template="({SWIR1750} - {SWIR1940}) / ({SWIR1750} + {SWIR1940})",
+            bands_required={'SWIR1750': (1745, 1755), 'SWIR1940': (1935, 1945)},
+            reference='Kahle et al. 1988',
+            theme='materials'
+        )
+
         # Paint and Coating Detection Indices
         self.indices_db['VEHICLE_PAINT'] = SpectralIndex(
             name='VEHICLE_PAINT',
             description='Vehicle Paint Detection Index (automotive and military vehicle coatings)',
-            formula=lambda b: f"({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}) * (1 + ({b['BLUE']} - {b['NIR']}) / ({b['BLUE']} + {b['NIR']}))",
+            formula_template="({RED} - {GREEN}) / ({RED} + {GREEN}) * (1 + ({BLUE} - {NIR}) / ({BLUE} + {NIR}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
             reference='Vehicle paint detection - Kudoh et al. 2010',
             theme='materials'
         )
-        
+
         self.indices_db['MILITARY_CAMOUFLAGE'] = SpectralIndex(
             name='MILITARY_CAMOUFLAGE',
             description='Military Camouflage Detection Index (camouflage patterns and materials)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
             reference='Military camouflage detection - de Visser et al. 2016',
             theme='materials'
         )
-        
+
         self.indices_db['MARINE_PAINT'] = SpectralIndex(
             name='MARINE_PAINT',
             description='Marine Paint Detection Index (ship and boat coatings)',
-            formula=lambda b: f"({b['BLUE']} - {b['GREEN']}) / ({b['BLUE']} + {b['GREEN']}) * (1 + ({b['RED']} - {b['SWIR']}) / ({b['RED']} + {b['SWIR']}))",
+            formula_template="({BLUE} - {GREEN}) / ({BLUE} + {GREEN}) * (1 + ({RED} - {SWIR}) / ({RED} + {SWIR}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR': (1550, 1750)},
             reference='Marine coating detection - Kester et al. 2014',
             theme='materials'
         )
-        
+
         self.indices_db['INDUSTRIAL_COATING'] = SpectralIndex(
             name='INDUSTRIAL_COATING',
             description='Industrial Coating Index (protective and functional coatings)',
-            formula=lambda b: f"({b['SWIR2200']} - {b['GREEN']}) / ({b['SWIR2200']} + {b['GREEN']}) * (1 + ({b['NIR']} - {b['RED']}) / ({b['NIR']} + {b['RED']}))",
+            formula_template="({SWIR2200} - {GREEN}) / ({SWIR2200} + {GREEN}) * (1 + ({NIR} - {RED}) / ({NIR} + {RED}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2200': (2195, 2205)},
             reference='Industrial coating analysis - Yang et al. 2013',
             theme='materials'
         )
-        
+
         self.indices_db['ROAD_PAINT'] = SpectralIndex(
             name='ROAD_PAINT',
             description='Road Paint Detection Index (highway markings and road coatings)',
-            formula=lambda b: f"({b['YELLOW']} - {b['WHITE']}) / ({b['YELLOW']} + {b['WHITE']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
+            formula_template="({YELLOW} - {WHITE}) / ({YELLOW} + {WHITE}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'WHITE': (650, 680), 'YELLOW': (570, 590)},
             reference='Road marking detection - Li et al. 2015',
             theme='materials'
         )
-        
+
         self.indices_db['BUILDING_PAINT'] = SpectralIndex(
             name='BUILDING_PAINT',
             description='Building Paint Index (architectural and structural coatings)',
-            formula=lambda b: f"({b['RED']} - {b['BLUE']}) / ({b['RED']} + {b['BLUE']}) * (1 + ({b['GREEN']} - {b['NIR']}) / ({b['GREEN']} + {b['NIR']}))",
+            formula_template="({RED} - {BLUE}) / ({RED} + {BLUE}) * (1 + ({GREEN} - {NIR}) / ({GREEN} + {NIR}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
             reference='Building coating detection - Herold et al. 2012',
             theme='materials'
         )
-        
+
         self.indices_db['REFLECTIVE_PAINT'] = SpectralIndex(
             name='REFLECTIVE_PAINT',
             description='Reflective Paint Index (high-reflectivity coatings)',
-            formula=lambda b: f"({b['NIR']} - {b['SWIR']}) / ({b['NIR']} + {b['SWIR']}) * (1 + ({b['WHITE']} - {b['GREEN']}) / ({b['WHITE']} + {b['GREEN']}))",
+            formula_template="({NIR} - {SWIR}) / ({NIR} + {SWIR}) * (1 + ({WHITE} - {GREEN}) / ({WHITE} + {GREEN}))",
             bands_required={'GREEN': (520, 600), 'WHITE': (650, 680), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
             reference='Reflective coating detection - Levinson et al. 2007',
             theme='materials'
         )
-        
+
         self.indices_db['ANTI_FOULING_PAINT'] = SpectralIndex(
             name='ANTI_FOULING_PAINT',
             description='Anti-fouling Paint Index (marine and industrial anti-fouling coatings)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['BLUE']}) / ({b['SWIR2100']} + {b['BLUE']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
+            formula_template="({SWIR2100} - {BLUE}) / ({SWIR2100} + {BLUE}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2100': (2095, 2105)},
             reference='Anti-fouling coating detection - Yebra et al. 2016',
             theme='materials'
         )
-        
+
         self.indices_db['THERMAL_PAINT'] = SpectralIndex(
             name='THERMAL_PAINT',
             description='Thermal Paint Index (heat-reflective and insulating coatings)',
-            formula=lambda b: f"({b['SWIR2300']} - {b['NIR']}) / ({b['SWIR2300']} + {b['NIR']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
+            formula_template="({SWIR2300} - {NIR}) / ({SWIR2300} + {NIR}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR2300': (2295, 2305)},
             reference='Thermal coating detection - Santamouris et al. 2011',
             theme='materials'
         )
-        
+
         self.indices_db['FLUORESCENT_PAINT'] = SpectralIndex(
             name='FLUORESCENT_PAINT',
             description='Fluorescent Paint Index (UV-reactive and fluorescent coatings)',
-            formula=lambda b: f"({b['BLUE']} - {b['UV']}) / ({b['BLUE']} + {b['UV']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
+            formula_template="({BLUE} - {UV}) / ({BLUE} + {UV}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
             bands_required={'UV': (350, 400), 'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690)},
             reference='Fluorescent coating detection - Kim et al. 2018',
             theme='materials'
         )
-        
+
         self.indices_db['METALLIC_PAINT'] = SpectralIndex(
             name='METALLIC_PAINT',
             description='Metallic Paint Index (metal-flake and pearlescent coatings)',
-            formula=lambda b: f"({b['SWIR']} - {b['NIR']}) / ({b['SWIR']} + {b['NIR']}) * (1 + ({b['RED']} - {b['GREEN']}) / ({b['RED']} + {b['GREEN']}))",
+            formula_template="({SWIR} - {NIR}) / ({SWIR} + {NIR}) * (1 + ({RED} - {GREEN}) / ({RED} + {GREEN}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900), 'SWIR': (1550, 1750)},
             reference='Metallic coating detection - Gao et al. 2014',
             theme='materials'
         )
-        
+
         self.indices_db['AEROSOL_PAINT'] = SpectralIndex(
             name='AEROSOL_PAINT',
             description='Aerosol Paint Index (spray-applied coatings and graffiti)',
-            formula=lambda b: f"({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}) * (1 + ({b['RED']} - {b['NIR']}) / ({b['RED']} + {b['NIR']}))",
+            formula_template="({GREEN} - {BLUE}) / ({GREEN} + {BLUE}) * (1 + ({RED} - {NIR}) / ({RED} + {NIR}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'NIR': (760, 900)},
             reference='Aerosol coating detection - Valero et al. 2017',
             theme='materials'
         )
-        
+
         self.indices_db['WATERPROOF_PAINT'] = SpectralIndex(
             name='WATERPROOF_PAINT',
             description='Waterproof Paint Index (water-repellent coatings)',
-            formula=lambda b: f"({b['SWIR1650']} - {b['SWIR2200']}) / ({b['SWIR1650']} + {b['SWIR2200']}) * (1 + ({b['GREEN']} - {b['RED']}) / ({b['GREEN']} + {b['RED']}))",
+            formula_template="({SWIR1650} - {SWIR2200}) / ({SWIR1650} + {SWIR2200}) * (1 + ({GREEN} - {RED}) / ({GREEN} + {RED}))",
             bands_required={'GREEN': (520, 600), 'RED': (620, 690), 'SWIR1650': (1645, 1655), 'SWIR2200': (2195, 2205)},
             reference='Waterproof coating detection - Song et al. 2012',
             theme='materials'
         )
-        
+
         self.indices_db['CORROSION_PROTECTIVE_PAINT'] = SpectralIndex(
             name='CORROSION_PROTECTIVE_PAINT',
             description='Corrosion Protective Paint Index (anti-corrosion coatings)',
-            formula=lambda b: f"({b['SWIR2100']} - {b['RED']}) / ({b['SWIR2100']} + {b['RED']}) * (1 + ({b['GREEN']} - {b['BLUE']}) / ({b['GREEN']} + {b['BLUE']}))",
+            formula_template="({SWIR2100} - {RED}) / ({SWIR2100} + {RED}) * (1 + ({GREEN} - {BLUE}) / ({GREEN} + {BLUE}))",
             bands_required={'BLUE': (450, 520), 'GREEN': (520, 600), 'RED': (620, 690), 'SWIR2100': (2095, 2105)},
             reference='Corrosion protection coating detection - Feng et al. 2015',
             theme='materials'
         )
-            
+
+    def _init_atmospheric(self):
+        """Add the atmospheric theme indices to the database."""
+        # Atmospheric Composition and Pollution Detection Indices
+        self.indices_db['AEROSOL_OPTICAL'] = SpectralIndex(
+            name='AEROSOL_OPTICAL',
+            description='Aerosol Optical Depth Index (atmospheric particle concentration)',
+            formula_template="({BLUE} - {RED}) / ({BLUE} + {RED})",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690)},
+            reference='Kaufman and Tanre 1996 - Aerosol retrieval',
+            theme='atmospheric'
+        )
+
+        self.indices_db['OZONE'] = SpectralIndex(
+            name='OZONE',
+            description='Ozone Concentration Index (O3 detection)',
+            formula_template="({B340} - {B360}) / ({B340} + {B360})",
+            bands_required={'B340': (335, 345), 'B360': (355, 365)},
+            reference='Herman et al. 1999 - Ozone monitoring',
+            theme='atmospheric'
+        )
+
+        self.indices_db['WATER_VAPOR'] = SpectralIndex(
+            name='WATER_VAPOR',
+            description='Atmospheric Water Vapor Index (column water vapor)',
+            formula_template="({B940} - {B860}) / ({B940} + {B860})",
+            bands_required={'B860': (855, 865), 'B940': (935, 945)},
+            reference='Kaufman and Gao 1992 - Water vapor retrieval',
+            theme='atmospheric'
+        )
+
+        self.indices_db['NO2'] = SpectralIndex(
+            name='NO2',
+            description='Nitrogen Dioxide Index (pollution detection)',
+            formula_template="({B440} - {B430}) / ({B440} + {B430})",
+            bands_required={'B430': (425, 435), 'B440': (435, 445)},
+            reference='Boersma et al. 2002 - NO2 monitoring',
+            theme='atmospheric'
+        )
+
+        self.indices_db['SO2'] = SpectralIndex(
+            name='SO2',
+            description='Sulfur Dioxide Index (volcanic/industrial pollution)',
+            formula_template="({B310} - {B330}) / ({B310} + {B330})",
+            bands_required={'B310': (305, 315), 'B330': (325, 335)},
+            reference='Kerr et al. 2010 - SO2 volcanic emissions',
+            theme='atmospheric'
+        )
+
+        self.indices_db['CO'] = SpectralIndex(
+            name='CO',
+            description='Carbon Monoxide Index (combustion detection)',
+            formula_template="({SWIR2300} - {SWIR2100}) / ({SWIR2300} + {SWIR2100})",
+            bands_required={'SWIR2100': (2095, 2105), 'SWIR2300': (2295, 2305)},
+            reference='MOPITT algorithm - CO retrieval',
+            theme='atmospheric'
+        )
+
+        self.indices_db['CH4'] = SpectralIndex(
+            name='CH4',
+            description='Methane Index (greenhouse gas detection)',
+            formula_template="({SWIR1650} - {SWIR1700}) / ({SWIR1650} + {SWIR1700})",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR1700': (1695, 1705)},
+            reference='Frankenberg et al. 2005 - CH4 retrieval',
+            theme='atmospheric'
+        )
+
+        self.indices_db['DUST'] = SpectralIndex(
+            name='DUST',
+            description='Atmospheric Dust Index (mineral dust detection)',
+            formula_template="({RED} - {BLUE}) / ({RED} + {BLUE})",
+            bands_required={'BLUE': (450, 520), 'RED': (620, 690)},
+            reference='Herman et al. 1997 - Dust detection',
+            theme='atmospheric'
+        )
+
+        self.indices_db['SMOKE'] = SpectralIndex(
+            name='SMOKE',
+            description='Smoke/Plume Index (wildfire/industrial smoke)',
+            formula_template="({SWIR2100} - {NIR}) / ({SWIR2100} + {NIR})",
+            bands_required={'NIR': (760, 900), 'SWIR2100': (2095, 2105)},
+            reference='Kaufman et al. 1998 - Smoke detection',
+            theme='atmospheric'
+        )
+
+        self.indices_db['HAZE'] = SpectralIndex(
+            name='HAZE',
+            description='Haze/Fog Index (visibility reduction)',
+            formula_template="({GREEN} - {NIR}) / ({GREEN} + {NIR})",
+            bands_required={'GREEN': (520, 600), 'NIR': (760, 900)},
+            reference='Lee et al. 2006 - Haze detection',
+            theme='atmospheric'
+        )
+
+        self.indices_db['VOLCANIC_ASH'] = SpectralIndex(
+            name='VOLCANIC_ASH',
+            description='Volcanic Ash Index (ash cloud detection)',
+            formula_template="({B1100} - {B1200}) / ({B1100} + {B1200})",
+            bands_required={'B1100': (1095, 1105), 'B1200': (1195, 1205)},
+            reference='Prata and Grant 2001 - Volcanic ash',
+            theme='atmospheric'
+        )
+
+        self.indices_db['AIR_QUALITY'] = SpectralIndex(
+            name='AIR_QUALITY',
+            description='Air Quality Index (overall pollution assessment)',
+            formula_template="({NO2} * 0.3 + {SO2} * 0.3 + {AEROSOL_OPTICAL} * 0.4)",
+            bands_required={'NO2': (-1, 1), 'SO2': (-1, 1), 'AEROSOL_OPTICAL': (-1, 1)},
+            reference='EPA methodology adaptation',
+            theme='atmospheric'
+        )
+
+        self.indices_db['INDUSTRIAL_PLUME'] = SpectralIndex(
+            name='INDUSTRIAL_PLUME',
+            description='Industrial Plume Detection Index',
+            formula_template="({SWIR2200} - {SWIR1600}) / ({SWIR2200} + {SWIR1600})",
+            bands_required={'SWIR1600': (1595, 1605), 'SWIR2200': (2195, 2205)},
+            reference='Industrial emission monitoring',
+            theme='atmospheric'
+        )
+
+    def _init_textiles(self):
+        """Add the textiles theme indices to the database."""
+        # Textile and Polymer Detection Indices
+        self.indices_db['COTTON'] = SpectralIndex(
+            name='COTTON',
+            description='Cotton Fiber Index (natural cellulose fibers)',
+            formula_template="({SWIR2100} - {SWIR1700}) / ({SWIR2100} + {SWIR1700})",
+            bands_required={'SWIR1700': (1695, 1705), 'SWIR2100': (2095, 2105)},
+            reference='Cellulose fiber spectroscopy - Dyer et al. 2010',
+            theme='textiles'
+        )
+
+        self.indices_db['POLYESTER'] = SpectralIndex(
+            name='POLYESTER',
+            description='Polyester Fiber Index (PET polymer detection)',
+            formula_template="({SWIR1720} - {SWIR2300}) / ({SWIR1720} + {SWIR2300})",
+            bands_required={'SWIR1720': (1715, 1725), 'SWIR2300': (2295, 2305)},
+            reference='Polyester spectral signatures - Zhang et al. 2015',
+            theme='textiles'
+        )
+
+        self.indices_db['NYLON'] = SpectralIndex(
+            name='NYLON',
+            description='Nylon/Polyamide Fiber Index (synthetic polymer detection)',
+            formula_template="({SWIR1530} - {SWIR2180}) / ({SWIR1530} + {SWIR2180})",
+            bands_required={'SWIR1530': (1525, 1535), 'SWIR2180': (2175, 2185)},
+            reference='Polyamide fiber analysis - Sasic et al. 2012',
+            theme='textiles'
+        )
+
+        self.indices_db['ARAMID'] = SpectralIndex(
+            name='ARAMID',
+            description='Aramid Fiber Index (Kevlar, Nomex detection)',
+            formula_template="({SWIR1650} - {SWIR2270}) / ({SWIR1650} + {SWIR2270})",
+            bands_required={'SWIR1650': (1645, 1655), 'SWIR2270': (2265, 2275)},
+            reference='Aramid polymer spectroscopy - Bourban et al. 2014',
+            theme='textiles'
+        )
+
+        self.indices_db['LINEN'] = SpectralIndex(
+            name='LINEN',
+            description='Linen Fiber Index (flax natural fibers)',
+            formula_template="({SWIR2130} - {SWIR1780}) / ({SWIR2130} + {SWIR1780})",
+            bands_required={'SWIR1780': (1775, 1785), 'SWIR2130': (2125, 2135)},
+            reference='Flax fiber spectral analysis - Hsieh et al. 2011',
+            theme='textiles'
+        )
+
+        self.indices_db['WOOL'] = SpectralIndex(
+            name='WOOL',
+            description='Wool Fiber Index (protein-based natural fibers)',
+            formula_template="({SWIR2170} - {SWIR1690}) / ({SWIR2170} + {SWIR1690})",
+            bands_required={'SWIR1690': (1685, 1695), 'SWIR2170': (2165, 2175)},
+            reference='Protein fiber spectroscopy - Carr et al. 2008',
+            theme='textiles'
+        )
+
+        self.indices_db['POLYPROPYLENE'] = SpectralIndex(
+            name='POLYPROPYLENE',
+            description='Polypropylene Fiber Index (PP polymer detection)',
+            formula_template="({SWIR1725} - {SWIR2315}) / ({SWIR1725} + {SWIR2315})",
+            bands_required={'SWIR1725': (1720, 1730), 'SWIR2315': (2310, 2320)},
+            reference='PP fiber spectral signatures - Liu et al. 2016',
+            theme='textiles'
+        )
+
+        self.indices_db['ACRYLIC'] = SpectralIndex(
+            name='ACRYLIC',
+            description='Acrylic Fiber Index (synthetic polymer detection)',
+            formula_template="({SWIR1760} - {SWIR2240}) / ({SWIR1760} + {SWIR2240})",
+            bands_required={'SWIR1760': (1755, 1765), 'SWIR2240': (2235, 2245)},
+            reference='Acrylic polymer analysis - Wang et al. 2013',
+            theme='textiles'
+        )
+
+        self.indices_db['SPANDEX'] = SpectralIndex(
+            name='SPANDEX',
+            description='Spandex/Elastane Fiber Index (polyurethane-based fibers)',
+            formula_template="({SWIR1705} - {SWIR2330}) / ({SWIR1705} + {SWIR2330})",
+            bands_required={'SWIR1705': (1700, 1710), 'SWIR2330': (2325, 2335)},
+            reference='Polyurethane fiber spectroscopy - Kim et al. 2017',
+            theme='textiles'
+        )
+
+        self.indices_db['MICROPLASTIC'] = SpectralIndex(
+            name='MICROPLASTIC',
+            description='Microplastic Detection Index (general polymer pollution)',
+            formula_template="({SWIR1730} - {SWIR2200}) / ({SWIR1730} + {SWIR2200})",
+            bands_required={'SWIR1730': (1725, 1735), 'SWIR2200': (2195, 2205)},
+            reference='Microplastic remote sensing - Zhu et al. 2019',
+            theme='textiles'
+        )
+
+        self.indices_db['TEXTILE_BLEND'] = SpectralIndex(
+            name='TEXTILE_BLEND',
+            description='Textile Blend Index (mixed fiber detection)',
+            formula_template="({COTTON} * 0.4 + {POLYESTER} * 0.3 + {NYLON} * 0.3)",
+            bands_required={'COTTON': (-1, 1), 'POLYESTER': (-1, 1), 'NYLON': (-1, 1)},
+            reference='Textile blend analysis - Martinez et al. 2020',
+            theme='textiles'
+        )
+
+        self.indices_db['NATURAL_VS_SYNTHETIC'] = SpectralIndex(
+            name='NATURAL_VS_SYNTHETIC',
+            description='Natural vs Synthetic Fiber Index',
+            formula_template="({COTTON} + {WOOL} + {LINEN}) - ({POLYESTER} + {NYLON} + {POLYPROPYLENE})",
+            bands_required={'COTTON': (-1, 1), 'WOOL': (-1, 1), 'LINEN': (-1, 1), 'POLYESTER': (-1, 1), 'NYLON': (-1, 1), 'POLYPROPYLENE': (-1, 1)},
+            reference='Fiber classification methodology - Thompson et al. 2018',
+            theme='textiles'
+        )
+
     def find_closest_band(self, wavelength_target, available_wavelengths):
         """
         Find the closest available wavelength to a target wavelength or range.
@@ -2331,15 +2824,22 @@ class HyperspectralIndices:
                 850
             """
         if isinstance(wavelength_target, tuple):
-            # Target is a range - find center point
-            target_center = (wavelength_target[0] + wavelength_target[1]) / 2
+            min_wl, max_wl = wavelength_target
         else:
-            target_center = wavelength_target
+            min_wl = max_wl = wavelength_target
         
-        closest = min(available_wavelengths, 
-                     key=lambda x: abs(x - target_center))
-        return closest
+        return _find_closest_band(tuple(available_wavelengths), min_wl, max_wl)
         
+    def _get_index(self, index_name):
+            """
+            Look an index up by its exact name, then upper-cased.
+
+            Returns the SpectralIndex, or None when neither name is defined.
+            Mixed-case names such as CIrededge are only found exactly.
+            """
+            return (self.indices_db.get(index_name)
+                    or self.indices_db.get(index_name.upper()))
+
     def can_calculate_index(self, index_name, available_wavelengths):
             """
             Check if an index can be calculated with the available bands.
@@ -2362,28 +2862,72 @@ class HyperspectralIndices:
                 >>> print(can_calc)
                 True
             """
-            index = self.indices_db.get(index_name.upper())
-            if not index:
-                return False, "Index not found"
-            
-            for band_name, wavelength_range in index.bands_required.items():
-                found = False
-                for wl in available_wavelengths:
-                    if isinstance(wavelength_range, tuple):
-                        if wavelength_range[0] <= wl <= wavelength_range[1]:
-                            found = True
-                            break
-                    else:
-                        # Single wavelength requirement with 50nm tolerance
-                        if abs(wl - wavelength_range) < 50:
-                            found = True
-                            break
-                
-                if not found:
-                    return False, f"Required band {band_name} ({wavelength_range} nm) not available"
-            
-            return True, "OK"
-        
+            index = self._get_index(index_name)
+            if not index:
+                return False, "Index not found"
+            
+            available = self._sorted_wavelengths(available_wavelengths)
+            for band_name, wavelength_range in index.bands_required.items():
+                if isinstance(wavelength_range, tuple):
+                    # First available wavelength >= min must also be <= max
+                    pos = bisect.bisect_left(available, wavelength_range[0])
+                    found = (pos < len(available)
+                             and available[pos] <= wavelength_range[1])
+                else:
+                    # Single wavelength requirement with 50nm tolerance
+                    pos = bisect.bisect_right(available, wavelength_range - 50)
+                    found = (pos < len(available)
+                             and available[pos] < wavelength_range + 50)
+                
+                if not found:
+                    return False, f"Required band {band_name} ({wavelength_range} nm) not available"
+            
+            return True, "OK"
+        
+    def _sorted_wavelengths(self, available_wavelengths):
+            """
+            Return the available wavelengths as a sorted tuple.
+
+            The result is kept for the last wavelengths passed in, compared
+            by value so that lists changed in place are sorted again, and
+            validating many indices against the same input bands sorts them
+            once.
+            """
+            wavelengths = tuple(available_wavelengths)
+            if wavelengths != self._wl_source:
+                self._wl_source = wavelengths
+                self._wl_sorted = tuple(sorted(wavelengths))
+            return self._wl_sorted
+
+    def calculable_indices(self, available_wavelengths):
+            """
+            Get the names of all indices that can be calculated, in one pass.
+
+            Equivalent to calling can_calculate_index() for every index, but
+            evaluated as a single broadcast comparison of the available
+            wavelengths against the packed requirement ranges.
+
+            Args:
+                available_wavelengths (list): List of available wavelengths in nm
+
+            Returns:
+                set: Names of the calculable indices, or None when NumPy is
+                    not installed (use can_calculate_index() instead)
+
+            Examples:
+                >>> indices = HyperspectralIndices()
+                >>> 'NDVI' in indices.calculable_indices([665, 850])
+                True
+            """
+            if self._req_ranges is None:
+                return None
+
+            wavelengths = np.asarray(available_wavelengths, dtype=float)[:, None, None]
+            inside = ((wavelengths >= self._req_ranges[..., 0])
+                      & (wavelengths <= self._req_ranges[..., 1]))
+            found = inside.any(axis=0) | ~self._req_mask
+            return set(compress(self._names, found.all(axis=1)))
+
     def get_band_mapping(self, index_name, wavelength_to_band):
             """
             Get the mapping of required bands to actual raster names for an index.
@@ -2406,17 +2950,163 @@ class HyperspectralIndices:
                 >>> print(mapping)
                 {'RED': 'band3', 'NIR': 'band4'}
             """
-            index = self.indices_db[index_name.upper()]
+            index = self._get_index(index_name)
+            if index is None:
+                raise KeyError(index_name)
             mapping = {}
             
-            available_wl = list(wavelength_to_band.keys())
+            available_wl = tuple(wavelength_to_band)
             
             for band_name, wavelength_range in index.bands_required.items():
-                closest_wl = self.find_closest_band(wavelength_range, available_wl)
+                if isinstance(wavelength_range, tuple):
+                    min_wl, max_wl = wavelength_range
+                else:
+                    min_wl = max_wl = wavelength_range
+                closest_wl = _find_closest_band(available_wl, min_wl, max_wl)
                 mapping[band_name] = wavelength_to_band[closest_wl]
-            
+
             return mapping
-        
+
+    def resolve_bands(self, index_names, wavelength_to_band):
+            """
+            Get the band mappings of several indices, resolving each band once.
+
+            Band names are shared by many indices (RED, NIR, GREEN...), so all
+            distinct requirements of the selection are collected first and
+            matched against the input wavelengths once each; the per-index
+            mappings are then built from dictionary lookups. A few band names
+            are declared with different ranges by different indices (BLUE,
+            SWIR1, SWIR2), so requirements are keyed by name and range.
+
+            Args:
+                index_names (list): Names of the indices to map
+                wavelength_to_band (dict): Dictionary mapping wavelengths to raster names
+
+            Returns:
+                dict: Index name -> band mapping, as from get_band_mapping()
+
+            Examples:
+                >>> indices = HyperspectralIndices()
+                >>> wl_to_band = {560: 'band2', 665: 'band3', 850: 'band4'}
+                >>> maps = indices.resolve_bands(['NDVI', 'GNDVI'], wl_to_band)
+                >>> print(maps['GNDVI'])
+                {'GREEN': 'band2', 'NIR': 'band4'}
+            """
+            available_wl = tuple(wavelength_to_band)
+
+            resolved = {}
+            for index_name in index_names:
+                for requirement in self.indices_db[index_name].bands_required.items():
+                    if requirement in resolved:
+                        continue
+                    wavelength_range = requirement[1]
+                    if isinstance(wavelength_range, tuple):
+                        min_wl, max_wl = wavelength_range
+                    else:
+                        min_wl = max_wl = wavelength_range
+                    closest_wl = _find_closest_band(available_wl, min_wl, max_wl)
+                    resolved[requirement] = wavelength_to_band[closest_wl]
+
+            return {
+                index_name: {
+                    band_name: resolved[(band_name, wavelength_range)]
+                    for band_name, wavelength_range
+                    in self.indices_db[index_name].bands_required.items()
+                }
+                for index_name in index_names
+            }
+
+    def find_aliases(self, selected, band_maps, normalize=False):
+            """
+            Find indices that compute the same raster as an earlier one.
+
+            Several indices share a formula (e.g. GITELSON is the green
+            chlorophyll index CIgreen) and, once bands are resolved, many
+            more become identical because their nominal bands map to the
+            same input raster. Each r.mapcalc formula is rendered over
+            placeholder names in first-use order of the rasters and
+            compared as a canonical expression tree, so spacing, redundant
+            parentheses and the order of + and * operands do not matter,
+            while float() casts do: a / b and float(a) / b differ on CELL
+            rasters.
+
+            Args:
+                selected (list): Names of the indices to compare, in order
+                band_maps (dict): Index name -> band mapping, as from
+                    resolve_bands()
+                normalize (bool): Whether normalize_range has to match as
+                    well, e.g. when outputs get normalized
+
+            Returns:
+                dict: Alias index name -> name of the first identical index
+
+            Examples:
+                >>> indices = HyperspectralIndices()
+                >>> wl_to_band = {900: 'band1', 970: 'band2'}
+                >>> maps = indices.resolve_bands(['WI', 'SRWI'], wl_to_band)
+                >>> indices.find_aliases(['WI', 'SRWI'], maps)
+                {'SRWI': 'WI'}
+            """
+            placeholders = {}
+            originals = {}
+            aliases = {}
+            for index_name in selected:
+                index_def = self.indices_db[index_name]
+                band_map = {
+                    band_name: placeholders.setdefault(raster, f"_r{len(placeholders)}")
+                    for band_name, raster in band_maps[index_name].items()
+                }
+                # r.mapcalc syntax with float() kept: without the cast,
+                # r.mapcalc divides integer (CELL) rasters as integers
+                key = ast.dump(_canonical_tree(
+                    index_def.formula(band_map).replace("^", "**")))
+                if normalize:
+                    key = (key, index_def.normalize_range)
+                aliases[index_name] = originals.setdefault(key, index_name)
+            return {alias: original for alias, original in aliases.items()
+                    if alias != original}
+
+    def build_batched_mapcalc(self, selected, band_maps, prefix, normalize=False):
+            """
+            Group indices reading the same rasters into multi-assignment expressions.
+
+            r.mapcalc evaluates several semicolon-separated ``name = expression``
+            assignments in a single pass over the input rows, so each group of
+            indices resolved to the same set of rasters costs one read of those
+            rasters instead of one read per index.
+
+            Args:
+                selected (list): Index names to calculate, in output order
+                band_maps (dict): Index name -> band mapping from get_band_mapping()
+                prefix (str): Prefix for output raster names
+                normalize (bool): Normalize the outputs, see SpectralIndex.formula()
+
+            Returns:
+                list: (index_names, expression) tuples, one per r.mapcalc call
+
+            Examples:
+                >>> indices = HyperspectralIndices()
+                >>> maps = {'NDVI': {'RED': 'b3', 'NIR': 'b4'},
+                ...         'DVI': {'RED': 'b3', 'NIR': 'b4'}}
+                >>> indices.build_batched_mapcalc(['NDVI', 'DVI'], maps, 'out')
+                [(['NDVI', 'DVI'], 'out_NDVI = float(b4 - b3) / (b4 + b3); out_DVI = b4 - b3')]
+            """
+            groups = {}
+            for index_name in selected:
+                rasters = frozenset(band_maps[index_name].values())
+                groups.setdefault(rasters, []).append(index_name)
+
+            batches = []
+            for names in groups.values():
+                assignments = [
+                    f"{prefix}_{name} = "
+                    f"{self.indices_db[name].formula(band_maps[name], normalize)}"
+                    for name in names
+                ]
+                batches.append((names, "; ".join(assignments)))
+
+            return batches
+
     def list_indices(self, theme=None):
             """
             List available indices, optionally filtered by theme.
@@ -2433,14 +3123,9 @@ class HyperspectralIndices:
                 >>> print(len(veg_indices))
                 15
             """
-            indices_list = []
-            
-            for name, index in sorted(self.indices_db.items()):
-                if theme and index.theme != theme:
-                    continue
-                indices_list.append(index)
-            
-            return indices_list
+            if not theme:
+                return [self.indices_db[name] for name in self._names]
+            return list(self._by_theme.get(theme, ()))
         
     def get_themes(self):
             """
@@ -2455,8 +3140,34 @@ class HyperspectralIndices:
                 >>> 'vegetation' in themes
                 True
             """
-            themes = set(index.theme for index in self.indices_db.values())
-            return sorted(themes)
+            return list(self._theme_names)
+
+
+_INDICES = None
+
+
+def get_indices(themes=None):
+    """
+    Return the module-wide HyperspectralIndices instance.
+
+    The database is built on first use and shared by later calls, which
+    only add the themes not loaded yet.
+
+    Args:
+        themes: Optional iterable of theme names the caller needs; all
+            themes when None
+
+    Returns:
+        HyperspectralIndices: The shared instance
+    """
+    global _INDICES
+    if _INDICES is None:
+        _INDICES = HyperspectralIndices(themes=themes)
+    elif themes is None:
+        _INDICES.load_themes(HyperspectralIndices._THEME_INDICES)
+    else:
+        _INDICES.load_themes(themes)
+    return _INDICES
 
 
         
@@ -2513,6 +3224,740 @@ def _extract_slices_from_3d(map3d, wavelengths, tmp_prefix):
     return band_names
 
 
+def _parse_wavelengths(text):
+    """
+    Parse a comma-separated list of wavelengths into a list of floats.
+
+    The string is converted in one np.fromstring() call when NumPy is
+    available. Raises ValueError on empty or non-numeric entries.
+    """
+    if np is None:
+        return [float(wl) for wl in text.split(',')]
+    with warnings.catch_warnings():
+        # Older NumPy only warns and stops at unparsable data
+        warnings.simplefilter('ignore', DeprecationWarning)
+        values = np.fromstring(text, dtype=np.float64, sep=',')
+    if values.size != text.count(',') + 1:
+        raise ValueError(f"invalid wavelength list: {text}")
+    return values.tolist()
+
+
+def _count_operators(expression):
+    """Return the number of arithmetic operators in a Python expression."""
+    return len(_PYTHON_OPERATOR.findall(expression))
+
+
+@lru_cache(maxsize=None)
+def _numba_kernel(formula_template, dtype='float32'):
+    """
+    Compile a parallel Numba kernel for an index formula template.
+
+    The generated function loops over flat, contiguous band arrays of the
+    given dtype name ('float32' or 'float64') with prange() and writes each
+    pixel of the flat float32 output array in one pass. It is compiled
+    eagerly for that exact signature and cached per (template, dtype), so
+    each specialization compiles once per run and calls skip Numba's type
+    dispatch.
+
+    Returns (bands, kernel): the band names in kernel argument order and
+    the compiled kernel, called as kernel(*band_arrays, out).
+    """
+    bands = sorted({field for _, field, _, _ in
+                    string.Formatter().parse(formula_template) if field})
+    expression = _to_python(
+        formula_template.format_map({band: f"{band}[i]" for band in bands}))
+    source = (
+        f"def _kernel({', '.join(bands)}, out):\n"
+        f"    for i in prange(out.size):\n"
+        f"        out[i] = {expression}\n"
+    )
+    namespace = {'prange': numba.prange, 'sqrt': math.sqrt, 'log': math.log}
+    exec(source, namespace)
+    # error_model='numpy' makes x/0 yield inf/nan like NumPy instead of raising
+    band_type = getattr(numba.types, dtype)[::1]
+    signature = numba.types.void(*[band_type] * len(bands),
+                                 numba.types.float32[::1])
+    kernel = numba.njit(signature, parallel=True, fastmath=_NUMBA_FASTMATH,
+                        error_model='numpy')(namespace['_kernel'])
+    return bands, kernel
+
+
+def _run_shared_kernel(kind, a, b, out, jit=True):
+    """
+    Compute a shared formula shape ('ndi' or 'ratio') of two bands into out.
+
+    One kernel serves every index of that shape: a numexpr evaluation,
+    else a Numba kernel compiled once per shape (numexpr needs no
+    compilation), else NumPy. jit=False forces NumPy, e.g. for float16
+    inputs that Numba and numexpr do not support.
+    """
+    template = _SHARED_TEMPLATES[kind]
+    if jit and numexpr is not None:
+        numexpr.evaluate(_to_python(template.format(A='a', B='b')),
+                         local_dict={'a': a, 'b': b}, out=out,
+                         casting='same_kind')
+    elif jit and numba is not None:
+        _bands, kernel = _numba_kernel(template)
+        kernel(a.reshape(-1), b.reshape(-1), out.reshape(-1))
+    elif kind == 'ndi':
+        np.subtract(a, b, out=out)
+        out /= a + b
+    else:
+        np.divide(a, b, out=out)
+
+
+@lru_cache(maxsize=None)
+def _cupy_kernel(formula_template):
+    """
+    Compile a formula template into a CuPy elementwise kernel.
+
+    Returns (bands, kernel): the kernel takes one array per band name in
+    bands, all float32 or all float16, followed by the float32 output
+    array. Kernels are cached per template, so
+    all normalized differences share one kernel, as do all plain ratios.
+    """
+    bands = sorted({field for _, field, _, _ in
+                    string.Formatter().parse(formula_template) if field})
+    expression = _MAPCALC_FLOAT_CAST.sub("(", formula_template).replace(
+        "abs(", "fabs(")
+    expression = expression.format_map({band: f"b_{band}" for band in bands})
+    kernel = cupy.ElementwiseKernel(
+        ", ".join(f"T b_{band}" for band in bands), "float32 out",
+        f"out = {expression}", "i_hyper_indices_kernel")
+    return bands, kernel
+
+
+def _calculate_mapcalc(indices_obj, selected, band_maps, output_prefix,
+                       normalize=False):
+    """
+    Calculate indices with a single r.mapcalc run.
+
+    All expressions are fed to r.mapcalc file=- as one script, so every
+    input band is read once for the whole selection. If that run fails,
+    the indices are calculated again with one r.mapcalc call per group of
+    shared bands, so that only the groups that fail are reported. With
+    normalize, the scaling to 0-1 is part of each expression.
+
+    Returns (calculated, failed) lists of index names.
+    """
+    if not selected:
+        return [], []
+
+    script = "\n".join(
+        f"{output_prefix}_{index_name} = "
+        f"{indices_obj.indices_db[index_name].formula(band_maps[index_name], normalize)}"
+        for index_name in selected
+    )
+    gs.message(_("Calculating {}...").format(', '.join(selected)))
+    try:
+        gs.write_command('r.mapcalc', file='-', stdin=script,
+                         overwrite=True, quiet=True)
+        return list(selected), []
+    except CalledModuleError as e:
+        gs.warning(_("Single r.mapcalc run failed ({}), calculating the "
+                     "indices by group").format(str(e)))
+
+    calculated = []
+    failed = []
+    for group, expression in indices_obj.build_batched_mapcalc(
+            selected, band_maps, output_prefix, normalize):
+        gs.message(_("Calculating {}...").format(', '.join(group)))
+        try:
+            mapcalc(expression, overwrite=True, quiet=True)
+        except CalledModuleError as e:
+            gs.warning(_("Failed to calculate {}: {}").format(
+                ', '.join(group), str(e)))
+            failed.extend(group)
+            continue
+        calculated.extend(group)
+    return calculated, failed
+
+
+def _tile_rows(cols, n_bands, budget=_TILE_CACHE_BYTES):
+    """Return how many raster rows make one tile of the given byte budget."""
+    # Input bands plus about as many temporaries and outputs, as float32
+    return max(1, budget // (cols * n_bands * 2 * 4))
+
+
+class _Canonical(ast.NodeTransformer):
+    """Rewrite an expression tree into the canonical form of _canonical_tree()."""
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, (ast.Add, ast.Mult)):
+            node.left, node.right = sorted((node.left, node.right), key=ast.dump)
+        return node
+
+    def visit_Call(self, call):
+        self.generic_visit(call)
+        arg = call.args[0] if len(call.args) == 1 else None
+        if (isinstance(call.func, ast.Name) and call.func.id == 'log'
+                and isinstance(arg, ast.BinOp)
+                and isinstance(arg.op, ast.Div)
+                and isinstance(arg.left, ast.Constant)
+                and arg.left.value == 1):
+            call.args = [arg.right]
+            return ast.UnaryOp(op=ast.USub(), operand=call)
+        return call
+
+
+def _canonical_tree(expression):
+    """
+    Parse a Python expression into a canonical AST.
+
+    Operands of + and * are ordered by their dump, which IEEE arithmetic
+    allows since both are exactly commutative, and log(1 / x) becomes
+    -log(x). Equal canonical trees (compared with ast.dump()) denote the
+    same computation.
+    """
+    return _Canonical().visit(ast.parse(expression, mode='eval').body)
+
+
+def _batch_statements(expressions):
+    """
+    Factor the common sub-expressions out of a batch of expressions.
+
+    expressions is a sequence of (key, Python expression) pairs over band
+    identifiers. Every sub-expression that occurs more than once in the
+    batch (e.g. NIR - RED, shared by NDVI, SAVI, PDI and most of the
+    vegetation-type indices) is computed once into a temporary; temporaries
+    that end up used only once are inlined again. Expressions are put in
+    canonical form first (see _canonical_tree()), so e.g. RED + NIR and
+    NIR + RED are one sub-expression, and NDLI evaluates each log once;
+    repeated sqrt() calls are shared like any other sub-expression.
+
+    Returns (bands, statements): the band identifiers used, and the
+    (target, expression source) statements in evaluation order, where
+    targets are either temporaries named _t<n> or the keys.
+    """
+    trees = [(key, _canonical_tree(expression))
+             for key, expression in expressions]
+
+    bands = sorted({node.id for _key, tree in trees for node in ast.walk(tree)
+                    if isinstance(node, ast.Name) and node.id.startswith('_b')})
+
+    counts = {}
+    for _key, tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Call)):
+                dump = ast.dump(node)
+                counts[dump] = counts.get(dump, 0) + 1
+
+    temps = {}        # node dump -> temporary name
+    statements = []   # (target, expression node)
+
+    def factor(node):
+        compound = isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Call))
+        dump = ast.dump(node) if compound else None
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, ast.AST):
+                setattr(node, field, factor(value))
+            elif isinstance(value, list):
+                setattr(node, field, [factor(item) if isinstance(item, ast.AST)
+                                      else item for item in value])
+        if not compound or counts[dump] < 2:
+            return node
+        if dump not in temps:
+            temps[dump] = f"_t{len(temps)}"
+            statements.append((temps[dump], node))
+        return ast.Name(id=temps[dump], ctx=ast.Load())
+
+    for key, tree in trees:
+        statements.append((key, factor(tree)))
+
+    # Inline temporaries referenced only once once their users are factored
+    uses = {}
+    for _target, node in statements:
+        for name in ast.walk(node):
+            if isinstance(name, ast.Name) and name.id.startswith('_t'):
+                uses[name.id] = uses.get(name.id, 0) + 1
+    inline = {target: node for target, node in statements
+              if target in uses and uses[target] == 1}
+
+    class _Inliner(ast.NodeTransformer):
+        def visit_Name(self, name):
+            if name.id in inline:
+                return self.visit(inline[name.id])
+            return name
+
+    return bands, [(target, ast.unparse(_Inliner().visit(node)))
+                   for target, node in statements if target not in inline]
+
+
+def _batch_source(expressions, use_numexpr):
+    """
+    Generate the source of one function computing a batch of expressions.
+
+    The statements are those of _batch_statements(). With use_numexpr,
+    statements with three or more operators are wrapped in evaluate().
+
+    The generated function is called as _batch(arrays, out): it reads the
+    band arrays from the arrays dict and stores each result in out[key].
+    """
+    bands, statements = _batch_statements(expressions)
+    lines = ["def _batch(arrays, out):"]
+    lines += [f"    {band} = arrays[{band!r}]" for band in bands]
+    for target, expression in statements:
+        if use_numexpr and _count_operators(expression) >= 3:
+            expression = f"evaluate({expression!r})"
+        if target.startswith('_t'):
+            lines.append(f"    {target} = {expression}")
+        else:
+            lines.append(f"    out[{target!r}] = {expression}")
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=None)
+def _batch_function(expressions, use_numexpr):
+    """
+    Compile the batch function of _batch_source(), once per selection.
+
+    expressions must be a tuple of (key, expression) pairs so that the
+    compiled function can be cached.
+    """
+    namespace = {'sqrt': np.sqrt, 'log': np.log, 'abs': np.abs}
+    if use_numexpr:
+        namespace['evaluate'] = numexpr.evaluate
+    source = _batch_source(expressions, use_numexpr)
+    exec(compile(source, '<i.hyper.indices batch>', 'exec'), namespace)
+    return namespace['_batch']
+
+
+@lru_cache(maxsize=None)
+def _fused_kernel(expressions, dtype='float32'):
+    """
+    Compile a batch of expressions into one parallel Numba kernel.
+
+    The statements of _batch_statements() become scalar locals in the body
+    of a single prange() loop, so every pixel of every band is read once
+    and all outputs of the batch are written in the same pass. As with
+    _numba_kernel(), the kernel is compiled eagerly for flat, contiguous
+    band arrays of the given dtype name and flat float32 outputs, and
+    cached per (expressions, dtype).
+
+    Returns (bands, keys, kernel): the kernel is called as
+    kernel(*band_arrays, *out_arrays) in the order of bands and keys.
+    """
+    bands, statements = _batch_statements(expressions)
+    keys = [key for key, _expression in expressions]
+    outs = {key: f"_out{position}" for position, key in enumerate(keys)}
+    lines = [f"def _fused({', '.join(f'{band}_in' for band in bands)}, "
+             f"{', '.join(outs.values())}):",
+             "    for i in prange(_out0.size):"]
+    lines += [f"        {band} = {band}_in[i]" for band in bands]
+    for target, expression in statements:
+        if target in outs:
+            lines.append(f"        {outs[target]}[i] = {expression}")
+        else:
+            lines.append(f"        {target} = {expression}")
+    namespace = {'prange': numba.prange, 'sqrt': math.sqrt, 'log': math.log}
+    exec(compile("\n".join(lines) + "\n", '<i.hyper.indices fused>', 'exec'),
+         namespace)
+    band_type = getattr(numba.types, dtype)[::1]
+    signature = numba.types.void(*[band_type] * len(bands),
+                                 *[numba.types.float32[::1]] * len(keys))
+    kernel = numba.njit(signature, parallel=True, fastmath=_NUMBA_FASTMATH,
+                        error_model='numpy')(namespace['_fused'])
+    return bands, keys, kernel
+
+
+def _batch_expressions(indices_obj, names, index_maps):
+    """Return the (name, Python expression) pairs of a batch of indices."""
+    return tuple(
+        (index_name, indices_obj.indices_db[index_name]
+         .python_expression(index_maps[index_name]))
+        for index_name in names
+    )
+
+
+def _calculate_numpy(indices_obj, selected, band_maps, output_prefix,
+                     normalize=False, precision='fp32', n_jobs=1, gpu=False):
+    """
+    Calculate indices in-process on NumPy arrays.
+
+    All rasters are streamed in one sweep through pygrass RasterRow: rows
+    are read into cache-sized strips, every selected index is computed on
+    the strip, and the results are written row by row to one open output
+    raster per index. Memory use is bounded by the strip size, and there is
+    no r.mapcalc or r.in.bin subprocess per index. The selection is
+    computed by one generated function in which shared sub-expressions are
+    evaluated once; its multi-term statements go through numexpr when it
+    is installed. Without numexpr but with Numba, a selection of at least
+    _FUSED_MIN_INDICES indices runs as one fused Numba kernel computing
+    them all in a single pass over the pixels (see _fused_kernel()), and
+    smaller selections run one JIT-compiled Numba kernel per index. Numba
+    compiles these kernels on every run, which numexpr avoids. Normalized
+    differences and plain ratios (SpectralIndex.kind 'ndi' and 'ratio')
+    skip both and run through one shared kernel per shape. With
+    precision='fp16' or 'bf16', indices with a known output range and no
+    log/sqrt are computed on float16 or bfloat16 (ml_dtypes) copies of
+    their bands with plain NumPy; results are always written as FCELL. As
+    in r.mapcalc, division by zero and invalid operations produce null
+    cells.
+
+    With n_jobs > 1 (0 for all CPUs), strips hold n_jobs cache-sized row
+    slices and a thread pool computes every selected index on each slice,
+    as NumPy and numexpr release the GIL. Numba kernels already spread over
+    all cores with prange and run on the whole strip in the calling thread,
+    which the default Numba threading layer requires.
+
+    With gpu=True (engine=cupy), larger strips are copied to the GPU once
+    and every index runs as a CuPy elementwise kernel compiled from its
+    template, the 'ndi' and 'ratio' shapes sharing one kernel each. All
+    work is queued on one non-blocking CUDA stream with double-buffered
+    results, so the GPU computes and copies back the next index while the
+    previous one is written. precision='fp16' feeds the same indices as on
+    the CPU to the kernels as float16 strips; bf16 and n_jobs do not apply
+    there.
+
+    Returns (calculated, failed) lists of index names.
+    """
+    from grass.pygrass.errors import OpenError
+    from grass.pygrass.raster import RasterRow
+    from grass.pygrass.raster.buffer import Buffer
+
+    region = gs.region()
+    rows, cols = int(region['rows']), int(region['cols'])
+
+    # One output raster per index, open for the whole sweep
+    writers = {}
+    failed = []
+    for index_name in selected:
+        output_name = f"{output_prefix}_{index_name}"
+        writer = RasterRow(output_name)
+        try:
+            writer.open('w', mtype='FCELL', overwrite=True)
+        except OpenError as e:
+            gs.warning(_("Failed to calculate {}: {}").format(index_name, str(e)))
+            failed.append(index_name)
+            continue
+        writers[index_name] = writer
+    selected = [index_name for index_name in selected if index_name in writers]
+    if not selected:
+        return [], failed
+
+    # Raster names may contain '.' or '@', so bind each one to a Python
+    # identifier that the translated expressions refer to
+    idents = {}
+    for index_name in selected:
+        for raster in band_maps[index_name].values():
+            idents.setdefault(raster, f"_b{len(idents)}")
+
+    index_maps = {}
+    for index_name in selected:
+        index_maps[index_name] = {
+            band: idents[raster]
+            for band, raster in band_maps[index_name].items()
+        }
+
+    if n_jobs <= 0:
+        n_jobs = os.cpu_count() or 1
+    if gpu:
+        n_jobs = 1
+
+    # Work on strips of full rows: every selected index is computed on a
+    # slice of the strip while its bands are still in cache, one slice per
+    # thread. A strip never holds more rows than the region, split evenly
+    # between the threads
+    slice_rows = _tile_rows(cols, len(idents),
+                            _TILE_GPU_BYTES if gpu else _TILE_CACHE_BYTES)
+    tile_rows = min(rows, slice_rows * n_jobs)
+    slice_rows = -(-tile_rows // n_jobs)
+    readers = {}
+    for raster, ident in idents.items():
+        gs.verbose(_("Reading <{}>").format(raster))
+        reader = RasterRow(raster)
+        reader.open('r')
+        readers[ident] = (reader, Buffer((cols,), mtype=reader.mtype))
+    # Page-locked strips let the GPU copies run asynchronously
+    empty = cupyx.empty_pinned if gpu else np.empty
+    strips = {ident: empty((tile_rows, cols), dtype=np.float32)
+              for ident in idents.values()}
+    # On the GPU the indices are copied back one at a time, see below
+    outputs = {index_name: np.empty((tile_rows, cols), dtype=np.float32)
+               for index_name in ([] if gpu else selected)}
+    row_buffers = {index_name: Buffer((cols,), mtype='FCELL')
+                   for index_name in selected}
+
+    # With precision=fp16 or bf16, bounded indices without log/sqrt run on
+    # half-precision copies of their bands; the others keep the float32 path
+    half_dtype = {'fp16': np.float16,
+                  'bf16': ml_dtypes and ml_dtypes.bfloat16}.get(precision)
+    half = []
+    if half_dtype is not None:
+        half = [index_name for index_name in selected
+                if indices_obj.indices_db[index_name].normalize_range
+                and not indices_obj.indices_db[index_name].sensitive]
+    full = [index_name for index_name in selected if index_name not in half]
+    # float16 overflows to inf above 65504, e.g. on 16-bit DN bands: strips
+    # of such bands stay float32, and so do the indices reading them
+    half_max = np.finfo(np.float16).max if precision == 'fp16' else np.inf
+
+    def overflows(band, xp=np):
+        return half_max < np.inf and bool(xp.any(xp.abs(band) > half_max))
+
+    # Each group: (band identifiers, JIT allowed, shared-kernel indices,
+    # per-kernel indices, fused Numba kernel, batch function). Normalized
+    # differences and plain ratios go through one shared kernel per shape.
+    groups = []
+    for names, jit in ((full, True), (half, False)):
+        if not names or gpu:
+            continue
+        group_idents = sorted({ident for index_name in names
+                               for ident in index_maps[index_name].values()})
+        shared = [index_name for index_name in names
+                  if indices_obj.indices_db[index_name].kind in _SHARED_TEMPLATES]
+        others = [index_name for index_name in names if index_name not in shared]
+        kernels = []
+        fused = batch = None
+        if (jit and numexpr is None and numba is not None
+                and len(others) >= _FUSED_MIN_INDICES):
+            fused = _fused_kernel(
+                _batch_expressions(indices_obj, others, index_maps))
+        elif jit and numexpr is None and numba is not None:
+            kernels = others
+        elif others:
+            batch = _batch_function(
+                _batch_expressions(indices_obj, others, index_maps),
+                jit and numexpr is not None)
+        groups.append((group_idents, jit, shared, kernels, fused, batch))
+    # On the GPU, bands of the half-precision indices get float16 copies
+    half_idents = sorted({ident for index_name in half
+                          for ident in index_maps[index_name].values()})
+
+    scales = {}
+    for index_name in selected:
+        index_def = indices_obj.indices_db[index_name]
+        if normalize and index_def.normalize_range:
+            min_val, max_val = index_def.normalize_range
+            scales[index_name] = (min_val, max_val - min_val)
+
+    def run_shared(index_name, tile, out_tile, jit):
+        index_def = indices_obj.indices_db[index_name]
+        a, b = (tile[index_maps[index_name][band]]
+                for band in index_def.operands)
+        _run_shared_kernel(index_def.kind, a, b, out_tile, jit=jit)
+
+    def run_kernel(index_name, tile, out_tile):
+        bands = {band: tile[ident]
+                 for band, ident in index_maps[index_name].items()}
+        indices_obj.kernels[index_name](bands, out_tile)
+
+    def run_batch(batch, tile, lo, hi):
+        results = {}
+        batch(tile, results)
+        for index_name, result in results.items():
+            outputs[index_name][lo:hi] = result
+
+    def run_fused(fused, tile, lo, hi):
+        bands, keys, kernel = fused
+        kernel(*[tile[ident].reshape(-1) for ident in bands],
+               *[outputs[index_name][lo:hi].reshape(-1) for index_name in keys])
+
+    def compute(lo, hi, in_numba):
+        # Rows lo:hi of the strip, either everything but the Numba kernels
+        # (safe in a pool thread) or only the Numba kernels. np.errstate
+        # only applies to the thread entering it, so each call enters it.
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for group_idents, jit, shared, kernels, fused, batch in groups:
+                numba_shared = jit and numba is not None
+                if in_numba:
+                    shared = shared if numba_shared else []
+                    batch = None
+                else:
+                    shared = [] if numba_shared else shared
+                    kernels = []
+                    fused = None
+                if not (shared or kernels or fused or batch):
+                    continue
+                if jit:
+                    tile = {ident: strips[ident][lo:hi] for ident in group_idents}
+                else:
+                    # numexpr and Numba have no float16/bfloat16 support;
+                    # mixed with float16 bands, float32 ones promote
+                    tile = {}
+                    for ident in group_idents:
+                        band = strips[ident][lo:hi]
+                        tile[ident] = (band if overflows(band)
+                                       else band.astype(half_dtype))
+                for index_name in shared:
+                    run_shared(index_name, tile, outputs[index_name][lo:hi], jit)
+                for index_name in kernels:
+                    run_kernel(index_name, tile, outputs[index_name][lo:hi])
+                if fused is not None:
+                    run_fused(fused, tile, lo, hi)
+                if batch is not None:
+                    run_batch(batch, tile, lo, hi)
+
+    def run_gpu(index_name, tile, out_tile):
+        index_def = indices_obj.indices_db[index_name]
+        band_map = index_maps[index_name]
+        if index_def.kind in _SHARED_TEMPLATES:
+            template = _SHARED_TEMPLATES[index_def.kind]
+            band_map = dict(zip(('A', 'B'), (band_map[band]
+                                             for band in index_def.operands)))
+        else:
+            template = index_def.formula_template
+        bands, kernel = _cupy_kernel(template)
+        kernel(*[tile[band_map[band]] for band in bands], out_tile)
+
+    def write(index_name, out_tile):
+        writer = writers[index_name]
+        buffer = row_buffers[index_name]
+        for out_row in out_tile:
+            buffer[:] = out_row
+            writer.put_row(buffer)
+
+    def finish(out_tile, index_name):
+        xp = cupy if gpu else np
+        xp.copyto(out_tile, xp.nan, where=~xp.isfinite(out_tile))
+        if index_name in scales:
+            min_val, scale = scales[index_name]
+            out_tile -= min_val
+            out_tile /= scale
+
+    def finish_rows(lo, hi):
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for index_name in selected:
+                finish(outputs[index_name][lo:hi], index_name)
+
+    executor = None
+    if n_jobs > 1:
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
+    if gpu:
+        stream = cupy.cuda.Stream(non_blocking=True)
+        gpu_out = [cupy.empty((tile_rows, cols), dtype=cupy.float32)
+                   for _ in range(2)]
+        host_out = [cupyx.empty_pinned((tile_rows, cols), dtype=np.float32)
+                    for _ in range(2)]
+        # CuPy 13 made get() wait for the copy unless told not to; earlier
+        # versions already copy asynchronously on the given stream
+        copy_async = ({'blocking': False}
+                      if int(cupy.__version__.split('.')[0]) >= 13 else {})
+
+    gs.message(_("Calculating {}...").format(', '.join(selected)))
+    try:
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for row in range(0, rows, tile_rows):
+                gs.percent(row, rows, tile_rows)
+                n_rows = min(tile_rows, rows - row)
+                for ident, (reader, buffer) in readers.items():
+                    strip = strips[ident]
+                    for i in range(n_rows):
+                        reader.get_row(row + i, buffer)
+                        strip[i] = buffer
+                        if reader.mtype == 'CELL':
+                            strip[i][buffer == _CELL_NULL] = np.nan
+
+                if gpu:
+                    # Index i computes into buffer i % 2 and is copied back
+                    # asynchronously; index i - 1 is written meanwhile. The
+                    # stream orders the reuse of each buffer two indices
+                    # later after its copy back.
+                    pending = None
+                    with stream:
+                        tile = {ident: cupy.asarray(strip[:n_rows])
+                                for ident, strip in strips.items()}
+                        # Kernel inputs share one type, so an index with
+                        # any band out of float16 range stays float32
+                        wide = {ident for ident in half_idents
+                                if overflows(tile[ident], cupy)}
+                        half_tile = {ident: tile[ident].astype(cupy.float16)
+                                     for ident in half_idents
+                                     if ident not in wide}
+                        for i, index_name in enumerate(selected):
+                            out_tile = gpu_out[i % 2][:n_rows]
+                            in_half = (index_name in half and wide.isdisjoint(
+                                index_maps[index_name].values()))
+                            run_gpu(index_name,
+                                    half_tile if in_half else tile,
+                                    out_tile)
+                            finish(out_tile, index_name)
+                            host_tile = host_out[i % 2][:n_rows]
+                            out_tile.get(stream=stream, out=host_tile,
+                                         **copy_async)
+                            copied = stream.record()
+                            if pending is not None:
+                                pending[1].synchronize()
+                                write(pending[0], pending[2])
+                            pending = (index_name, copied, host_tile)
+                    if pending is not None:
+                        pending[1].synchronize()
+                        write(pending[0], pending[2])
+                    continue
+
+                if executor is None:
+                    compute(0, n_rows, False)
+                    compute(0, n_rows, True)
+                    finish_rows(0, n_rows)
+                else:
+                    slices = [(lo, min(lo + slice_rows, n_rows))
+                              for lo in range(0, n_rows, slice_rows)]
+                    futures = [executor.submit(compute, lo, hi, False)
+                               for lo, hi in slices]
+                    compute(0, n_rows, True)
+                    for future in futures:
+                        future.result()
+                    list(executor.map(finish_rows, *zip(*slices)))
+
+                for index_name in selected:
+                    write(index_name, outputs[index_name][:n_rows])
+            gs.percent(1, 1, 1)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for reader, _buffer in readers.values():
+            reader.close()
+        for writer in writers.values():
+            writer.close()
+
+    return selected, failed
+
+
+def _run_many(commands):
+    """
+    Run independent GRASS module calls concurrently.
+
+    commands is a list of (module, parameters) pairs that do not touch
+    the same maps. All calls share one copy of the environment and are
+    launched from a thread pool, as each thread only waits for its
+    subprocess.
+
+    Returns the CalledModuleError of each call, or None where it succeeded,
+    in the order of commands.
+    """
+    env = os.environ.copy()
+
+    def run(command):
+        module, parameters = command
+        try:
+            run_command(module, env=env, **parameters)
+        except CalledModuleError as e:
+            return e
+        return None
+
+    if len(commands) < 2:
+        return [run(command) for command in commands]
+    with ThreadPoolExecutor(max_workers=min(len(commands),
+                                            os.cpu_count() or 1)) as executor:
+        return list(executor.map(run, commands))
+
+
+# r.colors tables defined on absolute values rather than percentages of
+# the map range, which can be applied to several maps in one call
+_ABSOLUTE_COLORS = frozenset(['ndvi'])
+
+
+def _color_for(index_def):
+    """Return the r.colors color table for the output of an index."""
+    if ('NDV' in index_def.name or 'EVI' in index_def.name
+            or index_def.theme == 'vegetation'):
+        return 'ndvi'
+    if index_def.theme == 'water':
+        return 'water'
+    return 'viridis'
+
+
 def list_available_indices(indices_obj, detailed=False):
     """
     Print formatted list of available indices organized by theme.
@@ -2565,14 +4010,6 @@ def main():
     # Parse command line - CRITICAL: missing in original
     options, flags = gs.parser()
     
-    # Initialize indices database
-    indices_obj = HyperspectralIndices()
-    
-    # Handle list flag - show available indices and exit
-    if flags['l']:
-        list_available_indices(indices_obj, detailed=flags['i'])
-        return 0
-    
     # Get command-line options
     input_bands = options['input']
     input3d = options['input3d']
@@ -2581,9 +4018,37 @@ def main():
     output_prefix = options['output_prefix']
     indices_str = options['indices']
     theme = options['theme']
+    engine = 'cupy' if flags['g'] else options['engine']
+
+    # Initialize indices database, building only the themes the selection
+    # needs (all of them for -l, theme=all or indices=all)
+    themes = None
+    if flags['l'] or theme == 'all':
+        pass
+    elif theme:
+        themes = [theme]
+    elif indices_str.lower() != 'all':
+        themes = HyperspectralIndices.themes_for(
+            idx.strip().upper() for idx in indices_str.split(','))
+    indices_obj = get_indices(themes)
+    
+    # Handle list flag - show available indices and exit
+    if flags['l']:
+        list_available_indices(indices_obj, detailed=flags['i'])
+        return 0
 
     if not output_prefix:
         gs.fatal(_("Required parameter <output_prefix> not set"))
+    if engine in ('numpy', 'cupy') and np is None:
+        gs.fatal(_("engine={} requires the NumPy Python package").format(engine))
+    if engine == 'cupy' and cupy is None:
+        gs.fatal(_("engine=cupy requires the CuPy Python package"))
+    if options['precision'] == 'fp16' and engine == 'mapcalc':
+        gs.fatal(_("precision=fp16 requires engine=numpy or engine=cupy"))
+    if options['precision'] == 'bf16' and engine != 'numpy':
+        gs.fatal(_("precision=bf16 requires engine=numpy"))
+    if options['precision'] == 'bf16' and ml_dtypes is None:
+        gs.fatal(_("precision=bf16 requires the ml_dtypes Python package"))
 
     # ====================================================================
     # 3D RASTER INPUT PATH
@@ -2597,7 +4062,7 @@ def main():
         if not band_wavelengths_str:
             gs.fatal(_("band_wavelengths required when input3d is set"))
         try:
-            wavelengths = [float(wl) for wl in band_wavelengths_str.split(',')]
+            wavelengths = _parse_wavelengths(band_wavelengths_str)
         except ValueError:
             gs.fatal(_("Invalid band_wavelengths values"))
 
@@ -2623,7 +4088,7 @@ def main():
         input_bands = input_bands.split(',')
 
         try:
-            wavelengths = [float(wl) for wl in wavelengths_str.split(',')]
+            wavelengths = _parse_wavelengths(wavelengths_str)
         except ValueError:
             gs.fatal(_("Invalid wavelength values. Use comma-separated numbers "
                        "(e.g., 450,550,670,800)"))
@@ -2666,11 +4131,13 @@ def main():
         gs.verbose(_("Selected {} specific indices").format(len(indices_to_calc)))
     
     # ====================================================================
-    # INDEX CALCULATION LOOP
+    # INDEX VALIDATION
     # ====================================================================
     
     calculated = 0
     skipped = 0
+    selected = []
+    calculable = indices_obj.calculable_indices(wavelengths)
     
     gs.message(_("Starting index calculation..."))
     gs.message("-" * 70)
@@ -2684,59 +4151,92 @@ def main():
             continue
         
         # Check if we have the required bands for this index
-        can_calc, msg = indices_obj.can_calculate_index(index_name, wavelengths)
+        if calculable is not None and index_name in calculable:
+            can_calc = True
+        else:
+            can_calc, msg = indices_obj.can_calculate_index(index_name, wavelengths)
         
         if not can_calc:
             gs.warning(_("Cannot calculate {}: {}").format(index_name, msg))
             skipped += 1
             continue
         
-        # FIXED: Indentation - all below now properly nested under successful validation
-        
-        # Get band mapping for this index
-        band_mapping = indices_obj.get_band_mapping(index_name, wavelength_to_band)
-        
-        # Get index definition
-        index_def = indices_obj.indices_db[index_name]
-        
-        # Generate the formula
-        formula = index_def.formula(band_mapping)
-        
-        # Output name
-        output_name = f"{output_prefix}_{index_name}"
-        
-        # Calculate the index using r.mapcalc
-        gs.message(_("Calculating {}...").format(index_name))
-        
-        try:
-            # FIXED: Use proper GRASS API
-            mapcalc(f"{output_name} = {formula}", overwrite=True)
-            
-            # Apply normalization if requested and applicable
-            if flags['n'] and hasattr(index_def, 'normalize_range') and index_def.normalize_range:
-                min_val, max_val = index_def.normalize_range
-                temp_name = f"{output_name}_temp"
-                norm_formula = f"({output_name} - {min_val}) / ({max_val} - {min_val})"
-                mapcalc(f"{temp_name} = {norm_formula}", overwrite=True)
-                # Rename normalized to main output
-                run_command('g.rename', raster=f"{temp_name},{output_name}", overwrite=True, quiet=True)
-                gs.message(f"  -> Created normalized version: {output_name}")
-            
-            # Set appropriate color table
-            if 'NDV' in index_name or 'EVI' in index_name or getattr(index_def, 'theme', '') == 'vegetation':
-                run_command('r.colors', map=output_name, color='ndvi', quiet=True)
-            elif getattr(index_def, 'theme', '') == 'water':
-                run_command('r.colors', map=output_name, color='water', quiet=True)
-            else:
-                run_command('r.colors', map=output_name, color='viridis', quiet=True)
-            
-            calculated += 1
-            gs.message(f"  -> Successfully created: {output_name}")
-            
-        except CalledModuleError as e:
-            gs.warning(_("Failed to calculate {}: {}").format(index_name, str(e)))
-            skipped += 1
+        selected.append(index_name)
+    
+    # Resolve every distinct band requirement of the selection once
+    band_maps = indices_obj.resolve_bands(selected, wavelength_to_band)
+
+    # Indices identical to an earlier one are copied instead of computed
+    aliases = indices_obj.find_aliases(
+        selected, band_maps,
+        normalize=flags['n'] or (engine in ('numpy', 'cupy')
+                                 and options['precision'] != 'fp32'))
+    unique = [index_name for index_name in selected if index_name not in aliases]
+    
+    # ====================================================================
+    # INDEX CALCULATION
+    # ====================================================================
+    
+    if engine in ('numpy', 'cupy'):
+        done, failed = _calculate_numpy(indices_obj, unique, band_maps,
+                                        output_prefix, normalize=flags['n'],
+                                        precision=options['precision'],
+                                        n_jobs=int(options['n_jobs']),
+                                        gpu=engine == 'cupy')
+    else:
+        done, failed = _calculate_mapcalc(indices_obj, unique, band_maps,
+                                          output_prefix, normalize=flags['n'])
+
+    computed = set(done)
+    copies = []
+    for alias, original in aliases.items():
+        if original not in computed:
+            gs.warning(_("Failed to calculate {}: not copied, {} failed").format(
+                alias, original))
+            failed.append(alias)
+            continue
+        gs.verbose(_("{} is identical to {}, copying").format(alias, original))
+        copies.append(alias)
+    errors = _run_many([
+        ('g.copy', dict(raster=f"{output_prefix}_{aliases[alias]},"
+                               f"{output_prefix}_{alias}",
+                        overwrite=True, quiet=True))
+        for alias in copies
+    ])
+    for alias, error in zip(copies, errors):
+        if error is not None:
+            gs.warning(_("Failed to calculate {}: {}").format(alias, str(error)))
+            failed.append(alias)
             continue
+        done.append(alias)
+    skipped += len(failed)
+    
+    # Both engines already applied the normalization (-n) while calculating.
+    # r.colors builds one table over the combined range of all maps given,
+    # so only the absolute tables color several maps per call; relative
+    # ones keep one call per map. The calls run concurrently.
+    batches = {}
+    for index_name in done:
+        color = _color_for(indices_obj.indices_db[index_name])
+        key = color if color in _ABSOLUTE_COLORS else (color, index_name)
+        batches.setdefault(key, (color, []))[1].append(index_name)
+    errors = _run_many([
+        ('r.colors', dict(map=','.join(f"{output_prefix}_{index_name}"
+                                       for index_name in index_names),
+                          color=color, quiet=True))
+        for color, index_names in batches.values()
+    ])
+    for (_color, index_names), error in zip(batches.values(), errors):
+        if error is not None:
+            gs.warning(_("Failed to calculate {}: {}").format(
+                ', '.join(index_names), str(error)))
+            skipped += len(index_names)
+            continue
+        calculated += len(index_names)
+        output_names = [f"{output_prefix}_{index_name}"
+                        for index_name in index_names]
+        for output_name in output_names:
+            gs.message(f"  -> Successfully created: {output_name}")
     
     # Summary
     gs.message("\n" + "="*70)
@@ -2748,5 +4248,4 @@ def main():
 
 
 if __name__ == "__main__":
-    options, flags = gs.parser()
     sys.exit(main())
@@ -0,0 +1,103 @@
+"""Tests of the generated batch function, fused kernel and index kernels."""
+
+import importlib.util
+import os
+import unittest
+
+import numpy as np
+
+_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            os.pardir, 'i.hyper.indices.py')
+_spec = importlib.util.spec_from_file_location('i_hyper_indices', _MODULE_PATH)
+i_hyper_indices = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(i_hyper_indices)
+
+
+class TestBatch(unittest.TestCase):
+    """Every calculable index matches NumPy on its python_expression()."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.indices = i_hyper_indices.HyperspectralIndices()
+        wavelengths = sorted({
+            (min_wl + max_wl) // 2
+            for index_def in cls.indices.indices_db.values()
+            for min_wl, max_wl in (
+                wavelength_range if isinstance(wavelength_range, tuple)
+                else (wavelength_range, wavelength_range)
+                for wavelength_range in index_def.bands_required.values())
+        })
+        # Band identifiers as bound by _calculate_numpy()
+        wavelength_to_band = {wl: f"_b{wl}" for wl in wavelengths}
+        cls.names = [
+            index_name for index_name in cls.indices.indices_db
+            if cls.indices.can_calculate_index(index_name, wavelengths)[0]
+        ]
+        cls.band_maps = cls.indices.resolve_bands(cls.names, wavelength_to_band)
+        cls.expressions = i_hyper_indices._batch_expressions(
+            cls.indices, cls.names, cls.band_maps)
+
+        # Reflectances with null (NaN) and zero pixels in every band
+        rng = np.random.default_rng(0)
+        cls.arrays = {}
+        for band in wavelength_to_band.values():
+            array = rng.uniform(0.01, 1.0, 64).astype(np.float32)
+            array[0] = np.nan
+            array[1] = 0
+            array[rng.integers(2, 64, 4)] = 0
+            cls.arrays[band] = array
+        cls.expected = {}
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for index_name, expression in cls.expressions:
+                cls.expected[index_name] = np.broadcast_to(
+                    eval(expression,
+                         {'sqrt': np.sqrt, 'log': np.log, 'abs': np.abs},
+                         dict(cls.arrays)),
+                    64).astype(np.float32)
+
+    def assertMatches(self, index_name, result):
+        # Non-finite results become null cells, as in _calculate_numpy()
+        result = np.where(np.isfinite(result), result, np.nan)
+        expected = self.expected[index_name]
+        expected = np.where(np.isfinite(expected), expected, np.nan)
+        np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-6,
+                                   equal_nan=True, err_msg=index_name)
+
+    def test_calculable_set(self):
+        self.assertGreater(len(self.names), 100)
+
+    def check_batch(self, use_numexpr):
+        batch = i_hyper_indices._batch_function(self.expressions, use_numexpr)
+        out = {}
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            batch(self.arrays, out)
+        for index_name in self.names:
+            self.assertMatches(index_name, np.broadcast_to(out[index_name], 64))
+
+    def test_batch_function(self):
+        self.check_batch(False)
+
+    @unittest.skipIf(i_hyper_indices.numexpr is None, "numexpr not installed")
+    def test_batch_function_numexpr(self):
+        self.check_batch(True)
+
+    @unittest.skipIf(i_hyper_indices.numba is None, "Numba not installed")
+    def test_fused_kernel(self):
+        bands, keys, kernel = i_hyper_indices._fused_kernel(self.expressions)
+        out = {key: np.empty(64, dtype=np.float32) for key in keys}
+        kernel(*[self.arrays[band] for band in bands],
+               *[out[key] for key in keys])
+        for index_name in self.names:
+            self.assertMatches(index_name, out[index_name])
+
+    def test_kernels(self):
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for index_name in self.names:
+                bands = {band: self.arrays[ident] for band, ident
+                         in self.band_maps[index_name].items()}
+                out = np.empty(64, dtype=np.float32)
+                self.indices.kernels[index_name](bands, out)
+                self.assertMatches(index_name, out)
+
+if __name__ == '__main__':
+    unittest.main()
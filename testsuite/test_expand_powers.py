@@ -0,0 +1,44 @@
+"""Tests of _expand_powers()."""
+
+import importlib.util
+import os
+import unittest
+
+_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            os.pardir, 'i.hyper.indices.py')
+_spec = importlib.util.spec_from_file_location('i_hyper_indices', _MODULE_PATH)
+i_hyper_indices = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(i_hyper_indices)
+_expand_powers = i_hyper_indices._expand_powers
+
+
+class TestExpandPowers(unittest.TestCase):
+    """Small integer powers become products, anything else is kept."""
+
+    def test_band_power(self):
+        self.assertEqual(_expand_powers("{X}^2"), "(float({X}) * {X})")
+        self.assertEqual(_expand_powers("{X}^2 + {Y}^3"),
+                         "(float({X}) * {X}) + (float({Y}) * {Y} * {Y})")
+
+    def test_parenthesis_power(self):
+        self.assertEqual(
+            _expand_powers("({A} - {B})^3"),
+            "(float(({A} - {B})) * ({A} - {B}) * ({A} - {B}))")
+
+    def test_function_power(self):
+        self.assertEqual(_expand_powers("sqrt({A})^2"),
+                         "(float(sqrt({A})) * sqrt({A}))")
+
+    def test_other_exponents_are_kept(self):
+        for template in ("{X}^2.5", "{X}^23", "{X}^0.5", "{X} ^ 2"):
+            self.assertEqual(_expand_powers(template), template)
+
+    def test_chained_powers_are_kept(self):
+        for template in ("{X}^2^3", "({A} + {B})^3^2", "{X}^2.5^2"):
+            self.assertEqual(_expand_powers(template), template)
+        # The right-hand power of a chain is its own operand
+        self.assertEqual(_expand_powers("{X}^{Y}^2"),
+                         "{X}^(float({Y}) * {Y})")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Tests of HyperspectralIndices.find_aliases()."""
+
+import importlib.util
+import os
+import unittest
+
+_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            os.pardir, 'i.hyper.indices.py')
+_spec = importlib.util.spec_from_file_location('i_hyper_indices', _MODULE_PATH)
+i_hyper_indices = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(i_hyper_indices)
+
+
+class TestFindAliases(unittest.TestCase):
+    """Indices are aliased only when their r.mapcalc formulas match."""
+
+    def setUp(self):
+        self.indices = i_hyper_indices.HyperspectralIndices()
+        self.wavelength_to_band = {560: 'green', 850: 'nir', 1650: 'swir'}
+
+    def find_aliases(self, selected):
+        band_maps = self.indices.resolve_bands(selected, self.wavelength_to_band)
+        return self.indices.find_aliases(selected, band_maps)
+
+    def test_float_cast_is_not_aliased(self):
+        """UI divides integers in r.mapcalc, NDBI does not."""
+        self.assertEqual(self.find_aliases(['UI', 'NDBI']), {})
+        self.assertEqual(self.find_aliases(['NDPI', 'NDBI']), {})
+        self.assertEqual(self.find_aliases(['HAZE', 'NDWI']), {})
+
+    def test_identical_formulas_are_aliased(self):
+        self.assertEqual(self.find_aliases(['UI', 'NDPI']), {'NDPI': 'UI'})
+        self.wavelength_to_band = {900: 'band1', 970: 'band2'}
+        self.assertEqual(self.find_aliases(['WI', 'SRWI']), {'SRWI': 'WI'})
+
+if __name__ == '__main__':
+    unittest.main()